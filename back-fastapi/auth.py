@@ -1,27 +1,36 @@
 import os
+import secrets
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import models
 import schemas
 from database import get_db
-from dotenv import load_dotenv
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
-# Load environment variables
-load_dotenv()
+# Environment variables are loaded from .env by database.py
 
 # Security configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Shared key for admin endpoints (X-Admin-Key header); unset disables them
+ADMIN_API_KEY = os.getenv("ADMIN_API_KEY", "")
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """
+    Password hashing context, built on first use
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
@@ -31,14 +40,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """
     Hash a password
     """
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def authenticate_company(
@@ -61,6 +70,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     Create a JWT access token
     """
+    from jose import jwt
+
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -76,6 +87,8 @@ def decode_access_token(token: str) -> Optional[schemas.TokenData]:
     """
     Decode and verify a JWT access token
     """
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
@@ -139,6 +152,22 @@ async def get_current_active_company(
     return current_company
 
 
+def require_admin(x_admin_key: Optional[str] = Header(None)):
+    """
+    Allow the request only with a valid X-Admin-Key header
+    """
+    if not ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Admin API is disabled"
+        )
+    if not x_admin_key or not secrets.compare_digest(
+        x_admin_key.encode(), ADMIN_API_KEY.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin key"
+        )
+
+
 def verify_employee_token(db: Session, token: str) -> Optional[models.EmployeeToken]:
     """
     Verify an employee token for review verification
@@ -0,0 +1,42 @@
+"""
+Rating rollup backfill script for Korus Worker Platform
+Rebuilds the company_rating_daily / company_rating_monthly tables from reviews
+
+Usage:
+    python backfill_rating_rollups.py                 # all companies
+    python backfill_rating_rollups.py --company-id 3  # one company
+"""
+
+import argparse
+import sys
+
+import crud
+from database import SessionLocal
+
+
+def main():
+    """Main backfill function"""
+    parser = argparse.ArgumentParser(description="Rebuild rating rollup tables")
+    parser.add_argument(
+        "--company-id", type=int, default=None, help="Only rebuild this company"
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📈 Korus Collective Voice- Rating Rollup Backfill")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        daily_rows = crud.rebuild_rating_rollups(db, company_id=args.company_id)
+        print(f"✅ Rebuilt {daily_rows} daily rollup rows")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Backfill failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Chatbot-facing helpers for Korus Worker Platform
+Compact, pre-rendered payloads for the Telegram/n8n workflow
+
+Every bot answer is built from in-memory data: nearby support organizations
+come from the per-worker directory snapshot (support_directory.py),
+contract scans from the clause matcher (contract_scanner.py) and company
+summaries are read from the denormalized rating columns of one company
+row, then cached for BOT_CACHE_TTL seconds. Each payload carries a
+`text` field the bot can send as-is (or hand to its language model).
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+import models
+import schemas
+from cache import TTLCache
+from sqlalchemy.orm import Session
+from support_directory import normalize
+
+BOT_CACHE_TTL = float(os.getenv("BOT_CACHE_TTL", "60"))
+BOT_MAX_RESULTS = int(os.getenv("BOT_MAX_RESULTS", "5"))
+
+# normalized name -> BotCompanySummary, or _NOT_FOUND
+company_summary_cache = TTLCache(
+    ttl_seconds=BOT_CACHE_TTL, maxsize=10000, name="bot_company_summaries"
+)
+_NOT_FOUND = object()
+
+RATING_LABELS = (
+    ("rating_work_conditions", "Work conditions"),
+    ("rating_pay", "Pay"),
+    ("rating_treatment", "Treatment"),
+    ("rating_safety", "Safety"),
+)
+
+
+def stars(rating: float) -> str:
+    """5-star bar for a 0-5 rating ("★★★☆☆")"""
+    full = int(round(rating or 0))
+    return "★" * full + "☆" * (5 - full)
+
+
+# ==================== SUPPORT ORGANIZATIONS ====================
+
+
+def render_support_org(
+    org: schemas.SupportOrgResponse, distance_km: float
+) -> schemas.BotSupportOrg:
+    """Compact organization entry with a few lines of text"""
+    lines = [f"{org.name} ({org.type}) - {distance_km:.1f} km", org.address]
+    lines.append(f"Contact: {org.contact}")
+    lines.append(f"Hours: {org.open_hours}")
+    if org.website:
+        lines.append(org.website)
+    return schemas.BotSupportOrg(
+        id=org.id,
+        name=org.name,
+        type=org.type,
+        distance_km=round(distance_km, 1),
+        address=org.address,
+        contact=org.contact,
+        open_hours=org.open_hours,
+        website=org.website,
+        text="\n".join(lines),
+    )
+
+
+def render_nearby(
+    origin: str, results: List[Tuple[schemas.SupportOrgResponse, float]]
+) -> schemas.BotNearbyResponse:
+    """Nearest organizations as entries plus one message"""
+    entries = [render_support_org(org, km) for org, km in results]
+    if entries:
+        text = f"Support organizations near {origin}:\n\n" + "\n\n".join(
+            f"{position}. {entry.text}" for position, entry in enumerate(entries, 1)
+        )
+    else:
+        text = f"No support organization found near {origin}."
+    return schemas.BotNearbyResponse(origin=origin, results=entries, text=text)
+
+
+# ==================== CONTRACTS ====================
+
+
+def render_contract_scan(
+    result: schemas.ContractScanResult, cached: bool
+) -> schemas.BotContractScan:
+    """Clause scan with one message listing the problems found"""
+    if not result.text_found:
+        lines = [
+            "I couldn't read any text in this contract. "
+            "It may be a scanned image; please send a text PDF."
+        ]
+    elif result.findings:
+        lines = ["This contract contains clauses that may not respect your rights:"]
+        for finding in result.findings:
+            pages = ", ".join(str(page) for page in finding.pages)
+            lines.append(f"\n• {finding.description} (page {pages})")
+            lines.append(f'  "{finding.excerpt}"')
+        lines.append("\nPlease contact a support organization before signing anything.")
+    else:
+        lines = [
+            "No known problematic clause was found in this contract. "
+            "This check doesn't replace advice from a support organization."
+        ]
+    if result.scanned_pages < result.pages:
+        lines.append(
+            f"\nOnly the first {result.scanned_pages} of {result.pages} pages "
+            "were checked."
+        )
+    return schemas.BotContractScan(
+        **result.model_dump(), cached=cached, text="\n".join(lines)
+    )
+
+
+# ==================== COMPANIES ====================
+
+
+def find_company(db: Session, name: str) -> Optional[models.Company]:
+    """
+    Active company by exact name, else by name prefix (most reviewed first),
+    else the best fuzzy match ("netoyage pro")
+
+    The first two lookups are range scans on idx_company_name.
+    """
+    import company_search  # numpy-backed, imported on first use
+
+    query = db.query(models.Company).filter(models.Company.is_active == True)
+    company = query.filter(models.Company.company_name == name).first()
+    if company is None:
+        company = (
+            query.filter(models.Company.company_name.startswith(name, autoescape=True))
+            .order_by(models.Company.total_reviews.desc(), models.Company.id.asc())
+            .first()
+        )
+    if company is None:
+        matches = company_search.search_companies(db, name, limit=1)
+        if matches:
+            company = matches[0][0]
+    return company
+
+
+def render_company_summary(company: models.Company) -> schemas.BotCompanySummary:
+    """Rating summary from the company's stored aggregates (no joins)"""
+    overall = company.overall_rating or 0.0
+    reviews = company.total_reviews or 0
+    lines = [f"{company.company_name} ({company.industry}, {company.location})"]
+    if reviews:
+        lines.append(
+            f"Overall: {stars(overall)} {overall:.1f}/5 from {reviews} "
+            + ("review" if reviews == 1 else "reviews")
+        )
+        for column, label in RATING_LABELS:
+            value = getattr(company, column) or 0.0
+            lines.append(f"{label}: {value:.1f}/5")
+        lines.append(f"Trust score: {company.trust_score or 0:.1f}/5")
+    else:
+        lines.append("No reviews yet.")
+    if company.verified:
+        lines.append("Verified company")
+
+    return schemas.BotCompanySummary(
+        id=company.id,
+        name=company.company_name,
+        industry=company.industry,
+        location=company.location,
+        overall_rating=round(overall, 2),
+        total_reviews=reviews,
+        trust_score=round(company.trust_score or 0.0, 2),
+        ratings={
+            column.replace("rating_", ""): round(getattr(company, column) or 0.0, 2)
+            for column, _ in RATING_LABELS
+        },
+        verified=bool(company.verified),
+        text="\n".join(lines),
+    )
+
+
+def invalidate_company_summary(name: str):
+    """Drop the cached summary looked up by this exact name"""
+    company_summary_cache.invalidate(normalize(name).strip())
+
+
+def get_company_summary(db: Session, name: str) -> Optional[schemas.BotCompanySummary]:
+    """Cached summary of the company best matching name, or None"""
+    key = normalize(name).strip()
+    cached = company_summary_cache.get(key)
+    if cached is not None:
+        return None if cached is _NOT_FOUND else cached
+
+    company = find_company(db, name.strip())
+    summary = render_company_summary(company) if company is not None else None
+    company_summary_cache.set(key, summary if summary is not None else _NOT_FOUND)
+    return summary
@@ -0,0 +1,346 @@
+"""
+Caching helpers for Korus Worker Platform
+In-process LRU caches with TTLs, plus an optional tier shared by workers
+
+TTLCache is a bounded per-worker cache. TieredCache puts it in front of a
+Redis-compatible store (CACHE_REDIS_URL) so the uvicorn workers share
+entries, and tags entries (e.g. "company:42") so write functions can drop
+everything derived from a row with invalidate_tags(). Named caches report
+hit/miss counters through stats().
+"""
+
+import logging
+import math
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Shared tier: a redis:// URL, or memory:// for the in-process stand-in
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+# With a shared tier, local copies are only trusted this long
+CACHE_LOCAL_TTL = float(os.getenv("CACHE_LOCAL_TTL", "5"))
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "korus:cache:")
+
+# Named caches, for stats()
+_registry: Dict[str, Any] = {}
+
+
+def stats() -> Dict[str, dict]:
+    """Counters of every named cache, by name"""
+    return {name: cache.stats() for name, cache in list(_registry.items())}
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after ttl_seconds
+
+    Reads refresh an entry's recency; when maxsize is reached the least
+    recently used entry is dropped, in O(1).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        maxsize: int = 10000,
+        name: Optional[str] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(("hits", "misses", "evictions"), 0)
+        if name:
+            _registry[name] = self
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value, or default when missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._counts["misses"] += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self._counts["misses"] += 1
+                return default
+            self._data.move_to_end(key)
+            self._counts["hits"] += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value for ttl_seconds"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def invalidate(self, key: Hashable):
+        """Drop one entry"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters and current size"""
+        with self._lock:
+            return {**self._counts, "size": len(self._data)}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+# ==================== SHARED STORE ====================
+
+
+class MemoryStore:
+    """
+    Local stand-in for the subset of the Redis API used by the shared tiers
+
+    Lets shared caches and rate limits run in development and tests without
+    a Redis server (CACHE_REDIS_URL=memory://); state is still per process.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str) -> Optional[Tuple[Any, float]]:
+        entry = self._data.get(key)
+        if entry is not None and entry[1] <= time.time():
+            del self._data[key]
+            return None
+        return entry
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._live(key)
+            return None if entry is None else entry[0]
+
+    def mget(self, keys: Iterable[str]) -> list:
+        with self._lock:
+            return [(self._live(key) or (None,))[0] for key in keys]
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            self._data[key] = (value, time.time() + ex if ex else math.inf)
+            return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value, expires_at = self._live(key) or (0, math.inf)
+            self._data[key] = (int(value) + 1, expires_at)
+            return int(value) + 1
+
+    def expire(self, key: str, seconds: int) -> bool:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                return False
+            self._data[key] = (entry[0], time.time() + seconds)
+            return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+
+def create_shared_store(
+    url: Optional[str] = CACHE_REDIS_URL, setting: str = "CACHE_REDIS_URL"
+):
+    """Store behind url (a redis:// or memory:// URL), or None without one"""
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        return MemoryStore()
+    try:
+        import redis
+
+        return redis.Redis.from_url(url)
+    except ImportError:
+        logger.warning(
+            "%s is set but the redis package is not installed; "
+            "falling back to in-process state",
+            setting,
+        )
+        return None
+
+
+def store_errors() -> tuple:
+    """Exceptions a shared store raises when it is unreachable"""
+    try:
+        import redis
+
+        return (redis.RedisError, OSError)
+    except ImportError:
+        return (OSError,)
+
+
+shared_store = create_shared_store()
+
+
+# ==================== TAGS ====================
+
+# Local tag versions; shared versions live in the store under tag keys
+_tag_versions: Dict[str, int] = {}
+_tag_lock = threading.Lock()
+
+
+def _tag_key(tag: str) -> str:
+    return f"{CACHE_KEY_PREFIX}tag:{tag}"
+
+
+def local_tag_versions(tags: Tuple[str, ...]) -> Tuple[int, ...]:
+    """Current local version of each tag"""
+    with _tag_lock:
+        return tuple(_tag_versions.get(tag, 0) for tag in tags)
+
+
+def invalidate_local_tags(*tags: str):
+    """Make this worker's local copies of entries carrying tags stale"""
+    with _tag_lock:
+        for tag in tags:
+            _tag_versions[tag] = _tag_versions.get(tag, 0) + 1
+
+
+def invalidate_tags(*tags: str):
+    """
+    Make every cached entry carrying one of tags stale, in all TieredCaches
+
+    Bumps the tag versions locally and in the shared store; entries keep the
+    versions they were loaded under and are ignored once those change.
+    Other workers' local copies are reached through invalidation_bus.
+    """
+    invalidate_local_tags(*tags)
+    if shared_store is not None:
+        try:
+            for tag in tags:
+                shared_store.incr(_tag_key(tag))
+        except Exception:
+            logger.warning("Shared cache unavailable, tags %s not bumped", tags)
+
+
+# ==================== TIERED CACHE ====================
+
+
+class TieredCache:
+    """
+    Read-through cache: in-process LRU tier, then the shared store
+
+    get_or_load() returns the local copy when its tag versions are current,
+    else the shared copy when its shared tag versions are current (one MGET
+    for the entry and its tags), else calls loader and stores the result in
+    both tiers. Tag versions are read before loading, so a write that lands
+    while loading leaves the stored entry already stale.
+
+    Values go to the shared store pickled; cache plain data (dicts, schemas),
+    never ORM objects. When the store fails, reads fall through to loader.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float = 60.0, maxsize: int = 10000):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.store = shared_store
+        local_ttl = ttl_seconds
+        if self.store is not None:
+            local_ttl = min(ttl_seconds, CACHE_LOCAL_TTL)
+        self._local = TTLCache(ttl_seconds=local_ttl, maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(
+            ("local_hits", "shared_hits", "misses", "shared_errors"), 0
+        )
+        self._error_logged_at = 0.0
+        _registry[name] = self
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counts[name] += 1
+
+    def _shared_error(self, action: str):
+        self._count("shared_errors")
+        now = time.monotonic()
+        if now - self._error_logged_at > 60:
+            self._error_logged_at = now
+            logger.warning("Shared cache %s failed for %s", action, self.name)
+
+    def _key(self, key: Hashable) -> str:
+        return f"{CACHE_KEY_PREFIX}{self.name}:{key}"
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], Any], tags: Iterable[str] = ()
+    ) -> Any:
+        """Cached value for key, loading (and caching) it on a miss"""
+        tags = tuple(tags)
+        local_versions = local_tag_versions(tags)
+        entry = self._local.get(key)
+        if entry is not None and entry[0] == local_versions:
+            self._count("local_hits")
+            return entry[1]
+
+        shared_versions = None
+        if self.store is not None:
+            try:
+                raw, *versions = self.store.mget(
+                    [self._key(key), *(_tag_key(tag) for tag in tags)]
+                )
+                shared_versions = tuple(int(version or 0) for version in versions)
+                if raw is not None:
+                    stored_versions, value = pickle.loads(raw)
+                    if stored_versions == shared_versions:
+                        self._count("shared_hits")
+                        self._local.set(key, (local_versions, value))
+                        return value
+            except Exception:
+                self._shared_error("read")
+                shared_versions = None
+
+        self._count("misses")
+        value = loader()
+        self._local.set(key, (local_versions, value))
+        if shared_versions is not None:
+            try:
+                self.store.set(
+                    self._key(key),
+                    pickle.dumps((shared_versions, value)),
+                    ex=max(1, math.ceil(self.ttl_seconds)),
+                )
+            except Exception:
+                self._shared_error("write")
+        return value
+
+    def invalidate(self, key: Hashable):
+        """Drop one entry from both tiers"""
+        self._local.invalidate(key)
+        if self.store is not None:
+            try:
+                self.store.delete(self._key(key))
+            except Exception:
+                self._shared_error("delete")
+
+    def clear(self):
+        """Drop this worker's local copies (shared entries expire or go stale)"""
+        self._local.clear()
+
+    def stats(self) -> dict:
+        """Per-tier hit counters, misses, shared store errors and local size"""
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts["local_hits"] + counts["shared_hits"] + counts["misses"]
+        return {
+            **counts,
+            "hit_ratio": round(1 - counts["misses"] / lookups, 4) if lookups else 0.0,
+            "local_size": len(self._local),
+            "shared": self.store is not None,
+        }
@@ -0,0 +1,116 @@
+"""
+Review classification worker for Korus Worker Platform
+Scores unclassified review comments for sentiment and abuse in batches
+
+Runs as a background thread inside each API worker, or once from the
+command line to drain the backlog: python classification_worker.py
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+import crud
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Worker configuration
+REVIEW_CLASSIFY_INTERVAL_SECONDS = int(
+    os.getenv("REVIEW_CLASSIFY_INTERVAL_SECONDS", "30")
+)
+REVIEW_CLASSIFY_BATCH_SIZE = int(os.getenv("REVIEW_CLASSIFY_BATCH_SIZE", "500"))
+REVIEW_CLASSIFY_ENABLED = os.getenv("REVIEW_CLASSIFY_ENABLED", "true").lower() == "true"
+
+
+def classify_pending_reviews(batch_size: int = REVIEW_CLASSIFY_BATCH_SIZE) -> int:
+    """
+    Classify one batch of unscored reviews and return how many were scored
+    """
+    import classifier  # numpy-backed, imported on first use
+
+    db = SessionLocal()
+    try:
+        pending = crud.get_unclassified_reviews(db, limit=batch_size)
+        if not pending:
+            return 0
+
+        predictions = classifier.get_model().predict(
+            [comment for _, comment in pending]
+        )
+        crud.save_review_classifications(
+            db,
+            [
+                {"id": review_id, **prediction._asdict()}
+                for (review_id, _), prediction in zip(pending, predictions)
+            ],
+        )
+        return len(pending)
+    finally:
+        db.close()
+
+
+class ReviewClassificationWorker:
+    """
+    Background thread that drains unscored reviews every interval
+
+    Overlapping workers may score the same batch twice; the result is
+    identical, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        interval: int = REVIEW_CLASSIFY_INTERVAL_SECONDS,
+        batch_size: int = REVIEW_CLASSIFY_BATCH_SIZE,
+    ):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the worker thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="review-classifier", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Signal the worker thread to stop and wait for it"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                # Keep going while full batches come back, then sleep
+                while not self._stop_event.is_set():
+                    scored = classify_pending_reviews(self.batch_size)
+                    if scored:
+                        logger.info("Classified %d reviews", scored)
+                    if scored < self.batch_size:
+                        break
+            except Exception:
+                logger.exception("Review classification failed")
+            self._stop_event.wait(self.interval)
+
+
+def main():
+    """Classify every pending review"""
+    total = 0
+    while True:
+        scored = classify_pending_reviews()
+        total += scored
+        if scored < REVIEW_CLASSIFY_BATCH_SIZE:
+            break
+    print(f"✅ Classified {total} reviews")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Review comment classifier for Korus Worker Platform
+CPU-only linear model over hashed word/character n-grams
+
+Two logistic heads share one hashed feature space:
+- sentiment: probability that the comment is positive
+- abuse: probability that the comment is abusive (insults, threats, spam)
+
+Scoring is vectorized over a batch of comments with NumPy; nothing leaves
+the process. Train with train_review_classifier.py; when no trained model
+file exists, the model is fitted on the bundled seed labels at load time.
+"""
+
+import csv
+import os
+import re
+import zlib
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SEED_LABELS_PATH = os.path.join(DATA_DIR, "review_seed_labels.csv")
+MODEL_PATH = os.getenv(
+    "REVIEW_CLASSIFIER_MODEL", os.path.join(DATA_DIR, "review_classifier.npz")
+)
+
+# Hashed feature space size (power of two)
+FEATURE_BITS = 18
+FEATURE_DIM = 1 << FEATURE_BITS
+
+# Head indices into the weight matrix
+SENTIMENT = 0
+ABUSE = 1
+
+# Decision thresholds
+POSITIVE_THRESHOLD = 0.6
+NEGATIVE_THRESHOLD = 0.4
+ABUSE_THRESHOLD = float(os.getenv("REVIEW_ABUSE_THRESHOLD", "0.5"))
+
+SENTIMENT_LABELS = ("positive", "neutral", "negative")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+
+
+class Prediction(NamedTuple):
+    """Classifier output for one comment"""
+
+    sentiment_score: float  # -1 (negative) .. 1 (positive)
+    sentiment_label: str
+    abuse_score: float  # 0 .. 1
+    is_abusive: bool
+
+
+# ==================== FEATURES ====================
+
+
+def _features(text: str) -> List[str]:
+    """Word unigrams/bigrams and in-word character trigrams"""
+    text = _URL_RE.sub(" __url__ ", text.lower())
+    tokens = _TOKEN_RE.findall(text)
+
+    features = [f"w:{token}" for token in tokens]
+    features.extend(f"b:{a}_{b}" for a, b in zip(tokens, tokens[1:]))
+    for token in tokens:
+        padded = f"<{token}>"
+        features.extend(f"c:{padded[i:i + 3]}" for i in range(max(1, len(padded) - 2)))
+    return features
+
+
+def vectorize(texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Hash a batch of texts into a sparse matrix in COO form
+
+    Returns (doc_ids, feature_ids, values); each row is L2-normalised.
+    """
+    doc_ids, feature_ids = [], []
+    for doc_id, text in enumerate(texts):
+        hashed = [
+            zlib.crc32(feature.encode("utf-8")) & (FEATURE_DIM - 1)
+            for feature in _features(text or "")
+        ]
+        feature_ids.extend(hashed)
+        doc_ids.extend([doc_id] * len(hashed))
+
+    doc_ids = np.asarray(doc_ids, dtype=np.int64)
+    feature_ids = np.asarray(feature_ids, dtype=np.int64)
+    values = np.ones(len(feature_ids), dtype=np.float32)
+
+    norms = np.sqrt(np.bincount(doc_ids, minlength=len(texts))).astype(np.float32)
+    norms[norms == 0] = 1.0
+    values /= norms[doc_ids]
+    return doc_ids, feature_ids, values
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-np.clip(x, -30, 30)))
+
+
+# ==================== MODEL ====================
+
+
+class ReviewClassifier:
+    """Two-head hashed linear model"""
+
+    def __init__(self, weights: Optional[np.ndarray] = None, bias=None):
+        self.weights = (
+            weights
+            if weights is not None
+            else np.zeros((FEATURE_DIM, 2), dtype=np.float32)
+        )
+        self.bias = (
+            np.asarray(bias, dtype=np.float32)
+            if bias is not None
+            else np.zeros(2, dtype=np.float32)
+        )
+
+    def _logits(self, doc_ids, feature_ids, values, n_docs: int) -> np.ndarray:
+        contributions = self.weights[feature_ids] * values[:, None]
+        logits = np.empty((n_docs, 2), dtype=np.float32)
+        for head in (SENTIMENT, ABUSE):
+            logits[:, head] = np.bincount(
+                doc_ids, weights=contributions[:, head], minlength=n_docs
+            )
+        return logits + self.bias
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """(n, 2) array of [p_positive, p_abusive] for a batch of texts"""
+        if not texts:
+            return np.zeros((0, 2), dtype=np.float32)
+        return _sigmoid(self._logits(*vectorize(texts), len(texts)))
+
+    def predict(self, texts: Sequence[str]) -> List[Prediction]:
+        """Classify a batch of comments"""
+        predictions = []
+        for p_positive, p_abusive in self.predict_proba(texts):
+            if p_positive >= POSITIVE_THRESHOLD:
+                label = "positive"
+            elif p_positive <= NEGATIVE_THRESHOLD:
+                label = "negative"
+            else:
+                label = "neutral"
+            predictions.append(
+                Prediction(
+                    sentiment_score=round(float(2 * p_positive - 1), 4),
+                    sentiment_label=label,
+                    abuse_score=round(float(p_abusive), 4),
+                    is_abusive=bool(p_abusive >= ABUSE_THRESHOLD),
+                )
+            )
+        return predictions
+
+    def fit(
+        self,
+        texts: Sequence[str],
+        sentiment: Sequence[Optional[int]],
+        abuse: Sequence[Optional[int]],
+        epochs: int = 200,
+        learning_rate: float = 10.0,
+        l2: float = 1e-5,
+    ) -> "ReviewClassifier":
+        """
+        Full-batch gradient descent on both logistic heads
+
+        Labels are 1/0, or None when a text has no label for that head
+        (e.g. star-rating sentiment labels carry no abuse label).
+        """
+        n_docs = len(texts)
+        doc_ids, feature_ids, values = vectorize(texts)
+
+        targets = np.zeros((n_docs, 2), dtype=np.float32)
+        mask = np.zeros((n_docs, 2), dtype=np.float32)
+        for head, labels in ((SENTIMENT, sentiment), (ABUSE, abuse)):
+            for i, label in enumerate(labels):
+                if label is not None:
+                    targets[i, head] = label
+                    mask[i, head] = 1.0
+        counts = np.maximum(mask.sum(axis=0), 1.0)
+
+        for _ in range(epochs):
+            probs = _sigmoid(self._logits(doc_ids, feature_ids, values, n_docs))
+            residual = (probs - targets) * mask / counts
+            gradient = np.zeros_like(self.weights)
+            np.add.at(gradient, feature_ids, residual[doc_ids] * values[:, None])
+            gradient += l2 * self.weights
+            self.weights -= learning_rate * gradient
+            self.bias -= learning_rate * residual.sum(axis=0)
+        return self
+
+    def save(self, path: str = MODEL_PATH):
+        """Write weights to a compressed .npz file"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez_compressed(
+            path, weights=self.weights, bias=self.bias, feature_bits=FEATURE_BITS
+        )
+
+    @classmethod
+    def load(cls, path: str = MODEL_PATH) -> "ReviewClassifier":
+        """Read weights written by save()"""
+        with np.load(path) as data:
+            if int(data["feature_bits"]) != FEATURE_BITS:
+                raise ValueError("Model was trained with a different feature size")
+            return cls(weights=data["weights"], bias=data["bias"])
+
+
+# ==================== TRAINING DATA ====================
+
+
+def load_seed_labels(
+    path: str = SEED_LABELS_PATH,
+) -> Tuple[List[str], List[Optional[int]], List[Optional[int]]]:
+    """
+    Read the bundled hand-labelled comments
+
+    CSV columns: text, sentiment (positive/negative/blank), abusive (1/0/blank)
+    """
+    texts, sentiment, abuse = [], [], []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            texts.append(row["text"])
+            sentiment.append(
+                {"positive": 1, "negative": 0}.get(row["sentiment"].strip())
+            )
+            abuse.append(int(row["abusive"]) if row["abusive"].strip() else None)
+    return texts, sentiment, abuse
+
+
+def rating_sentiment_label(average_rating: float) -> Optional[int]:
+    """Weak sentiment label from a review's average star rating"""
+    if average_rating >= 4.0:
+        return 1
+    if average_rating <= 2.0:
+        return 0
+    return None
+
+
+def train(
+    extra: Iterable[Tuple[str, Optional[int], Optional[int]]] = (),
+) -> ReviewClassifier:
+    """Fit a model on the seed labels plus any extra (text, sentiment, abuse)"""
+    texts, sentiment, abuse = load_seed_labels()
+    for text, sentiment_label, abuse_label in extra:
+        texts.append(text)
+        sentiment.append(sentiment_label)
+        abuse.append(abuse_label)
+    return ReviewClassifier().fit(texts, sentiment, abuse)
+
+
+_model: Optional[ReviewClassifier] = None
+
+
+def get_model() -> ReviewClassifier:
+    """Load the trained model once per process, or fit on the seed labels"""
+    global _model
+    if _model is None:
+        if os.path.exists(MODEL_PATH):
+            _model = ReviewClassifier.load(MODEL_PATH)
+        else:
+            _model = train()
+    return _model
@@ -0,0 +1,297 @@
+"""
+Fuzzy company lookup for Korus Worker Platform
+In-memory character-trigram index over company_name and location
+
+Resolves what a worker types ("btp services paris", "netoyage lyon") to
+ranked companies, tolerating typos and missing accents. Every word is
+padded like PostgreSQL's pg_trgm ("  lyon ") and split into trigrams;
+companies are ranked by how much of the query their name and location
+cover and by how close the name is to the query.
+
+Each API worker holds one index, built at startup and kept current by
+crud on writes in this process and, every COMPANY_SEARCH_SYNC_SECONDS, by
+a catch-up query for companies created or updated by other processes.
+"""
+
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import models
+import numpy as np
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from support_directory import normalize
+
+COMPANY_SEARCH_SYNC_SECONDS = float(os.getenv("COMPANY_SEARCH_SYNC_SECONDS", "5"))
+COMPANY_SEARCH_MIN_SCORE = float(os.getenv("COMPANY_SEARCH_MIN_SCORE", "0.3"))
+
+# Ranking: share of the query trigrams found in name + location, and
+# Jaccard similarity of the query and name trigrams
+COVERAGE_WEIGHT = 0.6
+NAME_WEIGHT = 0.4
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _normalized_trigrams(normalized: str) -> FrozenSet[str]:
+    grams = set()
+    for word in _WORD_RE.findall(normalized):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Padded word trigrams of a normalised value ("lyon" -> "  l", " ly", ...)"""
+    return _normalized_trigrams(normalize(text))
+
+
+def _count(parts: List[np.ndarray], size: int) -> np.ndarray:
+    """Occurrences of each company id across posting arrays"""
+    if not parts:
+        return np.zeros(size, dtype=np.int64)
+    return np.bincount(np.concatenate(parts), minlength=size)
+
+
+class CompanySearchIndex:
+    """
+    Trigram posting lists over company names and locations
+
+    Name postings list company ids. Locations repeat a lot ("Paris,
+    France"), so they are interned: location postings list location ids and
+    each company points at one. A query scores every company at once with
+    numpy: bincounts over the query trigrams' posting arrays give the name,
+    location and name-and-location hits of each company.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        """Empty every index structure (caller holds the lock, or owns self)"""
+        self._names: Dict[int, str] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._arrays: Dict[str, np.ndarray] = {}
+        # Location id 0 means "no location"
+        self._location_ids: Dict[str, int] = {"": 0}
+        self._location_grams: List[FrozenSet[str]] = [frozenset()]
+        self._location_postings: Dict[str, List[int]] = {}
+        # Dense per-company arrays indexed by company id
+        self._name_sizes = np.zeros(1024, dtype=np.int32)
+        self._company_locations = np.zeros(1024, dtype=np.int32)
+        self._max_company_id = 0
+        self._synced_at: Optional[datetime] = None
+        self._checked_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _location_id(self, location: str) -> int:
+        location_id = self._location_ids.get(location)
+        if location_id is None:
+            location_id = self._location_ids[location] = len(self._location_grams)
+            grams = trigrams(location)
+            self._location_grams.append(grams)
+            for gram in grams:
+                self._location_postings.setdefault(gram, []).append(location_id)
+        return location_id
+
+    def _ensure_capacity(self, company_id: int):
+        size = len(self._name_sizes)
+        if company_id < size:
+            return
+        size = max(company_id + 1, size * 2)
+        for name in ("_name_sizes", "_company_locations"):
+            grown = np.zeros(size, dtype=np.int32)
+            current = getattr(self, name)
+            grown[: len(current)] = current
+            setattr(self, name, grown)
+
+    def _array(self, gram: str) -> np.ndarray:
+        array = self._arrays.get(gram)
+        if array is None:
+            array = self._arrays[gram] = np.array(self._postings[gram], dtype=np.int64)
+        return array
+
+    def add(self, company_id: int, name: str, location: str):
+        """Index one company, replacing its previous entry"""
+        normalized = normalize(name)
+        name_grams = _normalized_trigrams(normalized)
+        with self._lock:
+            self.remove(company_id)
+            self._ensure_capacity(company_id)
+            self._names[company_id] = normalized
+            for gram in name_grams:
+                self._postings.setdefault(gram, []).append(company_id)
+                self._arrays.pop(gram, None)
+            self._name_sizes[company_id] = len(name_grams)
+            self._company_locations[company_id] = self._location_id(location or "")
+            self._max_company_id = max(self._max_company_id, company_id)
+
+    def remove(self, company_id: int):
+        """Drop one company from the index"""
+        with self._lock:
+            normalized = self._names.pop(company_id, None)
+            if normalized is None:
+                return
+            for gram in _normalized_trigrams(normalized):
+                postings = self._postings[gram]
+                postings.remove(company_id)
+                self._arrays.pop(gram, None)
+                if not postings:
+                    del self._postings[gram]
+            self._name_sizes[company_id] = 0
+            self._company_locations[company_id] = 0
+
+    def query(self, text: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """
+        Best matching companies as (company_id, score), best first
+
+        Scores are in 0..1; matches below COMPANY_SEARCH_MIN_SCORE are dropped.
+        """
+        query_grams = trigrams(text)
+        if not query_grams:
+            return []
+        total = len(query_grams)
+
+        with self._lock:
+            size = len(self._name_sizes)
+            location_count = len(self._location_grams)
+            name_parts, location_ids, overlap_parts = [], [], []
+            for gram in query_grams:
+                names = self._array(gram) if gram in self._postings else None
+                locations = self._location_postings.get(gram)
+                if names is not None:
+                    name_parts.append(names)
+                if locations:
+                    location_ids.extend(locations)
+                    if names is not None:
+                        # Companies whose name and location both contain gram
+                        has_gram = np.zeros(location_count, dtype=bool)
+                        has_gram[locations] = True
+                        overlap_parts.append(
+                            names[has_gram[self._company_locations[names]]]
+                        )
+
+            name_hits = _count(name_parts, size)
+            location_hits = np.bincount(location_ids, minlength=location_count)[
+                self._company_locations
+            ]
+            covered = name_hits + location_hits - _count(overlap_parts, size)
+            candidates = np.flatnonzero(covered)
+            name_hits = name_hits[candidates]
+            scores = COVERAGE_WEIGHT * covered[candidates] / total + NAME_WEIGHT * (
+                name_hits / (total + self._name_sizes[candidates] - name_hits)
+            )
+
+            keep = scores >= COMPANY_SEARCH_MIN_SCORE
+            candidates, scores = candidates[keep], scores[keep]
+            if len(candidates) > limit:
+                best = np.argpartition(-scores, limit - 1)[:limit]
+                candidates, scores = candidates[best], scores[best]
+            matches = [
+                (company_id, round(score, 4))
+                for company_id, score in zip(candidates.tolist(), scores.tolist())
+            ]
+
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
+
+    def catch_up(self, db: Session, batch_size: int = 1000) -> int:
+        """
+        Index companies created or updated since the last sync
+
+        New ids come from a primary-key range, updates from idx_updated_at;
+        inactive companies are removed. Returns the number of rows read.
+        """
+        with self._lock:
+            last_id, synced_at = self._max_company_id, self._synced_at
+        started_at = datetime.utcnow()
+
+        changed = models.Company.id > last_id
+        if synced_at is not None:
+            changed = or_(changed, models.Company.updated_at >= synced_at)
+
+        read = 0
+        after_id = 0
+        while True:
+            rows = (
+                db.query(
+                    models.Company.id,
+                    models.Company.company_name,
+                    models.Company.location,
+                    models.Company.is_active,
+                )
+                .filter(changed, models.Company.id > after_id)
+                .order_by(models.Company.id.asc())
+                .limit(batch_size)
+                .all()
+            )
+            for company_id, name, location, is_active in rows:
+                if is_active:
+                    self.add(company_id, name, location)
+                else:
+                    self.remove(company_id)
+            read += len(rows)
+            if len(rows) < batch_size:
+                break
+            after_id = rows[-1][0]
+
+        with self._lock:
+            self._synced_at = started_at
+            self._checked_at = time.monotonic()
+        return read
+
+    def sync(self, db: Session) -> int:
+        """catch_up at most every COMPANY_SEARCH_SYNC_SECONDS"""
+        if time.monotonic() - self._checked_at < COMPANY_SEARCH_SYNC_SECONDS:
+            return 0
+        return self.catch_up(db)
+
+    def rebuild(self, db: Session) -> int:
+        """
+        Drop everything and index all active companies
+
+        Searches wait for the rebuild rather than see a partial index.
+        """
+        with self._lock:
+            self._reset()
+            return self.catch_up(db)
+
+
+# Per-process index used by the API
+company_index = CompanySearchIndex()
+
+
+def search_companies(
+    db: Session, text: str, limit: int = 10
+) -> List[Tuple[models.Company, float]]:
+    """
+    Ranked (company, score) matches for free text
+
+    The index is caught up first (at most every COMPANY_SEARCH_SYNC_SECONDS);
+    matches are then loaded with one primary-key IN query, which also drops
+    companies deleted or deactivated elsewhere since the last sync.
+    """
+    company_index.sync(db)
+    matches = company_index.query(text, limit=limit)
+    if not matches:
+        return []
+
+    companies = {
+        company.id: company
+        for company in db.query(models.Company).filter(
+            models.Company.id.in_([company_id for company_id, _ in matches]),
+            models.Company.is_active == True,
+        )
+    }
+    return [
+        (companies[company_id], score)
+        for company_id, score in matches
+        if company_id in companies
+    ]
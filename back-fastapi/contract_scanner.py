@@ -0,0 +1,386 @@
+"""
+Contract clause scanner for Korus Worker Platform
+Flags risky clauses in employment contracts without calling a language model
+
+PDF text is extracted page by page (pypdf, imported on first use) and fed
+to an Aho-Corasick automaton built once from a multilingual phrase
+dictionary (data/contract_clauses.csv, or CONTRACT_CLAUSES_PATH). Text and
+phrases are compared as accent- and case-insensitive words, so one pass
+over each page finds every phrase in every language, and the automaton
+state carries across page breaks. Only the current page's text is held in
+memory.
+
+Results are cached by the SHA-256 of the document (and the dictionary), so
+a contract forwarded again is answered without being parsed.
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import re
+import sys
+from collections import deque
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+import schemas
+from cache import TTLCache
+from support_directory import normalize
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+CONTRACT_CLAUSES_PATH = os.getenv(
+    "CONTRACT_CLAUSES_PATH", os.path.join(DATA_DIR, "contract_clauses.csv")
+)
+CONTRACT_SCAN_MAX_BYTES = int(os.getenv("CONTRACT_SCAN_MAX_BYTES", str(10 * 2**20)))
+CONTRACT_SCAN_MAX_PAGES = int(os.getenv("CONTRACT_SCAN_MAX_PAGES", "50"))
+CONTRACT_SCAN_CACHE_TTL = float(os.getenv("CONTRACT_SCAN_CACHE_TTL", "86400"))
+
+# Characters of original text kept on each side of a match
+EXCERPT_CONTEXT = 60
+_CHUNK_SIZE = 64 * 1024
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# rule -> (severity, description)
+CLAUSE_RULES: Dict[str, Tuple[str, str]] = {
+    "recruitment_fee": (
+        "high",
+        "You are asked to pay recruitment or placement fees, which is illegal",
+    ),
+    "document_retention": (
+        "high",
+        "The employer keeps your passport or identity papers, which is illegal",
+    ),
+    "confinement": ("high", "You are not allowed to leave your workplace or housing"),
+    "undeclared_work": (
+        "high",
+        "Work is paid in cash or without a payslip (undeclared work)",
+    ),
+    "unpaid_work": ("high", "Some work (trial period, overtime) is unpaid"),
+    "waiver_of_rights": (
+        "high",
+        "You give up legal rights such as the minimum wage or any claim",
+    ),
+    "resignation_penalty": (
+        "medium",
+        "You must pay a penalty or repay costs if you leave the job",
+    ),
+    "financial_penalty": ("medium", "The employer can fine you"),
+    "wage_deduction": (
+        "medium",
+        "Housing, transport or other costs are deducted from your pay",
+    ),
+    "excessive_hours": ("medium", "No weekly rest day or no paid leave"),
+    "mandatory_housing": ("low", "You must live in housing chosen by the employer"),
+}
+SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+# sha256 + dictionary digest -> ContractScanResult
+scan_cache = TTLCache(
+    ttl_seconds=CONTRACT_SCAN_CACHE_TTL, maxsize=1000, name="contract_scans"
+)
+
+
+class ContractScanError(ValueError):
+    """The upload is not a PDF this scanner can read"""
+
+
+# Contracts reuse a small vocabulary; normalising each word once is most of
+# the cost of a page
+_normalize_word = lru_cache(maxsize=50000)(normalize)
+
+
+def words(text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """Normalised words of text and their (start, end) in the original"""
+    found, spans = [], []
+    for match in _WORD_RE.finditer(text):
+        found.append(_normalize_word(match.group()))
+        spans.append(match.span())
+    return found, spans
+
+
+class Phrase(NamedTuple):
+    """One dictionary entry"""
+
+    rule: str
+    language: str
+    text: str
+    word_count: int
+
+
+class ClauseMatcher:
+    """
+    Aho-Corasick automaton over dictionary phrases, with words as symbols
+
+    Transitions are keyed by normalised words rather than characters, so
+    every match is on word boundaries and a page costs one step per word.
+    """
+
+    def __init__(self, phrases: Iterable[Phrase]):
+        self.phrases: List[Phrase] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for phrase in phrases:
+            key = words(phrase.text)[0]
+            if key:
+                self._insert(key, len(self.phrases))
+                self.phrases.append(phrase._replace(word_count=len(key)))
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def _insert(self, key: List[str], phrase_id: int):
+        state = 0
+        for word in key:
+            next_state = self._goto[state].get(word)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][word] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(phrase_id)
+
+    def _link(self):
+        """Breadth-first failure links; outputs are merged along them"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def run(
+        self, state: int, text_words: List[str]
+    ) -> Tuple[int, List[Tuple[int, int]]]:
+        """
+        Run the automaton over words from state
+
+        Returns the final state (where the next page resumes) and the
+        matches as (index of the last matched word, phrase id).
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        matches = []
+        for position, word in enumerate(text_words):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            if output[state]:
+                matches.extend((position, phrase_id) for phrase_id in output[state])
+        return state, matches
+
+
+@lru_cache(maxsize=1)
+def get_matcher(path: str = CONTRACT_CLAUSES_PATH) -> ClauseMatcher:
+    """Automaton for the clause dictionary, built once per process"""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = [row for row in csv.DictReader(f) if row["rule"] in CLAUSE_RULES]
+    return ClauseMatcher(
+        Phrase(row["rule"], row["language"], row["phrase"].strip(), 0) for row in rows
+    )
+
+
+@lru_cache(maxsize=1)
+def dictionary_digest(path: str = CONTRACT_CLAUSES_PATH) -> str:
+    """Short hash of the dictionary, part of every cache key"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def excerpt(text: str, start: int, end: int) -> str:
+    """Original text around a match on one line, "…"-trimmed"""
+    left, right = max(0, start - EXCERPT_CONTEXT), min(len(text), end + EXCERPT_CONTEXT)
+    snippet = " ".join(text[left:right].split())
+    return ("…" if left else "") + snippet + ("…" if right < len(text) else "")
+
+
+class ClauseScan:
+    """
+    Streaming scan: feed pages in order, then read the findings
+
+    Holds the automaton state and one entry per matched rule, never the text
+    of earlier pages.
+    """
+
+    def __init__(self, matcher: ClauseMatcher):
+        self.matcher = matcher
+        self.pages = 0
+        self.words = 0
+        self._state = 0
+        self._findings: Dict[str, dict] = {}
+
+    def feed(self, text: str):
+        """Scan the next page"""
+        self.pages += 1
+        page_words, spans = words(text)
+        if not page_words:
+            return
+
+        self.words += len(page_words)
+        self._state, matches = self.matcher.run(self._state, page_words)
+        for last, phrase_id in matches:
+            phrase = self.matcher.phrases[phrase_id]
+            # A phrase started on the previous page is quoted from this one
+            first = max(0, last - phrase.word_count + 1)
+            finding = self._findings.get(phrase.rule)
+            if finding is None:
+                severity, description = CLAUSE_RULES[phrase.rule]
+                self._findings[phrase.rule] = {
+                    "rule": phrase.rule,
+                    "severity": severity,
+                    "description": description,
+                    "phrase": phrase.text,
+                    "language": phrase.language,
+                    "pages": [self.pages],
+                    "occurrences": 1,
+                    "excerpt": excerpt(text, spans[first][0], spans[last][1]),
+                }
+            else:
+                finding["occurrences"] += 1
+                if finding["pages"][-1] != self.pages:
+                    finding["pages"].append(self.pages)
+
+    def findings(self) -> List[schemas.ContractFinding]:
+        """Matched rules, most severe first"""
+        return [
+            schemas.ContractFinding(**finding)
+            for finding in sorted(
+                self._findings.values(),
+                key=lambda f: (SEVERITY_ORDER[f["severity"]], min(f["pages"])),
+            )
+        ]
+
+
+# ==================== PDF SCAN ====================
+
+
+class ContractTooLargeError(ContractScanError):
+    """The upload exceeds CONTRACT_SCAN_MAX_BYTES"""
+
+
+def hash_upload(file: BinaryIO) -> str:
+    """SHA-256 of a file read in chunks, enforcing the size limit; rewinds it"""
+    digest, size = hashlib.sha256(), 0
+    for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+        size += len(chunk)
+        if size > CONTRACT_SCAN_MAX_BYTES:
+            raise ContractTooLargeError(
+                f"Contracts are limited to {CONTRACT_SCAN_MAX_BYTES // 2**20} MB"
+            )
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def open_pdf(file: BinaryIO) -> Tuple[int, Iterator[str]]:
+    """
+    Page count and a lazy iterator over the text of each page
+
+    pypdf resolves a page's objects only when its text is extracted, so at
+    most one page of text is held at a time; pages after
+    CONTRACT_SCAN_MAX_PAGES are not read.
+    """
+    from pypdf import PdfReader
+    from pypdf.errors import PyPdfError
+
+    if file.read(5) != b"%PDF-":
+        raise ContractScanError("Not a PDF file")
+    file.seek(0)
+    try:
+        reader = PdfReader(file)
+        if reader.is_encrypted and not reader.decrypt(""):
+            raise ContractScanError("Password-protected PDFs can't be scanned")
+        page_count = len(reader.pages)
+    except (PyPdfError, ValueError) as e:
+        raise ContractScanError(f"Unreadable PDF: {e}")
+
+    def pages() -> Iterator[str]:
+        for number in range(min(page_count, CONTRACT_SCAN_MAX_PAGES)):
+            try:
+                yield reader.pages[number].extract_text() or ""
+            except (PyPdfError, ValueError, KeyError):
+                # One broken page (bad font, stream) shouldn't void the scan
+                yield ""
+
+    return page_count, pages()
+
+
+def scan_pdf(file: BinaryIO) -> Tuple[schemas.ContractScanResult, bool]:
+    """
+    Scan an uploaded contract, returning (result, served from cache)
+
+    The document hash is computed while reading the upload, before any PDF
+    parsing, so repeated documents cost one pass over their bytes.
+    """
+    sha256 = hash_upload(file)
+    key = (sha256, dictionary_digest())
+    cached = scan_cache.get(key)
+    if cached is not None:
+        return cached, True
+
+    page_count, pages = open_pdf(file)
+    scan = ClauseScan(get_matcher())
+    for text in pages:
+        scan.feed(text)
+
+    findings = scan.findings()
+    result = schemas.ContractScanResult(
+        sha256=sha256,
+        pages=page_count,
+        scanned_pages=scan.pages,
+        text_found=scan.words > 0,
+        risk=findings[0].severity if findings else "none",
+        findings=findings,
+    )
+    scan_cache.set(key, result)
+    return result, False
+
+
+def main():
+    """Scan contracts from the command line"""
+    parser = argparse.ArgumentParser(description="Flag risky clauses in contracts")
+    parser.add_argument("paths", nargs="+", help="PDF files")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📄 Korus Collective Voice- Contract Clause Scanner")
+    print("=" * 60)
+    print(f"ℹ️  {len(get_matcher())} phrases from {CONTRACT_CLAUSES_PATH}")
+
+    failed = 0
+    for path in args.paths:
+        print(f"\n📄 {path}")
+        try:
+            with open(path, "rb") as f:
+                result, _ = scan_pdf(f)
+        except (OSError, ContractScanError) as e:
+            print(f"   ❌ {e}")
+            failed += 1
+            continue
+
+        print(f"   {result.scanned_pages}/{result.pages} pages, risk: {result.risk}")
+        if not result.text_found:
+            print("   ⚠️  No text found (scanned image?)")
+        for finding in result.findings:
+            print(
+                f"   - [{finding.severity}] {finding.description} "
+                f"(p. {', '.join(map(str, finding.pages))}): {finding.excerpt}"
+            )
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
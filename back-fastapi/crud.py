@@ -1,28 +1,163 @@
-from datetime import datetime, timedelta
-from typing import List, Optional
+import os
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional
 
 import auth
+import invalidation_bus
 import models
 import schemas
-from sqlalchemy import func
+import support_directory
+from cache import TieredCache, TTLCache
+from singleflight import coalesce
+from sqlalchemy import and_, case, func, insert, or_, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
+# Hot reads cached per worker and, with CACHE_REDIS_URL, across workers
+COMPANY_CACHE_TTL = float(os.getenv("COMPANY_CACHE_TTL", "60"))
+COMPANY_STATISTICS_CACHE_TTL = float(os.getenv("COMPANY_STATISTICS_CACHE_TTL", "60"))
+company_cache = TieredCache("companies", ttl_seconds=COMPANY_CACHE_TTL)
+statistics_cache = TieredCache("statistics", ttl_seconds=COMPANY_STATISTICS_CACHE_TTL)
+PLATFORM_STATISTICS_KEY = "platform"
+
+# Cache tags: entries derived from one company carry company_tags(id);
+# anything aggregated over the platform carries PLATFORM_TAG
+COMPANIES_TAG = "companies"
+PLATFORM_TAG = "platform"
+
+
+def company_tags(company_id: int) -> tuple:
+    """Tags of cache entries derived from one company"""
+    return (f"company:{company_id}", COMPANIES_TAG)
+
+
+def invalidate_company(company_id: Optional[int] = None):
+    """
+    Make cached data of one company, or of every company when None, stale
+
+    Platform statistics aggregate every company, so they go stale too.
+    """
+    if company_id is None:
+        invalidation_bus.invalidate(COMPANIES_TAG, PLATFORM_TAG)
+    else:
+        invalidation_bus.invalidate(f"company:{company_id}", PLATFORM_TAG)
+
+
 # ==================== COMPANY CRUD ====================
+# Read functions marked @coalesce share one in-flight query between
+# concurrent identical calls on read sessions (see singleflight.py).
 
 
+@coalesce
 def get_company(db: Session, company_id: int) -> Optional[models.Company]:
     """Get company by ID"""
     return db.query(models.Company).filter(models.Company.id == company_id).first()
 
 
+def get_company_public(db: Session, company_id: int) -> Optional[schemas.CompanyPublic]:
+    """Public profile of a company (cached, tagged with company_tags)"""
+
+    def load() -> Optional[schemas.CompanyPublic]:
+        company = get_company(db, company_id)
+        return schemas.CompanyPublic.model_validate(company) if company else None
+
+    return company_cache.get_or_load(company_id, load, tags=company_tags(company_id))
+
+
 def get_company_by_email(db: Session, email: str) -> Optional[models.Company]:
     """Get company by email"""
     return db.query(models.Company).filter(models.Company.email == email).first()
 
 
-def get_companies(db: Session, skip: int = 0, limit: int = 100) -> List[models.Company]:
-    """Get all companies"""
-    return db.query(models.Company).offset(skip).limit(limit).all()
+# Sort options for the company listing, each backed by a covering index on
+# company_summaries (models.CompanySummary)
+COMPANY_SORT_OPTIONS = {
+    "id": models.CompanySummary.company_id.asc(),
+    "rating": models.CompanySummary.overall_rating.desc(),
+    "trust": models.CompanySummary.trust_score.desc(),
+    "reviews": models.CompanySummary.total_reviews.desc(),
+    "name": models.CompanySummary.company_name.asc(),
+    "newest": models.CompanySummary.created_at.desc(),
+    "jobs": models.CompanySummary.active_jobs.desc(),
+    "recent": models.CompanySummary.recent_reviews.desc(),
+    "last_review": models.CompanySummary.last_review_at.desc(),
+}
+
+
+def build_companies_query(
+    db: Session,
+    industry: Optional[str] = None,
+    country: Optional[str] = None,
+    verified: Optional[bool] = None,
+    min_rating: Optional[float] = None,
+    min_lat: Optional[float] = None,
+    max_lat: Optional[float] = None,
+    min_lng: Optional[float] = None,
+    max_lng: Optional[float] = None,
+    sort: str = "id",
+):
+    """
+    Build the filtered/sorted company listing query over company ids
+
+    Only company_summaries.company_id is selected, so MySQL answers it from
+    one covering index. Equality filters come first so it can use the
+    (industry|country|verified, overall_rating) composite indexes and
+    resolve min_rating as a range on the second key part.
+    """
+    summary = models.CompanySummary
+    query = db.query(summary.company_id)
+
+    if industry is not None:
+        query = query.filter(summary.industry == industry)
+    if country is not None:
+        query = query.filter(summary.country == country)
+    if verified is not None:
+        query = query.filter(summary.verified == verified)
+    if min_rating is not None:
+        query = query.filter(summary.overall_rating >= min_rating)
+
+    # Bounding box on (latitude, longitude)
+    if min_lat is not None:
+        query = query.filter(summary.latitude >= min_lat)
+    if max_lat is not None:
+        query = query.filter(summary.latitude <= max_lat)
+    if min_lng is not None:
+        query = query.filter(summary.longitude >= min_lng)
+    if max_lng is not None:
+        query = query.filter(summary.longitude <= max_lng)
+
+    order_by = COMPANY_SORT_OPTIONS[sort]
+    if sort == "id":
+        return query.order_by(order_by)
+    return query.order_by(order_by, summary.company_id.asc())
+
+
+@coalesce
+def get_companies(
+    db: Session, skip: int = 0, limit: int = 100, **filters
+) -> List[models.CompanySummary]:
+    """
+    Get company summaries, optionally filtered and sorted
+
+    The page of ids comes from build_companies_query (index only); then
+    only those summary rows are read, by primary key.
+    """
+    ids = [
+        company_id
+        for (company_id,) in build_companies_query(db, **filters)
+        .offset(skip)
+        .limit(limit)
+    ]
+    if not ids:
+        return []
+    summaries = {
+        summary.company_id: summary
+        for summary in db.query(models.CompanySummary).filter(
+            models.CompanySummary.company_id.in_(ids)
+        )
+    }
+    return [summaries[company_id] for company_id in ids if company_id in summaries]
 
 
 def create_company(db: Session, company: schemas.CompanyCreate) -> models.Company:
@@ -42,11 +177,28 @@ def create_company(db: Session, company: schemas.CompanyCreate) -> models.Compan
     )
 
     db.add(db_company)
+    db.flush()
+    record_changes(db, "company", [db_company.id], op="insert")
+    refresh_company_summaries(db, [db_company.id])
     db.commit()
     db.refresh(db_company)
+    invalidate_company(db_company.id)
+    index_company(db_company)
     return db_company
 
 
+def index_company(db_company: models.Company):
+    """Refresh this worker's fuzzy search entry for a company"""
+    import company_search  # numpy-backed, imported on first use
+
+    if db_company.is_active:
+        company_search.company_index.add(
+            db_company.id, db_company.company_name, db_company.location
+        )
+    else:
+        company_search.company_index.remove(db_company.id)
+
+
 def update_company(
     db: Session, company_id: int, company_update: schemas.CompanyUpdate
 ) -> models.Company:
@@ -59,72 +211,207 @@ def update_company(
             setattr(db_company, field, value)
 
         db_company.updated_at = datetime.utcnow()
+        record_changes(db, "company", [company_id])
+        refresh_company_summaries(db, [company_id])
         db.commit()
         db.refresh(db_company)
+        invalidate_company(company_id)
+        index_company(db_company)
 
     return db_company
 
 
 def delete_company(db: Session, company_id: int):
     """Delete a company"""
+    import company_search
+
     db_company = get_company(db, company_id)
     if db_company:
+        # Jobs and reviews go with the company (delete-orphan cascade)
+        for entity, model in (("job", models.Job), ("review", models.Review)):
+            ids = [
+                row_id
+                for (row_id,) in db.query(model.id).filter_by(company_id=company_id)
+            ]
+            record_changes(db, entity, ids, op="delete")
+        record_changes(db, "company", [company_id], op="delete")
+        db.query(models.CompanySummary).filter_by(company_id=company_id).delete()
         db.delete(db_company)
         db.commit()
+        invalidate_company(company_id)
+        company_search.company_index.remove(company_id)
 
 
 def update_company_ratings(db: Session, company_id: int):
-    """Update company ratings based on reviews"""
-    reviews = (
-        db.query(models.Review).filter(models.Review.company_id == company_id).all()
+    """
+    Update company ratings based on reviews
+
+    Averages are plain means over non-duplicate reviews; the trust score
+    comes from the scoring engine (time-decayed, verification-weighted).
+    """
+    import scoring  # numpy-backed, imported on first use
+
+    (
+        total_reviews,
+        avg_work_conditions,
+        avg_pay,
+        avg_treatment,
+        avg_safety,
+    ) = (
+        db.query(
+            func.count(models.Review.id),
+            func.avg(models.Review.rating_work_conditions),
+            func.avg(models.Review.rating_pay),
+            func.avg(models.Review.rating_treatment),
+            func.avg(models.Review.rating_safety),
+        )
+        .filter(
+            models.Review.company_id == company_id,
+            models.Review.duplicate_of_id.is_(None),
+        )
+        .one()
     )
 
-    if not reviews:
+    db_company = get_company(db, company_id)
+    if db_company is None:
         return
 
-    total_reviews = len(reviews)
-
-    # Calculate average ratings
-    avg_work_conditions = sum(r.rating_work_conditions for r in reviews) / total_reviews
-    avg_pay = sum(r.rating_pay for r in reviews) / total_reviews
-    avg_treatment = sum(r.rating_treatment for r in reviews) / total_reviews
-    avg_safety = sum(r.rating_safety for r in reviews) / total_reviews
-
-    overall_rating = (avg_work_conditions + avg_pay + avg_treatment + avg_safety) / 4
+    if total_reviews:
+        trust_score = scoring.company_trust_score(db, db_company)
+        if trust_score is None:
+            scoring.rebuild_state(db, [company_id])
+            trust_score = scoring.company_trust_score(db, db_company)
+        averages = (avg_work_conditions, avg_pay, avg_treatment, avg_safety)
+    else:
+        # Every review gone or flagged: zeros, as compute_company_ratings gives
+        trust_score = 0.0
+        averages = (0.0, 0.0, 0.0, 0.0)
+
+    db_company.overall_rating = round(sum(averages) / 4, 2)
+    db_company.total_reviews = total_reviews
+    (
+        db_company.rating_work_conditions,
+        db_company.rating_pay,
+        db_company.rating_treatment,
+        db_company.rating_safety,
+    ) = (round(average, 2) for average in averages)
+    db_company.trust_score = trust_score
+    db_company.updated_at = datetime.utcnow()
+    record_changes(db, "company", [company_id])
+    refresh_company_summaries(db, [company_id])
 
-    # Calculate trust score (weighted average with verification bonus)
-    verified_reviews = [r for r in reviews if r.verified_employee]
-    verification_bonus = len(verified_reviews) / total_reviews * 0.5
-    trust_score = min(overall_rating + verification_bonus, 5.0)
-
-    # Update company
-    db_company = get_company(db, company_id)
-    if db_company:
-        db_company.overall_rating = round(overall_rating, 2)
-        db_company.total_reviews = total_reviews
-        db_company.rating_work_conditions = round(avg_work_conditions, 2)
-        db_company.rating_pay = round(avg_pay, 2)
-        db_company.rating_treatment = round(avg_treatment, 2)
-        db_company.rating_safety = round(avg_safety, 2)
-        db_company.trust_score = round(trust_score, 2)
-        db_company.updated_at = datetime.utcnow()
+    db.commit()
+    db.refresh(db_company)
+    invalidate_company(company_id)
+
+
+# Company columns maintained from reviews, in compute_company_ratings() order
+COMPANY_RATING_COLUMNS = (
+    "overall_rating",
+    "total_reviews",
+    "trust_score",
+    "rating_work_conditions",
+    "rating_pay",
+    "rating_treatment",
+    "rating_safety",
+)
+
+
+def compute_company_ratings(db: Session, rebuild_scores: bool = True) -> dict:
+    """
+    Recompute the rating columns of every company
+
+    Averages come from one GROUP BY over non-duplicate reviews and trust
+    scores from one scoring-engine pass. Returns {company_id: {column: value}};
+    companies without reviews get zeros.
+    """
+    import scoring
+
+    aggregates = (
+        db.query(
+            models.Review.company_id,
+            func.count(models.Review.id),
+            func.avg(models.Review.rating_work_conditions),
+            func.avg(models.Review.rating_pay),
+            func.avg(models.Review.rating_treatment),
+            func.avg(models.Review.rating_safety),
+        )
+        .filter(models.Review.duplicate_of_id.is_(None))
+        .group_by(models.Review.company_id)
+    )
+    trust_scores = scoring.compute_trust_scores(db, rebuild=rebuild_scores)
 
-        db.commit()
-        db.refresh(db_company)
+    ratings = {
+        company_id: {**dict.fromkeys(COMPANY_RATING_COLUMNS, 0.0), "total_reviews": 0}
+        for (company_id,) in db.query(models.Company.id)
+    }
+    for company_id, total, work, pay, treatment, safety in aggregates:
+        if company_id not in ratings:
+            continue
+        ratings[company_id] = {
+            "overall_rating": round((work + pay + treatment + safety) / 4, 2),
+            "total_reviews": total,
+            "trust_score": trust_scores.get(company_id, 0.0),
+            "rating_work_conditions": round(work, 2),
+            "rating_pay": round(pay, 2),
+            "rating_treatment": round(treatment, 2),
+            "rating_safety": round(safety, 2),
+        }
+    return ratings
+
+
+def save_company_ratings(db: Session, ratings: dict) -> int:
+    """
+    Write {company_id: {column: value}} back with one executemany UPDATE
+    """
+    if not ratings:
+        return 0
+    now = datetime.utcnow()
+    db.execute(
+        update(models.Company),
+        [
+            {"id": company_id, **values, "updated_at": now}
+            for company_id, values in ratings.items()
+        ],
+    )
+    record_changes(db, "company", list(ratings))
+    refresh_company_summaries(db, list(ratings))
+    db.commit()
+    invalidate_company()
+    return len(ratings)
 
 
 # ==================== REVIEW CRUD ====================
 
 
+@coalesce
 def get_review(db: Session, review_id: int) -> Optional[models.Review]:
     """Get review by ID"""
     return db.query(models.Review).filter(models.Review.id == review_id).first()
 
 
-def get_reviews(db: Session, skip: int = 0, limit: int = 100) -> List[models.Review]:
-    """Get all reviews"""
+def _filter_reviews(
+    query, sentiment: Optional[str] = None, is_abusive: Optional[bool] = None
+):
+    """Apply the classification filters shared by the review listings"""
+    if sentiment is not None:
+        query = query.filter(models.Review.sentiment_label == sentiment)
+    if is_abusive is not None:
+        query = query.filter(models.Review.is_abusive == is_abusive)
+    return query
+
+
+@coalesce
+def get_reviews(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    sentiment: Optional[str] = None,
+    is_abusive: Optional[bool] = None,
+) -> List[models.Review]:
+    """Get all reviews, optionally filtered by classification"""
     return (
-        db.query(models.Review)
+        _filter_reviews(db.query(models.Review), sentiment, is_abusive)
         .order_by(models.Review.created_at.desc())
         .offset(skip)
         .limit(limit)
@@ -132,13 +419,22 @@ def get_reviews(db: Session, skip: int = 0, limit: int = 100) -> List[models.Rev
     )
 
 
+@coalesce
 def get_reviews_by_company(
-    db: Session, company_id: int, skip: int = 0, limit: int = 100
+    db: Session,
+    company_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    sentiment: Optional[str] = None,
+    is_abusive: Optional[bool] = None,
 ) -> List[models.Review]:
-    """Get reviews for a specific company"""
+    """Get reviews for a specific company, optionally filtered by classification"""
     return (
-        db.query(models.Review)
-        .filter(models.Review.company_id == company_id)
+        _filter_reviews(
+            db.query(models.Review).filter(models.Review.company_id == company_id),
+            sentiment,
+            is_abusive,
+        )
         .order_by(models.Review.created_at.desc())
         .offset(skip)
         .limit(limit)
@@ -148,6 +444,8 @@ def get_reviews_by_company(
 
 def create_review(db: Session, review: schemas.ReviewCreate) -> models.Review:
     """Create a new review"""
+    import scoring
+
     # Verify employee token if provided
     verified = False
     if review.employee_token:
@@ -167,11 +465,21 @@ def create_review(db: Session, review: schemas.ReviewCreate) -> models.Review:
         is_anonymous=review.is_anonymous,
         verified_employee=verified,
         employee_token=review.employee_token if verified else None,
+        # Set here so the rollups can bucket by it before the insert
+        created_at=datetime.utcnow(),
     )
 
     db.add(db_review)
+    increment_rating_rollups(db, db_review)
+    if not scoring.apply_review(db, db_review):
+        db.flush()
+        scoring.rebuild_state(db, [db_review.company_id])
+    db.flush()
+    record_changes(db, "review", [db_review.id], op="insert")
+    refresh_company_summaries(db, [db_review.company_id])
     db.commit()
     db.refresh(db_review)
+    invalidate_company(db_review.company_id)
     return db_review
 
 
@@ -180,24 +488,330 @@ def increment_review_helpful(db: Session, review_id: int):
     db_review = get_review(db, review_id)
     if db_review:
         db_review.helpful_count += 1
+        record_changes(db, "review", [review_id])
         db.commit()
         db.refresh(db_review)
     return db_review
 
 
+def get_unclassified_reviews(db: Session, limit: int = 500) -> List[tuple]:
+    """Get (id, comment) pairs for reviews the classifier has not scored yet"""
+    return (
+        db.query(models.Review.id, models.Review.comment)
+        .filter(models.Review.classified_at.is_(None))
+        .order_by(models.Review.id.asc())
+        .limit(limit)
+        .all()
+    )
+
+
+def save_review_classifications(db: Session, classifications: List[dict]):
+    """
+    Store classifier output for a batch of reviews
+
+    Each dict holds id, sentiment_score, sentiment_label, abuse_score and
+    is_abusive; rows are written with one executemany UPDATE.
+    """
+    if not classifications:
+        return
+    classified_at = datetime.utcnow()
+    db.execute(
+        update(models.Review),
+        [{**row, "classified_at": classified_at} for row in classifications],
+    )
+    record_changes(db, "review", [row["id"] for row in classifications])
+    db.commit()
+
+
+def flag_duplicate_reviews(db: Session, clusters: List[List[int]]) -> int:
+    """
+    Mark near-duplicate reviews and refresh the affected company ratings
+
+    In each cluster (sorted review ids) every review after the first gets
+    duplicate_of_id set to the first. Returns the number of reviews flagged.
+    """
+    import scoring
+
+    rows = [
+        {"id": review_id, "duplicate_of_id": cluster[0]}
+        for cluster in clusters
+        for review_id in cluster[1:]
+    ]
+    if not rows:
+        return 0
+
+    db.execute(update(models.Review), rows)
+
+    company_ids = {
+        company_id
+        for (company_id,) in db.query(models.Review.company_id)
+        .filter(models.Review.id.in_([cluster[0] for cluster in clusters]))
+        .distinct()
+    }
+    scoring.rebuild_state(db, company_ids)
+    # Duplicates leave the trends too, as they leave the company ratings
+    _rebuild_rating_rollups(db, company_ids)
+    db.commit()
+
+    for company_id in company_ids:
+        update_company_ratings(db, company_id)
+    return len(rows)
+
+
+# ==================== RATING ROLLUPS ====================
+
+# Rollup table and its period column for each trend granularity
+RATING_ROLLUPS = {
+    "day": (models.CompanyRatingDaily, models.CompanyRatingDaily.day),
+    "month": (models.CompanyRatingMonthly, models.CompanyRatingMonthly.month),
+}
+
+
+def month_start(value: date) -> date:
+    """First day of the month containing value"""
+    return value.replace(day=1)
+
+
+def _upsert_rating_rollup(db: Session, model, period_column, values: dict):
+    """Insert a rollup row or add values to the existing one"""
+    increments = {
+        name: getattr(model, name) + values[name]
+        for name in (
+            "review_count",
+            "verified_count",
+            "sum_work_conditions",
+            "sum_pay",
+            "sum_treatment",
+            "sum_safety",
+        )
+    }
+
+    if db.get_bind().dialect.name == "mysql":
+        stmt = mysql_insert(model).values(**values)
+        stmt = stmt.on_duplicate_key_update(**increments)
+    else:
+        stmt = sqlite_insert(model).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.company_id, period_column], set_=increments
+        )
+    db.execute(stmt)
+
+
+def increment_rating_rollups(
+    db: Session, review: models.Review, day: Optional[date] = None
+):
+    """
+    Add a review to its company's daily and monthly rollups
+
+    Buckets by the review's created_at, like rebuild_rating_rollups. Runs in
+    the caller's transaction; the caller commits.
+    """
+    if day is None:
+        if review.created_at is None:
+            db.flush()  # load the server-side created_at
+        day = review.created_at.date()
+    values = {
+        "company_id": review.company_id,
+        "review_count": 1,
+        "verified_count": 1 if review.verified_employee else 0,
+        "sum_work_conditions": review.rating_work_conditions,
+        "sum_pay": review.rating_pay,
+        "sum_treatment": review.rating_treatment,
+        "sum_safety": review.rating_safety,
+    }
+    _upsert_rating_rollup(
+        db,
+        models.CompanyRatingDaily,
+        models.CompanyRatingDaily.day,
+        {**values, "day": day},
+    )
+    _upsert_rating_rollup(
+        db,
+        models.CompanyRatingMonthly,
+        models.CompanyRatingMonthly.month,
+        {**values, "month": month_start(day)},
+    )
+
+
+def _rebuild_rating_rollups(
+    db: Session, company_ids: Optional[Iterable[int]] = None
+) -> int:
+    """rebuild_rating_rollups for some companies (all when None); no commit"""
+    daily = models.CompanyRatingDaily
+    monthly = models.CompanyRatingMonthly
+    review = models.Review
+
+    daily_delete = db.query(daily)
+    monthly_delete = db.query(monthly)
+    review_filter = [review.duplicate_of_id.is_(None)]
+    if company_ids is not None:
+        company_ids = list(company_ids)
+        if not company_ids:
+            return 0
+        daily_delete = daily_delete.filter(daily.company_id.in_(company_ids))
+        monthly_delete = monthly_delete.filter(monthly.company_id.in_(company_ids))
+        review_filter.append(review.company_id.in_(company_ids))
+    daily_delete.delete(synchronize_session=False)
+    monthly_delete.delete(synchronize_session=False)
+
+    review_day = func.date(review.created_at)
+    daily_select = (
+        select(
+            review.company_id,
+            review_day,
+            func.count(review.id),
+            func.sum(case((review.verified_employee == True, 1), else_=0)),
+            func.sum(review.rating_work_conditions),
+            func.sum(review.rating_pay),
+            func.sum(review.rating_treatment),
+            func.sum(review.rating_safety),
+        )
+        .where(*review_filter)
+        .group_by(review.company_id, review_day)
+    )
+    result = db.execute(
+        insert(daily).from_select(
+            [
+                "company_id",
+                "day",
+                "review_count",
+                "verified_count",
+                "sum_work_conditions",
+                "sum_pay",
+                "sum_treatment",
+                "sum_safety",
+            ],
+            daily_select,
+        )
+    )
+    daily_rows = result.rowcount
+
+    # Fold daily rows into months; there are at most ~31x fewer of these
+    months = {}
+    daily_query = db.query(daily)
+    if company_ids is not None:
+        daily_query = daily_query.filter(daily.company_id.in_(company_ids))
+    for row in daily_query.yield_per(1000):
+        key = (row.company_id, month_start(row.day))
+        totals = months.setdefault(key, [0, 0, 0.0, 0.0, 0.0, 0.0])
+        totals[0] += row.review_count
+        totals[1] += row.verified_count
+        totals[2] += row.sum_work_conditions
+        totals[3] += row.sum_pay
+        totals[4] += row.sum_treatment
+        totals[5] += row.sum_safety
+
+    if months:
+        db.execute(
+            insert(monthly),
+            [
+                {
+                    "company_id": key[0],
+                    "month": key[1],
+                    "review_count": totals[0],
+                    "verified_count": totals[1],
+                    "sum_work_conditions": totals[2],
+                    "sum_pay": totals[3],
+                    "sum_treatment": totals[4],
+                    "sum_safety": totals[5],
+                }
+                for key, totals in months.items()
+            ],
+        )
+    return daily_rows
+
+
+def rebuild_rating_rollups(db: Session, company_id: Optional[int] = None) -> int:
+    """
+    Rebuild rollups from the raw reviews table
+
+    Daily rows are produced by one INSERT ... SELECT ... GROUP BY; monthly
+    rows are then folded from the daily table. Reviews flagged as duplicates
+    are left out, as in update_company_ratings. Returns the number of daily
+    rows written.
+    """
+    daily_rows = _rebuild_rating_rollups(
+        db, None if company_id is None else [company_id]
+    )
+    db.commit()
+    return daily_rows
+
+
+def get_company_rating_trends(
+    db: Session,
+    company_id: int,
+    granularity: str = "month",
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> List[dict]:
+    """
+    Get a company's rating series from the rollup tables
+
+    A primary-key range scan on (company_id, period); no raw reviews are read.
+    """
+    model, period_column = RATING_ROLLUPS[granularity]
+
+    query = db.query(model).filter(model.company_id == company_id)
+    if start is not None:
+        query = query.filter(period_column >= start)
+    if end is not None:
+        query = query.filter(period_column <= end)
+
+    series = []
+    for row in query.order_by(period_column.asc()).all():
+        count = row.review_count or 1
+        series.append(
+            {
+                "period": getattr(row, period_column.key),
+                "review_count": row.review_count,
+                "verified_count": row.verified_count,
+                "rating_work_conditions": round(row.sum_work_conditions / count, 2),
+                "rating_pay": round(row.sum_pay / count, 2),
+                "rating_treatment": round(row.sum_treatment / count, 2),
+                "rating_safety": round(row.sum_safety / count, 2),
+                "overall_rating": round(
+                    (
+                        row.sum_work_conditions
+                        + row.sum_pay
+                        + row.sum_treatment
+                        + row.sum_safety
+                    )
+                    / (4 * count),
+                    2,
+                ),
+            }
+        )
+    return series
+
+
 # ==================== JOB CRUD ====================
 
 
+@coalesce
 def get_job(db: Session, job_id: int) -> Optional[models.Job]:
     """Get job by ID"""
     return db.query(models.Job).filter(models.Job.id == job_id).first()
 
 
+def live_job_filter(now: Optional[datetime] = None):
+    """
+    Filter clause for postings that are active and not yet expired
+
+    Matches idx_active_expires_posted (is_active, expires_at, posted_at)
+    """
+    now = now or datetime.utcnow()
+    return and_(
+        models.Job.is_active == True,
+        or_(models.Job.expires_at.is_(None), models.Job.expires_at > now),
+    )
+
+
+@coalesce
 def get_jobs(db: Session, skip: int = 0, limit: int = 100) -> List[models.Job]:
-    """Get all jobs"""
+    """Get all live (active, unexpired) jobs"""
     return (
         db.query(models.Job)
-        .filter(models.Job.is_active == True)
+        .filter(live_job_filter())
         .order_by(models.Job.posted_at.desc())
         .offset(skip)
         .limit(limit)
@@ -205,13 +819,14 @@ def get_jobs(db: Session, skip: int = 0, limit: int = 100) -> List[models.Job]:
     )
 
 
+@coalesce
 def get_jobs_by_company(
     db: Session, company_id: int, skip: int = 0, limit: int = 100
 ) -> List[models.Job]:
-    """Get jobs for a specific company"""
+    """Get live jobs for a specific company, newest first (idx_company_posted)"""
     return (
         db.query(models.Job)
-        .filter(models.Job.company_id == company_id, models.Job.is_active == True)
+        .filter(models.Job.company_id == company_id, live_job_filter())
         .order_by(models.Job.posted_at.desc())
         .offset(skip)
         .limit(limit)
@@ -219,6 +834,63 @@ def get_jobs_by_company(
     )
 
 
+def deactivate_expired_jobs(
+    db: Session, batch_size: int = 500, now: Optional[datetime] = None
+) -> int:
+    """
+    Deactivate jobs whose expires_at has passed
+
+    Works in batches of primary keys, committing after each UPDATE so row
+    locks are held for at most one batch. Returns the number of jobs
+    deactivated.
+    """
+    now = now or datetime.utcnow()
+    total = 0
+
+    while True:
+        ids = [
+            job_id
+            for (job_id,) in db.query(models.Job.id)
+            .filter(
+                models.Job.is_active == True,
+                models.Job.expires_at.isnot(None),
+                models.Job.expires_at <= now,
+            )
+            .limit(batch_size)
+            .all()
+        ]
+        if not ids:
+            break
+
+        updated = (
+            db.query(models.Job)
+            .filter(models.Job.id.in_(ids), models.Job.is_active == True)
+            .update(
+                {models.Job.is_active: False, models.Job.updated_at: now},
+                synchronize_session=False,
+            )
+        )
+        record_changes(db, "job", ids)
+        refresh_company_summaries(
+            db,
+            {
+                company_id
+                for (company_id,) in db.query(models.Job.company_id)
+                .filter(models.Job.id.in_(ids))
+                .distinct()
+            },
+        )
+        db.commit()
+        total += updated
+
+        if len(ids) < batch_size:
+            break
+
+    if total:
+        invalidate_company()
+    return total
+
+
 def create_job(db: Session, job: schemas.JobCreate) -> models.Job:
     """Create a new job listing"""
     db_job = models.Job(
@@ -233,8 +905,12 @@ def create_job(db: Session, job: schemas.JobCreate) -> models.Job:
     )
 
     db.add(db_job)
+    db.flush()
+    record_changes(db, "job", [db_job.id], op="insert")
+    refresh_company_summaries(db, [db_job.company_id])
     db.commit()
     db.refresh(db_job)
+    invalidate_company(db_job.company_id)
     return db_job
 
 
@@ -248,8 +924,11 @@ def update_job(db: Session, job_id: int, job_update: schemas.JobUpdate) -> model
             setattr(db_job, field, value)
 
         db_job.updated_at = datetime.utcnow()
+        record_changes(db, "job", [job_id])
+        refresh_company_summaries(db, [db_job.company_id])
         db.commit()
         db.refresh(db_job)
+        invalidate_company(db_job.company_id)
 
     return db_job
 
@@ -258,8 +937,12 @@ def delete_job(db: Session, job_id: int):
     """Delete a job listing"""
     db_job = get_job(db, job_id)
     if db_job:
+        company_id = db_job.company_id
+        record_changes(db, "job", [job_id], op="delete")
         db.delete(db_job)
+        refresh_company_summaries(db, [company_id])
         db.commit()
+        invalidate_company(company_id)
 
 
 # ==================== SUPPORT ORGANIZATION CRUD ====================
@@ -289,18 +972,204 @@ def get_support_organizations(
     )
 
 
+def invalidate_support_organizations():
+    """Drop every worker's directory snapshot; platform statistics go stale"""
+    invalidation_bus.invalidate(support_directory.SUPPORT_DIRECTORY_TAG, PLATFORM_TAG)
+
+
+def create_support_organization(
+    db: Session, org: schemas.SupportOrgCreate
+) -> models.SupportOrganization:
+    """Create a new support organization"""
+    db_org = models.SupportOrganization(**org.model_dump())
+    db.add(db_org)
+    db.flush()
+    record_changes(db, "support_organization", [db_org.id], op="insert")
+    db.commit()
+    db.refresh(db_org)
+    invalidate_support_organizations()
+    return db_org
+
+
+def update_support_organization(
+    db: Session, org_id: int, org_update: schemas.SupportOrgUpdate
+) -> Optional[models.SupportOrganization]:
+    """Update a support organization"""
+    db_org = get_support_organization(db, org_id)
+
+    if db_org:
+        for field, value in org_update.model_dump(exclude_unset=True).items():
+            setattr(db_org, field, value)
+
+        db_org.updated_at = datetime.utcnow()
+        record_changes(db, "support_organization", [org_id])
+        db.commit()
+        db.refresh(db_org)
+        invalidate_support_organizations()
+
+    return db_org
+
+
+def deactivate_support_organization(db: Session, org_id: int) -> bool:
+    """
+    Hide a support organization from the directory
+
+    Rows are kept (with their translations) so an admin can reactivate them
+    with is_active=true. Returns False when the organization does not exist.
+    """
+    db_org = get_support_organization(db, org_id)
+    if db_org is None:
+        return False
+
+    db_org.is_active = False
+    db_org.updated_at = datetime.utcnow()
+    record_changes(db, "support_organization", [org_id])
+    db.commit()
+    invalidate_support_organizations()
+    return True
+
+
+def bulk_insert_support_organizations(db: Session, rows: List[dict]) -> int:
+    """Insert organization dicts with one executemany INSERT (no commit)"""
+    if not rows:
+        return 0
+    last_id = db.query(func.max(models.SupportOrganization.id)).scalar() or 0
+    db.execute(insert(models.SupportOrganization), rows)
+    # executemany returns no ids: log every row past the previous maximum
+    new_ids = db.query(models.SupportOrganization.id).filter(
+        models.SupportOrganization.id > last_id
+    )
+    record_changes(
+        db, "support_organization", [org_id for (org_id,) in new_ids], op="insert"
+    )
+    return len(rows)
+
+
+# ==================== TRANSLATIONS ====================
+
+# Translatable entity kind -> (translation model, entity id column)
+TRANSLATION_MODELS = {
+    "company": (models.CompanyTranslation, models.CompanyTranslation.company_id),
+    "job": (models.JobTranslation, models.JobTranslation.job_id),
+    "support_organization": (
+        models.SupportOrganizationTranslation,
+        models.SupportOrganizationTranslation.organization_id,
+    ),
+}
+
+# (kind, locale, entity_id) -> description, or _NO_TRANSLATION
+TRANSLATION_CACHE_TTL = float(os.getenv("TRANSLATION_CACHE_TTL", "300"))
+translation_cache = TTLCache(
+    ttl_seconds=TRANSLATION_CACHE_TTL, maxsize=100000, name="translations"
+)
+_NO_TRANSLATION = object()
+
+# Translation writes are rare: any of them drops every worker's cache
+TRANSLATIONS_TAG = "translations"
+invalidation_bus.subscribe(translation_cache.clear, TRANSLATIONS_TAG)
+
+
+def get_translated_descriptions(
+    db: Session, kind: str, entity_ids: List[int], locale: str
+) -> dict:
+    """
+    {entity_id: description} for the entities translated into locale
+
+    Lookups are cached per locale, including misses, so a warm localized
+    listing costs no extra query; cold ids are fetched with one IN query.
+    """
+    model, id_column = TRANSLATION_MODELS[kind]
+    descriptions = {}
+    missing = []
+    for entity_id in entity_ids:
+        cached = translation_cache.get((kind, locale, entity_id))
+        if cached is None:
+            missing.append(entity_id)
+        elif cached is not _NO_TRANSLATION:
+            descriptions[entity_id] = cached
+
+    if missing:
+        found = dict(
+            db.query(id_column, model.description).filter(
+                model.locale == locale, id_column.in_(missing)
+            )
+        )
+        for entity_id in missing:
+            translation_cache.set(
+                (kind, locale, entity_id), found.get(entity_id, _NO_TRANSLATION)
+            )
+        descriptions.update(found)
+    return descriptions
+
+
+def _invalidate_translations(kind: str):
+    invalidation_bus.invalidate(TRANSLATIONS_TAG)
+    if kind == "support_organization":
+        # The localized directory is built from the snapshot
+        invalidate_support_organizations()
+
+
+def get_translations(db: Session, kind: str, entity_id: int) -> list:
+    """All stored translations of one entity"""
+    model, id_column = TRANSLATION_MODELS[kind]
+    return (
+        db.query(model)
+        .filter(id_column == entity_id)
+        .order_by(model.locale.asc())
+        .all()
+    )
+
+
+def set_translation(
+    db: Session, kind: str, entity_id: int, locale: str, description: str
+):
+    """Create or replace the description of an entity in one locale"""
+    model, id_column = TRANSLATION_MODELS[kind]
+    translation = (
+        db.query(model).filter(id_column == entity_id, model.locale == locale).first()
+    )
+    if translation is None:
+        translation = model(locale=locale, description=description)
+        setattr(translation, id_column.key, entity_id)
+        db.add(translation)
+    else:
+        translation.description = description
+
+    db.commit()
+    db.refresh(translation)
+    _invalidate_translations(kind)
+    return translation
+
+
+def delete_translation(db: Session, kind: str, entity_id: int, locale: str) -> bool:
+    """Delete one translation; returns False when it did not exist"""
+    model, id_column = TRANSLATION_MODELS[kind]
+    deleted = (
+        db.query(model)
+        .filter(id_column == entity_id, model.locale == locale)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    _invalidate_translations(kind)
+    return bool(deleted)
+
+
 # ==================== STATISTICS ====================
 
 
 def get_platform_statistics(db: Session) -> dict:
-    """Get platform-wide statistics"""
+    """Get platform-wide statistics (cached, tagged with PLATFORM_TAG)"""
+    return statistics_cache.get_or_load(
+        PLATFORM_STATISTICS_KEY,
+        lambda: _load_platform_statistics(db),
+        tags=(PLATFORM_TAG,),
+    )
+
+
+def _load_platform_statistics(db: Session) -> dict:
     total_companies = db.query(func.count(models.Company.id)).scalar()
     total_reviews = db.query(func.count(models.Review.id)).scalar()
-    total_jobs = (
-        db.query(func.count(models.Job.id))
-        .filter(models.Job.is_active == True)
-        .scalar()
-    )
+    total_jobs = db.query(func.count(models.Job.id)).filter(live_job_filter()).scalar()
     total_support_orgs = (
         db.query(func.count(models.SupportOrganization.id))
         .filter(models.SupportOrganization.is_active == True)
@@ -327,7 +1196,7 @@ def get_platform_statistics(db: Session) -> dict:
         .scalar()
     )
 
-    return {
+    statistics = {
         "total_companies": total_companies,
         "total_reviews": total_reviews,
         "total_jobs": total_jobs,
@@ -337,58 +1206,457 @@ def get_platform_statistics(db: Session) -> dict:
         "verified_companies": verified_companies,
         "critical_reviews": critical_reviews,
     }
+    return statistics
+
+
+@coalesce
+def get_company_statistics(db: Session, company_id: int) -> Optional[dict]:
+    """
+    Get statistics for a specific company
+
+    The company row and both review and job counts come from a single
+    statement (conditional aggregation in two grouped subqueries joined to
+    the company). Results are cached per company and made stale by the
+    review/job/company write functions through invalidate_company().
+    """
+    return statistics_cache.get_or_load(
+        company_id,
+        lambda: _load_company_statistics(db, company_id),
+        tags=company_tags(company_id),
+    )
 
 
-def get_company_statistics(db: Session, company_id: int) -> dict:
-    """Get statistics for a specific company"""
-    company = get_company(db, company_id)
-    if not company:
-        return None
-
-    total_reviews = (
-        db.query(func.count(models.Review.id))
-        .filter(models.Review.company_id == company_id)
-        .scalar()
-    )
+def _load_company_statistics(db: Session, company_id: int) -> Optional[dict]:
+    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
 
-    total_jobs = (
-        db.query(func.count(models.Job.id))
-        .filter(models.Job.company_id == company_id)
-        .scalar()
+    review_counts = (
+        select(
+            models.Review.company_id.label("company_id"),
+            func.count(models.Review.id).label("total_reviews"),
+            func.sum(
+                case((models.Review.created_at >= thirty_days_ago, 1), else_=0)
+            ).label("recent_reviews"),
+        )
+        .where(models.Review.company_id == company_id)
+        .group_by(models.Review.company_id)
+        .subquery()
     )
-
-    active_jobs = (
-        db.query(func.count(models.Job.id))
-        .filter(models.Job.company_id == company_id, models.Job.is_active == True)
-        .scalar()
+    job_counts = (
+        select(
+            models.Job.company_id.label("company_id"),
+            func.count(models.Job.id).label("total_jobs"),
+            func.sum(case((live_job_filter(), 1), else_=0)).label("active_jobs"),
+        )
+        .where(models.Job.company_id == company_id)
+        .group_by(models.Job.company_id)
+        .subquery()
     )
 
-    # Recent reviews (last 30 days)
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    recent_reviews = (
-        db.query(func.count(models.Review.id))
-        .filter(
-            models.Review.company_id == company_id,
-            models.Review.created_at >= thirty_days_ago,
+    row = db.execute(
+        select(
+            models.Company.id,
+            models.Company.company_name,
+            models.Company.overall_rating,
+            models.Company.trust_score,
+            models.Company.rating_work_conditions,
+            models.Company.rating_pay,
+            models.Company.rating_treatment,
+            models.Company.rating_safety,
+            func.coalesce(review_counts.c.total_reviews, 0),
+            func.coalesce(review_counts.c.recent_reviews, 0),
+            func.coalesce(job_counts.c.total_jobs, 0),
+            func.coalesce(job_counts.c.active_jobs, 0),
         )
-        .scalar()
-    )
+        .outerjoin(review_counts, review_counts.c.company_id == models.Company.id)
+        .outerjoin(job_counts, job_counts.c.company_id == models.Company.id)
+        .where(models.Company.id == company_id)
+    ).first()
 
-    return {
-        "company_id": company.id,
-        "company_name": company.company_name,
-        "total_reviews": total_reviews,
-        "total_jobs": total_jobs,
-        "average_rating": company.overall_rating,
-        "trust_score": company.trust_score,
+    if row is None:
+        return None
+
+    (
+        company_id,
+        company_name,
+        overall_rating,
+        trust_score,
+        rating_work_conditions,
+        rating_pay,
+        rating_treatment,
+        rating_safety,
+        total_reviews,
+        recent_reviews,
+        total_jobs,
+        active_jobs,
+    ) = row
+
+    statistics = {
+        "company_id": company_id,
+        "company_name": company_name,
+        "total_reviews": int(total_reviews),
+        "total_jobs": int(total_jobs),
+        "average_rating": overall_rating,
+        "trust_score": trust_score,
         "rating_breakdown": {
-            "work_conditions": company.rating_work_conditions,
-            "pay": company.rating_pay,
-            "treatment": company.rating_treatment,
-            "safety": company.rating_safety,
+            "work_conditions": rating_work_conditions,
+            "pay": rating_pay,
+            "treatment": rating_treatment,
+            "safety": rating_safety,
         },
-        "recent_reviews": recent_reviews,
-        "active_jobs": active_jobs,
+        "recent_reviews": int(recent_reviews),
+        "active_jobs": int(active_jobs),
     }
+    return statistics
+
+
+# ==================== COMPANY SUMMARIES ====================
+# Write functions refresh the affected companies' rows before committing,
+# so company_summaries commits (or rolls back) with the change itself.
+
+# Window of company_summaries.recent_reviews (kept current by rebuilds)
+COMPANY_SUMMARY_RECENT_DAYS = int(os.getenv("COMPANY_SUMMARY_RECENT_DAYS", "30"))
+
+# Company columns copied into company_summaries
+COMPANY_SUMMARY_COLUMNS = (
+    "company_name",
+    "industry",
+    "location",
+    "country",
+    "description",
+    "website",
+    "overall_rating",
+    "total_reviews",
+    "social_media_score",
+    "trust_score",
+    "external_platform_score",
+    "verified",
+    "rating_work_conditions",
+    "rating_pay",
+    "rating_treatment",
+    "rating_safety",
+    "latitude",
+    "longitude",
+    "is_active",
+    "created_at",
+)
+SUMMARY_DERIVED_COLUMNS = (
+    "active_jobs",
+    "recent_reviews",
+    "last_review_at",
+    "refreshed_at",
+)
+# NOT NULL summary columns -> value stored when the company column is NULL
+SUMMARY_NULL_DEFAULTS = {
+    "overall_rating": 0.0,
+    "total_reviews": 0,
+    "social_media_score": 0.0,
+    "trust_score": 0.0,
+    "external_platform_score": 0.0,
+    "verified": False,
+    "rating_work_conditions": 0.0,
+    "rating_pay": 0.0,
+    "rating_treatment": 0.0,
+    "rating_safety": 0.0,
+    "is_active": True,
+}
+
+
+def _upsert_company_summaries(db: Session, rows: List[dict]):
+    """Insert summary rows or overwrite the existing ones"""
+    columns = COMPANY_SUMMARY_COLUMNS + SUMMARY_DERIVED_COLUMNS
+    if db.get_bind().dialect.name == "mysql":
+        stmt = mysql_insert(models.CompanySummary).values(rows)
+        stmt = stmt.on_duplicate_key_update(
+            {column: stmt.inserted[column] for column in columns}
+        )
+    else:
+        stmt = sqlite_insert(models.CompanySummary).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[models.CompanySummary.company_id],
+            set_={column: stmt.excluded[column] for column in columns},
+        )
+    db.execute(stmt)
 
 
+def _refresh_summary_batch(db: Session, company_ids: List[int]) -> int:
+    now = datetime.utcnow()
+    companies = (
+        db.query(
+            models.Company.id,
+            *(getattr(models.Company, column) for column in COMPANY_SUMMARY_COLUMNS),
+        )
+        .filter(models.Company.id.in_(company_ids))
+        .all()
+    )
+    active_jobs = dict(
+        db.query(models.Job.company_id, func.count(models.Job.id))
+        .filter(models.Job.company_id.in_(company_ids), live_job_filter(now))
+        .group_by(models.Job.company_id)
+    )
+    recent_reviews = dict(
+        db.query(models.Review.company_id, func.count(models.Review.id))
+        .filter(
+            models.Review.company_id.in_(company_ids),
+            models.Review.duplicate_of_id.is_(None),
+            models.Review.created_at
+            >= now - timedelta(days=COMPANY_SUMMARY_RECENT_DAYS),
+        )
+        .group_by(models.Review.company_id)
+    )
+    last_review_at = dict(
+        db.query(models.Review.company_id, func.max(models.Review.created_at))
+        .filter(models.Review.company_id.in_(company_ids))
+        .group_by(models.Review.company_id)
+    )
+
+    rows = []
+    for company_id, *values in companies:
+        row = dict(zip(COMPANY_SUMMARY_COLUMNS, values))
+        for column, default in SUMMARY_NULL_DEFAULTS.items():
+            if row[column] is None:
+                row[column] = default
+        rows.append(
+            {
+                **row,
+                "company_id": company_id,
+                "active_jobs": active_jobs.get(company_id, 0),
+                "recent_reviews": recent_reviews.get(company_id, 0),
+                "last_review_at": last_review_at.get(company_id),
+                "refreshed_at": now,
+            }
+        )
+    if rows:
+        _upsert_company_summaries(db, rows)
+
+    # Companies deleted since: drop their rows
+    gone = set(company_ids) - {row["company_id"] for row in rows}
+    if gone:
+        db.query(models.CompanySummary).filter(
+            models.CompanySummary.company_id.in_(gone)
+        ).delete(synchronize_session=False)
+    return len(rows)
+
+
+def refresh_company_summaries(
+    db: Session, company_ids: Optional[Iterable[int]] = None, batch_size: int = 1000
+) -> int:
+    """
+    Recompute company_summaries rows from companies, jobs and reviews
+
+    Pending ORM changes are flushed first so they are included. Without
+    company_ids every company is refreshed, in primary-key batches, and
+    orphan rows are dropped. Does not commit; returns the rows written.
+    """
+    db.flush()
+    if company_ids is not None:
+        ids = sorted(set(company_ids))
+        return sum(
+            _refresh_summary_batch(db, ids[start : start + batch_size])
+            for start in range(0, len(ids), batch_size)
+        )
+
+    written = 0
+    after_id = 0
+    while True:
+        ids = [
+            company_id
+            for (company_id,) in db.query(models.Company.id)
+            .filter(models.Company.id > after_id)
+            .order_by(models.Company.id.asc())
+            .limit(batch_size)
+        ]
+        if not ids:
+            break
+        written += _refresh_summary_batch(db, ids)
+        after_id = ids[-1]
+
+    db.query(models.CompanySummary).filter(
+        ~models.CompanySummary.company_id.in_(select(models.Company.id))
+    ).delete(synchronize_session=False)
+    return written
+
+
+def ensure_company_summaries(db: Session) -> int:
+    """
+    Repair company_summaries rows that are missing, orphaned or stale
+
+    Run at startup so a freshly migrated database serves full listings and
+    a row left behind by a crashed write stops serving old ratings. Copied
+    columns are compared with one join over companies; derived counts are
+    left to rebuild_company_summaries.py. Returns the rows written.
+    """
+    company = models.Company
+    summary = models.CompanySummary
+    differs = [
+        (
+            func.coalesce(
+                getattr(company, column), SUMMARY_NULL_DEFAULTS[column]
+            ).is_distinct_from(getattr(summary, column))
+            if column in SUMMARY_NULL_DEFAULTS
+            else getattr(company, column).is_distinct_from(getattr(summary, column))
+        )
+        for column in COMPANY_SUMMARY_COLUMNS
+        if column != "created_at"  # never changes after insert
+    ]
+    stale = [
+        company_id
+        for (company_id,) in db.query(company.id)
+        .outerjoin(summary, summary.company_id == company.id)
+        .filter(or_(summary.company_id.is_(None), *differs))
+    ]
+    orphans = (
+        db.query(summary)
+        .filter(~summary.company_id.in_(select(company.id)))
+        .delete(synchronize_session=False)
+    )
+    if not stale and not orphans:
+        return 0
+    written = refresh_company_summaries(db, stale)
+    db.commit()
+    return written
+
+
+# ==================== CHANGE FEED ====================
+# Write functions call record_changes() before committing, so a change and
+# its change_log row commit or roll back together. Creations are logged as
+# op="insert", later changes as "upsert", removals as "delete".
+
+# Sequence numbers are assigned at insert, so a slower transaction may still
+# commit a smaller seq: a gap in the log holds the feed back until the row
+# after it is this old, after which the missing seqs are taken as rolled back
+CHANGE_FEED_GAP_SECONDS = float(os.getenv("CHANGE_FEED_GAP_SECONDS", "60"))
+# change_log rows scanned per page to find how far the log is complete
+CHANGE_FEED_SCAN_ROWS = 5000
+
+
+# Entity -> (model, response schema, filter of publicly visible rows)
+CHANGE_FEED_ENTITIES = {
+    "company": (
+        models.Company,
+        schemas.CompanyPublic,
+        lambda now: models.Company.is_active == True,
+    ),
+    "job": (models.Job, schemas.JobResponse, live_job_filter),
+    "review": (models.Review, schemas.ReviewResponse, None),
+    "support_organization": (
+        models.SupportOrganization,
+        schemas.SupportOrgResponse,
+        lambda now: models.SupportOrganization.is_active == True,
+    ),
+}
+
+
+def record_changes(db: Session, entity: str, entity_ids: List[int], op="upsert"):
+    """Append change_log rows for entity ids to the open transaction
+
+    op is "insert" for new rows, "upsert" for changes, "delete" for removals.
+    """
+    if not entity_ids:
+        return
+    now = datetime.utcnow()
+    db.execute(
+        insert(models.ChangeLog),
+        [
+            {"entity": entity, "entity_id": entity_id, "op": op, "created_at": now}
+            for entity_id in entity_ids
+        ],
+    )
+
+
+def get_changes(
+    db: Session,
+    since: int = 0,
+    limit: int = 500,
+    entities: Optional[List[str]] = None,
+) -> dict:
+    """
+    Page of the change feed after sequence number since
+
+    Reads up to limit change_log rows and keeps the latest one per entity;
+    upserts carry the entity's current public state, loaded with one IN
+    query per kind. Entities gone or no longer public (inactive companies,
+    expired jobs) are reported as deletes.
+
+    The page stops before the first missing seq younger than
+    CHANGE_FEED_GAP_SECONDS, so a transaction committing after a later one
+    is not skipped unless it commits more than that after the later one.
+    """
+    now = datetime.utcnow()
+    gap_cutoff = now - timedelta(seconds=CHANGE_FEED_GAP_SECONDS)
+
+    # Serve up to the first gap that a transaction may still fill
+    scanned = (
+        db.query(models.ChangeLog.seq, models.ChangeLog.created_at)
+        .filter(models.ChangeLog.seq > since)
+        .order_by(models.ChangeLog.seq.asc())
+        .limit(max(limit, CHANGE_FEED_SCAN_ROWS))
+        .all()
+    )
+    complete_to = since
+    held_back = False
+    for seq, created_at in scanned:
+        if (
+            seq != complete_to + 1
+            and created_at is not None
+            and created_at.replace(tzinfo=None) > gap_cutoff
+        ):
+            held_back = True
+            break
+        complete_to = seq
+
+    query = db.query(models.ChangeLog).filter(
+        models.ChangeLog.seq > since, models.ChangeLog.seq <= complete_to
+    )
+    if entities:
+        query = query.filter(models.ChangeLog.entity.in_(entities))
+    settled = query.order_by(models.ChangeLog.seq.asc()).limit(limit).all()
+    if len(settled) == limit:
+        next_since = settled[-1].seq
+        has_more = True
+    else:
+        # Rows of other entities up to complete_to are skipped over too
+        next_since = complete_to
+        has_more = not held_back and len(scanned) == max(limit, CHANGE_FEED_SCAN_ROWS)
+
+    latest = {}
+    created = set()
+    for row in settled:
+        latest[(row.entity, row.entity_id)] = row
+        if row.op == "insert":
+            created.add((row.entity, row.entity_id))
+
+    current = {}
+    for entity, (model, schema, visible) in CHANGE_FEED_ENTITIES.items():
+        ids = [
+            row.entity_id
+            for (kind, _), row in latest.items()
+            if kind == entity and row.op != "delete"
+        ]
+        if not ids:
+            continue
+        query = db.query(model).filter(model.id.in_(ids))
+        if visible is not None:
+            query = query.filter(visible(now))
+        for obj in query:
+            current[(entity, obj.id)] = schema.model_validate(obj).model_dump(
+                mode="json"
+            )
+
+    changes = [
+        {
+            "seq": row.seq,
+            "entity": row.entity,
+            "id": row.entity_id,
+            "op": "upsert" if key in current else "delete",
+            "created": key in created,
+            "data": current.get(key),
+        }
+        for key, row in sorted(latest.items(), key=lambda item: item[1].seq)
+    ]
+    return {
+        "since": since,
+        "next_since": next_since,
+        # Rows held back behind a gap are served on a later poll
+        "has_more": has_more,
+        "changes": changes,
+    }
@@ -0,0 +1,275 @@
+"""
+Near-duplicate review detection for Korus Worker Platform
+MinHash signatures over character shingles with an in-memory LSH index
+
+Each API worker holds one index, rebuilt from the database at startup and
+kept current by catching up on new review ids before every check, so
+submission-time lookups are a handful of dict probes.
+
+Batch audit of existing reviews:
+    python dedup.py                 # report near-duplicate clusters
+    python dedup.py --flag          # also mark duplicates (duplicate_of_id)
+"""
+
+import argparse
+import os
+import re
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+# MinHash / LSH configuration: NUM_PERM = LSH_BANDS * LSH_ROWS
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = 4
+SHINGLE_SIZE = 5
+DUPLICATE_THRESHOLD = float(os.getenv("REVIEW_DUPLICATE_THRESHOLD", "0.8"))
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_rng = np.random.RandomState(20240601)
+_PERM_A = _rng.randint(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def shingles(text: str) -> Set[str]:
+    """
+    Character shingles of a normalised comment
+
+    Character (rather than word) shingles keep short comments with a word or
+    two swapped above the threshold.
+    """
+    normalised = " ".join(_TOKEN_RE.findall(text.lower()))
+    if len(normalised) <= SHINGLE_SIZE:
+        return {normalised}
+    return {
+        normalised[i : i + SHINGLE_SIZE]
+        for i in range(len(normalised) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(text: str) -> np.ndarray:
+    """NUM_PERM-value MinHash signature of a comment"""
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles(text)),
+        dtype=np.uint64,
+    )
+    # (a * x + b) mod p for every permutation/shingle pair, then min per row
+    permuted = (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) % (
+        _MERSENNE_PRIME
+    )
+    return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+class DuplicateIndex:
+    """
+    LSH index of review signatures
+
+    A signature is split into LSH_BANDS bands of LSH_ROWS values; reviews
+    sharing any band bucket are candidates, confirmed by their estimated
+    Jaccard similarity.
+    """
+
+    def __init__(self, threshold: float = DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._companies: Dict[int, int] = {}
+        self._buckets: List[Dict[bytes, List[int]]] = [
+            defaultdict(list) for _ in range(LSH_BANDS)
+        ]
+        self._max_review_id = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    @staticmethod
+    def _bands(signature: np.ndarray):
+        for band in range(LSH_BANDS):
+            yield band, signature[band * LSH_ROWS : (band + 1) * LSH_ROWS].tobytes()
+
+    def add(self, review_id: int, company_id: int, text: str):
+        """Index one review"""
+        signature = minhash(text)
+        with self._lock:
+            if review_id in self._signatures:
+                return
+            self._signatures[review_id] = signature
+            self._companies[review_id] = company_id
+            for band, key in self._bands(signature):
+                self._buckets[band][key].append(review_id)
+            self._max_review_id = max(self._max_review_id, review_id)
+
+    def query(
+        self,
+        text: str,
+        company_id: Optional[int] = None,
+        signature: Optional[np.ndarray] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Find indexed reviews similar to text, most similar first
+
+        With company_id, only reviews of that company are considered.
+        """
+        if signature is None:
+            signature = minhash(text)
+        with self._lock:
+            candidates = set()
+            for band, key in self._bands(signature):
+                candidates.update(self._buckets[band].get(key, ()))
+
+            matches = []
+            for review_id in candidates:
+                if company_id is not None and self._companies[review_id] != company_id:
+                    continue
+                score = similarity(signature, self._signatures[review_id])
+                if score >= self.threshold:
+                    matches.append((review_id, score))
+        return sorted(matches, key=lambda match: (-match[1], match[0]))
+
+    def catch_up(self, db, batch_size: int = 1000) -> int:
+        """
+        Index reviews created since the last load (including by other workers)
+
+        One primary-key range query; returns how many reviews were added.
+        """
+        import models
+
+        added = 0
+        while True:
+            with self._lock:
+                last_id = self._max_review_id
+            rows = (
+                db.query(
+                    models.Review.id, models.Review.company_id, models.Review.comment
+                )
+                .filter(models.Review.id > last_id)
+                .order_by(models.Review.id.asc())
+                .limit(batch_size)
+                .all()
+            )
+            for review_id, company_id, comment in rows:
+                self.add(review_id, company_id, comment)
+            added += len(rows)
+            if len(rows) < batch_size:
+                return added
+
+    def rebuild(self, db) -> int:
+        """Drop everything and index all reviews"""
+        with self._lock:
+            self._signatures.clear()
+            self._companies.clear()
+            for bucket in self._buckets:
+                bucket.clear()
+            self._max_review_id = 0
+        return self.catch_up(db)
+
+    def clusters(self) -> List[List[int]]:
+        """
+        Groups of near-duplicate reviews within the same company
+
+        Each cluster is sorted by review id, so the first one is the original.
+        """
+        parent: Dict[int, int] = {}
+
+        def find(x: int) -> int:
+            while parent.get(x, x) != x:
+                parent[x] = parent.get(parent[x], parent[x])
+                x = parent[x]
+            return x
+
+        with self._lock:
+            for bucket in self._buckets:
+                for review_ids in bucket.values():
+                    if len(review_ids) < 2:
+                        continue
+                    for i, a in enumerate(review_ids):
+                        for b in review_ids[i + 1 :]:
+                            if self._companies[a] != self._companies[b]:
+                                continue
+                            if find(a) == find(b):
+                                continue
+                            if (
+                                similarity(self._signatures[a], self._signatures[b])
+                                >= self.threshold
+                            ):
+                                parent.setdefault(a, a)
+                                parent.setdefault(b, b)
+                                parent[find(b)] = find(a)
+
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for review_id in parent:
+            groups[find(review_id)].append(review_id)
+        return sorted(
+            (sorted(group) for group in groups.values() if len(group) > 1),
+            key=lambda group: group[0],
+        )
+
+
+# Per-process index used by the API
+review_index = DuplicateIndex()
+
+
+def find_duplicate(db, company_id: int, text: str) -> Optional[Tuple[int, float]]:
+    """
+    Check a new comment against the company's existing reviews
+
+    Returns (review_id, similarity) of the closest near-duplicate, or None.
+    """
+    review_index.catch_up(db)
+    matches = review_index.query(text, company_id=company_id)
+    return matches[0] if matches else None
+
+
+def main():
+    """Audit existing reviews for near-duplicate clusters"""
+    parser = argparse.ArgumentParser(description="Audit near-duplicate reviews")
+    parser.add_argument(
+        "--threshold", type=float, default=DUPLICATE_THRESHOLD, help="Min similarity"
+    )
+    parser.add_argument(
+        "--flag",
+        action="store_true",
+        help="Set duplicate_of_id on every review but the first in each cluster",
+    )
+    args = parser.parse_args()
+
+    import crud
+    import invalidation_bus
+    from database import SessionLocal
+
+    print("=" * 60)
+    print("🔍 Korus Collective Voice- Duplicate Review Audit")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        index = DuplicateIndex(threshold=args.threshold)
+        indexed = index.rebuild(db)
+        clusters = index.clusters()
+        print(f"ℹ️  Indexed {indexed} reviews, found {len(clusters)} clusters\n")
+
+        for cluster in clusters:
+            company_id = index._companies[cluster[0]]
+            print(f"   - company {company_id}: reviews {cluster}")
+
+        if args.flag and clusters:
+            flagged = crud.flag_duplicate_reviews(db, clusters)
+            invalidation_bus.flush()
+            print(f"\n✅ Flagged {flagged} duplicate reviews")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
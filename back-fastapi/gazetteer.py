@@ -0,0 +1,139 @@
+"""
+Offline geocoding for Korus Worker Platform
+Resolves an address to city-level coordinates from a bundled gazetteer
+
+Used when imported support organizations have no latitude/longitude. The
+gazetteer (data/gazetteer_fr.csv, or GAZETTEER_PATH) lists one row per
+postcode with its city and coordinates; lookups try the exact postcode,
+then the city name, then the department (first two postcode digits, whose
+first row is the prefecture). No external service is called.
+"""
+
+import csv
+import os
+import re
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional
+
+from support_directory import normalize
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+GAZETTEER_PATH = os.getenv("GAZETTEER_PATH", os.path.join(DATA_DIR, "gazetteer_fr.csv"))
+
+_POSTCODE_RE = re.compile(r"\b(\d{5})\b")
+# Longest city name, in words, tried by find_in_text
+MAX_CITY_WORDS = 4
+
+
+class Place(NamedTuple):
+    """One gazetteer entry"""
+
+    postcode: str
+    city: str
+    latitude: float
+    longitude: float
+
+
+def city_key(city: str) -> str:
+    """Comparable city name ("Saint-Étienne" -> "saint etienne")"""
+    return " ".join(re.findall(r"\w+", normalize(city)))
+
+
+class Gazetteer:
+    """Postcode, department and city indexes over the gazetteer rows"""
+
+    def __init__(self, places):
+        self.by_postcode: Dict[str, Place] = {}
+        self.by_department: Dict[str, Place] = {}
+        self.by_city: Dict[str, Place] = {}
+        for place in places:
+            self.by_postcode.setdefault(place.postcode, place)
+            self.by_department.setdefault(place.postcode[:2], place)
+            self.by_city.setdefault(city_key(place.city), place)
+
+    @classmethod
+    def from_csv(cls, path: str) -> "Gazetteer":
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls(
+                Place(
+                    row["postcode"].strip(),
+                    row["city"].strip(),
+                    float(row["latitude"]),
+                    float(row["longitude"]),
+                )
+                for row in csv.DictReader(f)
+            )
+
+    def __len__(self) -> int:
+        return len(self.by_postcode)
+
+    def lookup(
+        self,
+        address: Optional[str] = None,
+        city: Optional[str] = None,
+        postcode: Optional[str] = None,
+    ) -> Optional[Place]:
+        """
+        Best match for a postcode/city, falling back to the address text
+
+        "10 Boulevard de la Libération, 13001 Marseille" matches on 13001;
+        an unknown postcode in a known department resolves to the prefecture.
+        """
+        if not postcode and address:
+            match = _POSTCODE_RE.search(address)
+            postcode = match.group(1) if match else None
+        postcode = (postcode or "").strip()
+
+        if postcode in self.by_postcode:
+            return self.by_postcode[postcode]
+        if city and city_key(city) in self.by_city:
+            return self.by_city[city_key(city)]
+        if address:
+            # "..., 69007 Lyon, France": try each comma-separated part
+            for part in reversed(address.split(",")):
+                key = city_key(_POSTCODE_RE.sub("", part))
+                if key in self.by_city:
+                    return self.by_city[key]
+        if len(postcode) == 5:
+            return self.by_department.get(postcode[:2])
+        return None
+
+    def find_in_text(self, text: str) -> Optional[Place]:
+        """
+        First postcode or city named anywhere in free text
+
+        "legal help near saint etienne" matches Saint-Étienne; longer names
+        win over the single words they contain.
+        """
+        match = _POSTCODE_RE.search(text or "")
+        if match:
+            place = self.lookup(postcode=match.group(1))
+            if place is not None:
+                return place
+        words = city_key(text or "").split()
+        for size in range(min(MAX_CITY_WORDS, len(words)), 0, -1):
+            for start in range(len(words) - size + 1):
+                place = self.by_city.get(" ".join(words[start : start + size]))
+                if place is not None:
+                    return place
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_gazetteer() -> Gazetteer:
+    """Bundled gazetteer, loaded on first use"""
+    return Gazetteer.from_csv(GAZETTEER_PATH)
+
+
+def geocode(
+    address: Optional[str] = None,
+    city: Optional[str] = None,
+    postcode: Optional[str] = None,
+) -> Optional[Place]:
+    """City-level coordinates for an address, or None when unknown"""
+    return get_gazetteer().lookup(address=address, city=city, postcode=postcode)
+
+
+def geocode_text(text: str) -> Optional[Place]:
+    """City-level coordinates of the place named in free text"""
+    return get_gazetteer().find_in_text(text)
@@ -0,0 +1,81 @@
+"""
+Locale handling for Korus Worker Platform
+Resolves the response language from ?lang= or the Accept-Language header
+
+Base description columns are written in DEFAULT_LOCALE; other locales are
+stored in the *_translations tables and fall back to the base text.
+"""
+
+import os
+from typing import List, Optional
+
+from fastapi import Header, Query, Response
+
+DEFAULT_LOCALE = os.getenv("DEFAULT_LOCALE", "en")
+SUPPORTED_LOCALES = tuple(
+    locale.strip()
+    for locale in os.getenv("SUPPORTED_LOCALES", "en,fr,es,ar").split(",")
+    if locale.strip()
+)
+
+
+def normalize_locale(value: Optional[str]) -> Optional[str]:
+    """Map a language tag to a supported locale ("fr-CA" -> "fr"), or None"""
+    if not value:
+        return None
+    tag = value.strip().lower().replace("_", "-")
+    if tag in SUPPORTED_LOCALES:
+        return tag
+    primary = tag.split("-", 1)[0]
+    return primary if primary in SUPPORTED_LOCALES else None
+
+
+def parse_accept_language(header: Optional[str]) -> List[str]:
+    """Language tags from an Accept-Language header, by descending q"""
+    if not header:
+        return []
+    weighted = []
+    for position, part in enumerate(header.split(",")):
+        tag, _, params = part.strip().partition(";")
+        if not tag or tag == "*":
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        if quality > 0:
+            weighted.append((-quality, position, tag))
+    return [tag for _, _, tag in sorted(weighted)]
+
+
+def resolve_locale(
+    lang: Optional[str] = None, accept_language: Optional[str] = None
+) -> str:
+    """
+    Pick the response locale
+
+    An explicit lang wins, then the first supported Accept-Language entry,
+    then DEFAULT_LOCALE.
+    """
+    for candidate in [lang, *parse_accept_language(accept_language)]:
+        locale = normalize_locale(candidate)
+        if locale:
+            return locale
+    return DEFAULT_LOCALE
+
+
+def get_locale(
+    response: Response,
+    lang: Optional[str] = Query(
+        None, description="Response language, e.g. fr (overrides Accept-Language)"
+    ),
+    accept_language: Optional[str] = Header(None),
+) -> str:
+    """FastAPI dependency: resolved locale, advertised on the response"""
+    locale = resolve_locale(lang, accept_language)
+    response.headers["Content-Language"] = locale
+    response.headers["Vary"] = "Accept-Language"
+    return locale
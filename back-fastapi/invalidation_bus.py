@@ -0,0 +1,277 @@
+"""
+Cross-worker cache invalidation for Korus Worker Platform
+Broadcasts invalidated cache tags to every API worker through the database
+
+Write paths call invalidate(*tags): this worker's caches go stale at once
+and the tags are queued. Every INVALIDATION_POLL_SECONDS each worker's bus
+thread appends its queue to the cache_invalidations table and replays the
+rows appended by other workers (one primary-key range query), so per-worker
+caches can live long and still converge within about two poll intervals.
+
+Auto-increment ids are allocated at insert, not at commit, so a row can
+become visible after a higher id was already read. Each poll therefore
+re-reads the rows of the last INVALIDATION_SETTLE_SECONDS and replays those
+it has not seen yet; only older rows move the read position forward.
+
+Besides TieredCache entries, per-worker state subscribes to tags with
+subscribe(); scripts running outside the API call flush() before exiting.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import models
+from cache import invalidate_local_tags, invalidate_tags
+from database import SessionLocal
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_BUS_ENABLED = (
+    os.getenv("INVALIDATION_BUS_ENABLED", "true").lower() == "true"
+)
+INVALIDATION_POLL_SECONDS = float(os.getenv("INVALIDATION_POLL_SECONDS", "1"))
+INVALIDATION_RETENTION_SECONDS = int(
+    os.getenv("INVALIDATION_RETENTION_SECONDS", "3600")
+)
+# Longest expected time between a row's insert and its commit
+INVALIDATION_SETTLE_SECONDS = float(os.getenv("INVALIDATION_SETTLE_SECONDS", "10"))
+
+# Tags written per cache_invalidations row, and rows replayed per query
+TAGS_PER_ROW = 500
+RECEIVE_BATCH_SIZE = 500
+PRUNE_INTERVAL_SECONDS = 60
+
+# tag -> callbacks dropping per-worker state derived from it
+_subscribers: Dict[str, List[Callable[[], None]]] = {}
+_subscribers_lock = threading.Lock()
+
+
+def subscribe(callback: Callable[[], None], *tags: str):
+    """Call callback whenever one of tags is invalidated, here or elsewhere"""
+    with _subscribers_lock:
+        for tag in tags:
+            _subscribers.setdefault(tag, []).append(callback)
+
+
+def _notify(tags: Iterable[str]):
+    with _subscribers_lock:
+        callbacks = {callback for tag in tags for callback in _subscribers.get(tag, ())}
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            logger.exception("Invalidation subscriber %r failed", callback)
+
+
+class InvalidationBus:
+    """
+    Background thread publishing this worker's tags and replaying the others'
+
+    Rows carry the writer's origin (hostname:pid) so a worker skips its own.
+    A worker starts reading at the newest settled row present when it first
+    polls. _last_id is the settled read position; rows above it that were
+    already replayed are remembered in _seen_ids until they settle.
+    Counters: published (tags written), received (tags replayed), errors.
+    """
+
+    def __init__(
+        self,
+        interval: float = INVALIDATION_POLL_SECONDS,
+        settle_seconds: float = INVALIDATION_SETTLE_SECONDS,
+    ):
+        self.interval = interval
+        self.settle_seconds = settle_seconds
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        self._pending: Set[str] = set()
+        self._last_id: Optional[int] = None
+        self._seen_ids: Set[int] = set()
+        self._pruned_at = 0.0
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(("published", "received", "errors"), 0)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self, tags: Iterable[str]):
+        """Queue tags for the other workers"""
+        with self._lock:
+            self._pending.update(tags)
+
+    def start(self):
+        """Start the bus thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # uvicorn workers are separate processes: take this one's pid
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="invalidation-bus", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Publish what is queued, then stop the bus thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._tick()
+            self._stop_event.wait(self.interval)
+        self.flush()
+
+    def _tick(self):
+        db = SessionLocal()
+        try:
+            if self._last_id is None:
+                self._last_id = (
+                    db.query(func.max(models.CacheInvalidation.id))
+                    .filter(
+                        models.CacheInvalidation.created_at < self._settled_before()
+                    )
+                    .scalar()
+                    or 0
+                )
+            self._write(db)
+            self._receive(db)
+            if time.monotonic() - self._pruned_at > PRUNE_INTERVAL_SECONDS:
+                self._prune(db)
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._counts["errors"] += 1
+            logger.exception("Invalidation bus poll failed")
+        finally:
+            db.close()
+
+    def _write(self, db: Session):
+        with self._lock:
+            tags, self._pending = sorted(self._pending), set()
+        if not tags:
+            return
+        try:
+            now = datetime.utcnow()
+            for start in range(0, len(tags), TAGS_PER_ROW):
+                db.add(
+                    models.CacheInvalidation(
+                        origin=self.origin,
+                        tags="\n".join(tags[start : start + TAGS_PER_ROW]),
+                        created_at=now,
+                    )
+                )
+            db.commit()
+        except Exception:
+            # Keep the tags for the next attempt
+            self.publish(tags)
+            raise
+        with self._lock:
+            self._counts["published"] += len(tags)
+
+    def _settled_before(self) -> datetime:
+        return datetime.utcnow() - timedelta(seconds=self.settle_seconds)
+
+    def _receive(self, db: Session):
+        settled_before = self._settled_before()
+        cursor = last_settled = self._last_id
+        while True:
+            rows = (
+                db.query(
+                    models.CacheInvalidation.id,
+                    models.CacheInvalidation.origin,
+                    models.CacheInvalidation.tags,
+                    models.CacheInvalidation.created_at,
+                )
+                .filter(models.CacheInvalidation.id > cursor)
+                .order_by(models.CacheInvalidation.id.asc())
+                .limit(RECEIVE_BATCH_SIZE)
+                .all()
+            )
+            tags = {
+                tag
+                for row_id, origin, row_tags, _ in rows
+                if origin != self.origin and row_id not in self._seen_ids
+                for tag in row_tags.split("\n")
+            }
+            if tags:
+                invalidate_local_tags(*tags)
+                _notify(tags)
+                with self._lock:
+                    self._counts["received"] += len(tags)
+            for row_id, _, _, created_at in rows:
+                self._seen_ids.add(row_id)
+                # Lower ids were inserted earlier still, so they are committed
+                if created_at is not None and created_at < settled_before:
+                    last_settled = row_id
+            if rows:
+                cursor = rows[-1][0]
+            if len(rows) < RECEIVE_BATCH_SIZE:
+                break
+        self._last_id = last_settled
+        self._seen_ids = {row_id for row_id in self._seen_ids if row_id > last_settled}
+
+    def _prune(self, db: Session):
+        cutoff = datetime.utcnow() - timedelta(seconds=INVALIDATION_RETENTION_SECONDS)
+        db.query(models.CacheInvalidation).filter(
+            models.CacheInvalidation.created_at < cutoff
+        ).delete(synchronize_session=False)
+        db.commit()
+        self._pruned_at = time.monotonic()
+
+    def flush(self):
+        """Write queued tags now (scripts call this before exiting)"""
+        db = SessionLocal()
+        try:
+            self._write(db)
+        except Exception:
+            db.rollback()
+            logger.exception("Invalidation bus publish failed")
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        """Counters, queued tags, the settled read position and rows above it"""
+        with self._lock:
+            return {
+                **self._counts,
+                "pending": len(self._pending),
+                "last_id": self._last_id,
+                "unsettled": len(self._seen_ids),
+                "running": self._thread is not None and self._thread.is_alive(),
+            }
+
+
+# Per-process bus, started by the API lifespan
+bus = InvalidationBus()
+
+
+def invalidate(*tags: str):
+    """
+    Make everything derived from tags stale in every worker
+
+    TieredCache entries (and the shared tier) go stale at once, subscribers
+    of this worker are called now and those of other workers when their bus
+    replays the tags.
+    """
+    invalidate_tags(*tags)
+    _notify(tags)
+    if INVALIDATION_BUS_ENABLED:
+        bus.publish(tags)
+
+
+def flush():
+    """Publish queued tags without waiting for the bus thread"""
+    if INVALIDATION_BUS_ENABLED:
+        bus.flush()
+
+
+def stats() -> dict:
+    """Counters of this worker's bus"""
+    return bus.stats()
@@ -0,0 +1,92 @@
+"""
+Job expiry sweeper for Korus Worker Platform
+Periodically deactivates job listings whose expires_at has passed
+
+Runs as a background thread inside each API worker, or once from the
+command line (e.g. from cron): python job_sweeper.py
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+import crud
+import invalidation_bus
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Sweeper configuration
+JOB_SWEEP_INTERVAL_SECONDS = int(os.getenv("JOB_SWEEP_INTERVAL_SECONDS", "300"))
+JOB_SWEEP_BATCH_SIZE = int(os.getenv("JOB_SWEEP_BATCH_SIZE", "500"))
+JOB_SWEEP_ENABLED = os.getenv("JOB_SWEEP_ENABLED", "true").lower() == "true"
+
+
+def sweep_expired_jobs(batch_size: int = JOB_SWEEP_BATCH_SIZE) -> int:
+    """
+    Run one sweep over expired jobs and return how many were deactivated
+    """
+    db = SessionLocal()
+    try:
+        return crud.deactivate_expired_jobs(db, batch_size=batch_size)
+    finally:
+        db.close()
+
+
+class JobExpirySweeper:
+    """
+    Background thread that calls sweep_expired_jobs every interval
+
+    Every uvicorn worker runs its own sweeper; the batched UPDATE only
+    touches rows that are still active, so overlapping sweeps are harmless.
+    """
+
+    def __init__(
+        self,
+        interval: int = JOB_SWEEP_INTERVAL_SECONDS,
+        batch_size: int = JOB_SWEEP_BATCH_SIZE,
+    ):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the sweeper thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="job-expiry-sweeper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Signal the sweeper thread to stop and wait for it"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                deactivated = sweep_expired_jobs(self.batch_size)
+                if deactivated:
+                    logger.info("Deactivated %d expired jobs", deactivated)
+            except Exception:
+                logger.exception("Job expiry sweep failed")
+            self._stop_event.wait(self.interval)
+
+
+def main():
+    """Run a single sweep"""
+    deactivated = sweep_expired_jobs()
+    # Tell the API workers now; this process has no bus thread
+    invalidation_bus.flush()
+    print(f"✅ Deactivated {deactivated} expired jobs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""
+Live review and rating events for Korus Worker Platform
+Server-sent events fed from the change log
+
+While a worker has SSE clients, its hub thread polls crud.get_changes for
+reviews and companies every LIVE_EVENTS_POLL_SECONDS, so writes committed
+by any worker are seen, and fans the resulting events out to the clients
+whose company filter matches:
+
+- review: a new review (schemas.LiveReview; job_id hidden when anonymous)
+- rating: a company's ratings changed (schemas.LiveRating)
+- resync: the client fell behind and events were dropped
+
+Each client has a queue of LIVE_EVENTS_BUFFER events. A client too slow to
+drain it never blocks the hub or other clients: its backlog is replaced by
+one resync event, after which it should catch up from
+GET /api/changes?since=<data.since> and keep streaming.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import FrozenSet, List, NamedTuple, Optional, Set
+
+import crud
+import models
+import schemas
+from database import ReadSessionLocal
+from sqlalchemy import func
+
+logger = logging.getLogger(__name__)
+
+LIVE_EVENTS_POLL_SECONDS = float(os.getenv("LIVE_EVENTS_POLL_SECONDS", "1"))
+LIVE_EVENTS_BUFFER = int(os.getenv("LIVE_EVENTS_BUFFER", "100"))
+LIVE_EVENTS_MAX_CLIENTS = int(os.getenv("LIVE_EVENTS_MAX_CLIENTS", "500"))
+LIVE_EVENTS_HEARTBEAT_SECONDS = float(os.getenv("LIVE_EVENTS_HEARTBEAT_SECONDS", "15"))
+
+EVENT_TYPES = ("review", "rating")
+
+# Last known ratings are remembered for this many companies; a company
+# outside them gets its baseline from its first change, without an event
+RATING_MEMORY = 10000
+
+
+def rating_values(rating: schemas.LiveRating) -> tuple:
+    """What a rating event is about: everything but the company name"""
+    return tuple(rating.model_dump(exclude={"company_name"}).values())
+
+
+class LiveEvent(NamedTuple):
+    """One event; seq is the change_log position it came from"""
+
+    seq: int
+    type: str
+    company_id: Optional[int]
+    data: dict
+
+    def encode(self) -> str:
+        """Server-sent events wire format"""
+        data = json.dumps(self.data, separators=(",", ":"))
+        return f"id: {self.seq}\nevent: {self.type}\ndata: {data}\n\n"
+
+
+class TooManyClientsError(Exception):
+    """The worker already streams to LIVE_EVENTS_MAX_CLIENTS clients"""
+
+
+class Subscriber:
+    """
+    One SSE client: its filters and bounded queue
+
+    offer() runs on the client's event loop; last_seq is the seq of the last
+    event the stream delivered, or the hub position when it subscribed.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        company_ids: Optional[FrozenSet[int]],
+        types: FrozenSet[str],
+        maxsize: int = LIVE_EVENTS_BUFFER,
+    ):
+        self.loop = loop
+        self.company_ids = company_ids
+        self.types = types
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.last_seq = 0
+        self.dropped = 0
+        self.resyncs = 0
+
+    def wants(self, event: LiveEvent) -> bool:
+        return event.type in self.types and (
+            self.company_ids is None or event.company_id in self.company_ids
+        )
+
+    def offer(self, event: LiveEvent):
+        """Queue event; on overflow replace the backlog with a resync event"""
+        if not self.queue.full():
+            self.queue.put_nowait(event)
+            return
+        # A resync still queued is merged: the client resumes from its since
+        resync = {"dropped": 0, "since": self.last_seq}
+        dropped = 1
+        while not self.queue.empty():
+            queued = self.queue.get_nowait()
+            if queued.type == "resync":
+                resync = dict(queued.data)
+            else:
+                dropped += 1
+        if resync["dropped"] == 0:
+            self.resyncs += 1
+        self.dropped += dropped
+        resync["dropped"] += dropped
+        self.queue.put_nowait(LiveEvent(event.seq, "resync", None, resync))
+
+
+class LiveEventHub:
+    """
+    Per-worker fan-out of change-log events to SSE subscribers
+
+    The hub thread starts with the first subscriber and only queries the
+    database while there are subscribers; after an idle period it starts
+    again from the newest change rather than replaying the backlog.
+    """
+
+    def __init__(self, interval: float = LIVE_EVENTS_POLL_SECONDS):
+        self.interval = interval
+        self._subscribers: Set[Subscriber] = set()
+        self._since: Optional[int] = None
+        self._ratings: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # dropped and resyncs of disconnected clients; live ones are added in stats
+        self._counts = dict.fromkeys(("events", "errors", "dropped", "resyncs"), 0)
+
+    def subscribe(
+        self,
+        company_ids: Optional[FrozenSet[int]] = None,
+        types: FrozenSet[str] = frozenset(EVENT_TYPES),
+    ) -> Subscriber:
+        """Register a client of the running event loop"""
+        subscriber = Subscriber(asyncio.get_running_loop(), company_ids, types)
+        with self._lock:
+            if len(self._subscribers) >= LIVE_EVENTS_MAX_CLIENTS:
+                raise TooManyClientsError()
+            # A resync before the first event resumes from here, not from 0
+            subscriber.last_seq = self._since or 0
+            self._subscribers.add(subscriber)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="live-events", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        """Remove a client, keeping its counters"""
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+                self._counts["dropped"] += subscriber.dropped
+                self._counts["resyncs"] += subscriber.resyncs
+
+    def _run(self):
+        while True:
+            with self._lock:
+                idle = not self._subscribers
+            if idle:
+                self._since = None
+                self._wake.clear()
+                self._wake.wait()
+                continue
+            try:
+                self.poll()
+            except Exception:
+                with self._lock:
+                    self._counts["errors"] += 1
+                logger.exception("Live event poll failed")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def poll(self):
+        """Publish events for changes since the last poll"""
+        db = ReadSessionLocal()
+        try:
+            if self._since is None:
+                since = db.query(func.max(models.ChangeLog.seq)).scalar() or 0
+                self._load_ratings(db)
+                with self._lock:
+                    self._since = since
+                    for subscriber in self._subscribers:
+                        if subscriber.last_seq == 0:
+                            subscriber.last_seq = since
+                return
+            while True:
+                page = crud.get_changes(
+                    db, since=self._since, entities=["review", "company"]
+                )
+                self._since = page["next_since"]
+                self._publish(self._events(page["changes"]))
+                if not page["has_more"]:
+                    return
+        finally:
+            db.close()
+
+    def _load_ratings(self, db):
+        """Baseline ratings of the most recently updated companies"""
+        columns = [
+            models.Company.id if name == "company_id" else getattr(models.Company, name)
+            for name in schemas.LiveRating.model_fields
+        ]
+        rows = (
+            db.query(*columns)
+            .order_by(models.Company.updated_at.desc(), models.Company.id.desc())
+            .limit(RATING_MEMORY)
+            .all()
+        )
+        self._ratings.clear()
+        for row in reversed(rows):
+            rating = schemas.LiveRating.model_validate(
+                dict(zip(schemas.LiveRating.model_fields, row))
+            )
+            self._ratings[rating.company_id] = rating_values(rating)
+
+    def _events(self, changes: List[dict]) -> List[LiveEvent]:
+        events = []
+        for change in changes:
+            if change["op"] != "upsert":
+                continue
+            data = change["data"]
+            if change["entity"] == "review":
+                # Other review changes are votes or classification
+                if not change["created"]:
+                    continue
+                review = schemas.LiveReview.model_validate(data)
+                if review.is_anonymous:
+                    review.job_id = None
+                events.append(
+                    LiveEvent(
+                        change["seq"],
+                        "review",
+                        review.company_id,
+                        review.model_dump(mode="json"),
+                    )
+                )
+            else:
+                rating = schemas.LiveRating.model_validate(
+                    {**data, "company_id": change["id"]}
+                )
+                values = rating_values(rating)
+                previous = self._ratings.get(rating.company_id)
+                self._ratings[rating.company_id] = values
+                self._ratings.move_to_end(rating.company_id)
+                if len(self._ratings) > RATING_MEMORY:
+                    self._ratings.popitem(last=False)
+                # No baseline: the change may not have touched the ratings
+                if previous is None or previous == values:
+                    continue
+                events.append(
+                    LiveEvent(
+                        change["seq"], "rating", rating.company_id, rating.model_dump()
+                    )
+                )
+        return events
+
+    def _publish(self, events: List[LiveEvent]):
+        if not events:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self._counts["events"] += len(events)
+        for subscriber in subscribers:
+            for event in events:
+                if not subscriber.wants(event):
+                    continue
+                try:
+                    subscriber.loop.call_soon_threadsafe(subscriber.offer, event)
+                except RuntimeError:
+                    # Event loop closed: the client is gone
+                    self.unsubscribe(subscriber)
+                    break
+
+    def stats(self) -> dict:
+        """Events published, events dropped by slow clients, connected clients"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            counts = dict(self._counts)
+        counts["dropped"] += sum(sub.dropped for sub in subscribers)
+        counts["resyncs"] += sum(sub.resyncs for sub in subscribers)
+        return {**counts, "clients": len(subscribers), "since": self._since}
+
+
+# Per-process hub used by the API
+hub = LiveEventHub()
+
+
+async def stream(subscriber: Subscriber, is_disconnected):
+    """
+    SSE body for one subscriber, with heartbeats
+
+    is_disconnected is the request's coroutine function; the subscriber is
+    removed when the client goes away.
+    """
+    try:
+        # Reconnect after 3 seconds if the connection drops
+        yield "retry: 3000\n\n"
+        while not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(
+                    subscriber.queue.get(), LIVE_EVENTS_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            subscriber.last_seq = event.seq
+            yield event.encode()
+    finally:
+        hub.unsubscribe(subscriber)
@@ -1,38 +1,297 @@
-from datetime import timedelta
-from typing import Any, List
+import io
+import logging
+import os
+import threading
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from typing import List, Optional
 
 import auth
+import bot
+import cache
+import contract_scanner
 import crud
+import gazetteer
+import i18n
+import invalidation_bus
+import live_events
 import models
+import rate_limit
 import schemas
-from database import engine, get_db
-from fastapi import Depends, FastAPI, HTTPException, status
+import singleflight
+import support_directory
+import support_import
+from cache import TTLCache
+from database import (
+    DATABASE_REPLICA_URLS,
+    READ_PRIMARY_COOKIE,
+    READ_PRIMARY_STICKY_SECONDS,
+    SHARED_READS,
+    ReadSessionLocal,
+    SessionLocal,
+    get_db,
+    warm_pools,
+)
+from classification_worker import REVIEW_CLASSIFY_ENABLED, ReviewClassificationWorker
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from invalidation_bus import INVALIDATION_BUS_ENABLED
+from job_sweeper import JOB_SWEEP_ENABLED, JobExpirySweeper
+from sqlalchemy.orm import Session, configure_mappers
 
-# Create database tables
-# models.Base.metadata.create_all(bind=engine)
+# Heavy modules (numpy-backed classifier, dedup and scoring, the database
+# engine, passlib) are imported or built lazily, so `import main` stays cheap;
+# python test_import_time.py guards the budget.
 
-app = FastAPI(
-    title="Korus Collective VoiceAPI",
-    description="API for migrant Collective Voice with company authentication",
-    version="1.0.0",
-)
+job_sweeper = JobExpirySweeper()
+review_classifier = ReviewClassificationWorker()
 
-# CORS middleware for React frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:3001"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Response caches (per worker)
+DASHBOARD_CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", "30"))
+dashboard_cache = TTLCache(ttl_seconds=DASHBOARD_CACHE_TTL, name="dashboard")
+
+# Both aggregate companies: drop them on any company or review write
+invalidation_bus.subscribe(dashboard_cache.clear, crud.PLATFORM_TAG)
+invalidation_bus.subscribe(bot.company_summary_cache.clear, crud.PLATFORM_TAG)
+
+# Warm-up state behind /health/ready
+WARMUP_RETRY_SECONDS = int(os.getenv("WARMUP_RETRY_SECONDS", "5"))
+warmed_up = threading.Event()
+_shutting_down = threading.Event()
+
+
+def warm_up():
+    """
+    Prepare this worker before it reports ready
+
+    Opens pool connections, configures ORM mappers, builds the duplicate
+    review and company search indexes, repairs missing or stale
+    company_summaries rows and primes the statistics, dashboard and support
+    organization caches. Retries until it succeeds or the app
+    shuts down.
+    """
+    import classifier
+    import company_search
+    import dedup
+
+    while not _shutting_down.is_set():
+        try:
+            warm_pools()
+            configure_mappers()
+
+            db = SessionLocal()
+            try:
+                dedup.review_index.rebuild(db)
+                crud.ensure_company_summaries(db)
+            finally:
+                db.close()
+
+            db = ReadSessionLocal()
+            try:
+                company_search.company_index.rebuild(db)
+                crud.get_platform_statistics(db)
+                build_dashboard(db)
+                support_directory.get_directory(db)
+            finally:
+                db.close()
+
+            auth.get_pwd_context()
+            if REVIEW_CLASSIFY_ENABLED:
+                classifier.get_model()
+
+            warmed_up.set()
+            logger.info("Worker warmed up")
+            return
+        except Exception:
+            logger.exception(
+                "Warm-up failed, retrying in %d seconds", WARMUP_RETRY_SECONDS
+            )
+            _shutting_down.wait(WARMUP_RETRY_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up in the background and run per-worker background jobs"""
+    _shutting_down.clear()
+    warmed_up.clear()
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+    if JOB_SWEEP_ENABLED:
+        job_sweeper.start()
+    if REVIEW_CLASSIFY_ENABLED:
+        review_classifier.start()
+    if INVALIDATION_BUS_ENABLED:
+        invalidation_bus.bus.start()
+
+    yield
+
+    _shutting_down.set()
+    job_sweeper.stop()
+    review_classifier.stop()
+    invalidation_bus.bus.stop()
+
+
+# ==================== READ SESSIONS ====================
+
+
+def get_read_db(request: Request):
+    """
+    Read-only session dependency for public GET endpoints
+
+    Uses a replica when DATABASE_REPLICA_URLS is set, except for clients
+    that wrote recently (read-your-writes, see ReadYourWritesMiddleware) or
+    that send X-Read-Primary: 1. Other clients' sessions are marked as
+    SHARED_READS, so their identical concurrent reads are coalesced.
+    """
+    read_primary = bool(
+        request.cookies.get(READ_PRIMARY_COOKIE)
+        or request.headers.get("x-read-primary") == "1"
+    )
+    if not DATABASE_REPLICA_URLS or read_primary:
+        db = SessionLocal()
+    else:
+        db = ReadSessionLocal()
+    db.info[SHARED_READS] = not read_primary
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pin a client to the primary for a few seconds after a successful write
+
+    Successful non-GET requests get a short-lived cookie that get_read_db
+    honours, so e.g. the review list reloaded after create_review shows the
+    new review even when replicas lag. Does nothing without replicas.
+    """
+
+    SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not DATABASE_REPLICA_URLS
+            or scope["method"] in self.SAFE_METHODS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = (
+                    f"{READ_PRIMARY_COOKIE}=1; Max-Age={READ_PRIMARY_STICKY_SECONDS}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"set-cookie", cookie.encode("latin-1")),
+                    ],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def create_app() -> FastAPI:
+    """
+    Build the API application
+
+    uvicorn main:app (or uvicorn --factory main:create_app) calls this once
+    per worker; importing main alone does not build the app.
+    """
+    app = FastAPI(
+        title="Korus Collective VoiceAPI",
+        description="API for migrant Collective Voice with company authentication",
+        version="1.0.0",
+        lifespan=lifespan,
+    )
+
+    # Per-IP rate limits for abuse-prone routes (added first so CORS wraps 429s)
+    app.add_middleware(rate_limit.RateLimitMiddleware)
+
+    # Keep clients on the primary database briefly after they write
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    # CORS middleware for React frontend
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:3000", "http://localhost:3001"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.include_router(router)
+    return app
+
+
+router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+logger = logging.getLogger(__name__)
+
+
+# ==================== HEALTH ENDPOINTS ====================
 
-@app.get("/")
+
+@router.get("/health/live")
+def health_live():
+    """Liveness probe: the process is serving requests"""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+def health_ready():
+    """Readiness probe: 503 until this worker has warmed up"""
+    if not warmed_up.is_set():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Warming up"
+        )
+    return {"status": "ready"}
+
+
+@router.get("/api/metrics", dependencies=[Depends(auth.require_admin)])
+def get_metrics():
+    """
+    Counters of the worker serving the request (admin key required)
+
+    - **single_flight**: per crud read function, calls, executions and
+      calls coalesced into another request's in-flight query
+    - **caches**: per named cache, hits (by tier), misses and size
+    - **invalidation_bus**: cache tags published to and replayed from
+      other workers
+    - **live_events**: SSE clients, events pushed and events dropped for
+      slow clients
+    """
+    return {
+        "pid": os.getpid(),
+        "single_flight": singleflight.stats(),
+        "caches": cache.stats(),
+        "invalidation_bus": invalidation_bus.stats(),
+        "live_events": live_events.hub.stats(),
+    }
+
+
+@router.get("/")
 def read_root():
     """Root endpoint"""
     return {
@@ -45,7 +304,7 @@ def read_root():
 # ==================== AUTHENTICATION ENDPOINTS ====================
 
 
-@app.post(
+@router.post(
     "/api/auth/register",
     response_model=schemas.CompanyResponse,
     status_code=status.HTTP_201_CREATED,
@@ -73,7 +332,7 @@ def register_company(company: schemas.CompanyCreate, db: Session = Depends(get_d
     return new_company
 
 
-@app.post("/api/auth/login", response_model=schemas.Token)
+@router.post("/api/auth/login", response_model=schemas.Token)
 def login_company(
     form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
 ):
@@ -82,6 +341,12 @@ def login_company(
 
     Returns JWT access token for authenticated requests
     """
+    # Per-account budget on top of the per-IP one, against credential stuffing
+    rate_limit.enforce(
+        f"login:email:{form_data.username.strip().lower()}",
+        rate_limit.LOGIN_EMAIL_BUDGET,
+    )
+
     company = auth.authenticate_company(db, form_data.username, form_data.password)
     if not company:
         raise HTTPException(
@@ -104,7 +369,7 @@ def login_company(
     }
 
 
-@app.get("/api/auth/me", response_model=schemas.CompanyResponse)
+@router.get("/api/auth/me", response_model=schemas.CompanyResponse)
 def get_current_company_info(
     current_company: models.Company = Depends(auth.get_current_company),
 ):
@@ -116,8 +381,27 @@ def get_current_company_info(
 
 # ==================== DASHBOARD ENDPOINTS ====================
 
-@app.get("/api/dashboard")
-def get_dashboard_data(db: Session = Depends(get_db)) -> dict[str, Any]:
+
+def build_dashboard(db: Session) -> schemas.DashboardData:
+    """Build the dashboard payload and cache it for DASHBOARD_CACHE_TTL"""
+    dashboard = schemas.DashboardData.model_validate(
+        {
+            "companies": crud.get_companies(db, skip=0, limit=100),
+            "jobs": crud.get_jobs(db, skip=0, limit=200),
+            "reviews": crud.get_reviews(db, skip=0, limit=200),
+            "support_organizations": support_directory.get_directory(db)
+            .search(limit=200)
+            .items,
+            "statistics": crud.get_platform_statistics(db),
+        },
+        from_attributes=True,
+    )
+    dashboard_cache.set("dashboard", dashboard)
+    return dashboard
+
+
+@router.get("/api/dashboard", response_model=schemas.DashboardData)
+def get_dashboard_data(db: Session = Depends(get_read_db)):
     """
     Aggregated data for the main dashboard:
     - companies
@@ -126,47 +410,183 @@ def get_dashboard_data(db: Session = Depends(get_db)) -> dict[str, Any]:
     - support organizations
     - platform statistics
     """
-    companies = crud.get_companies(db, skip=0, limit=100)
-    jobs = crud.get_jobs(db, skip=0, limit=200)
-    reviews = crud.get_reviews(db, skip=0, limit=200)
-    support_orgs = crud.get_support_organizations(db, skip=0, limit=200)
-    stats = crud.get_platform_statistics(db)
+    return dashboard_cache.get("dashboard") or build_dashboard(db)
 
-    return {
-        "companies": companies,
-        "jobs": jobs,
-        "reviews": reviews,
-        "support_organizations": support_orgs,
-        "statistics": stats,
-    }
+
+# ==================== LOCALIZATION ====================
+
+
+def localize(db: Session, kind: str, items: list, schema, locale: str) -> list:
+    """
+    Swap in translated descriptions for locale, falling back to the base text
+
+    Returns schema instances for translated items (the ORM objects are left
+    untouched) and the original objects otherwise.
+    """
+    if locale == i18n.DEFAULT_LOCALE or not items:
+        return items
+    descriptions = crud.get_translated_descriptions(
+        db, kind, [item.id for item in items], locale
+    )
+    return [
+        (
+            schema.model_validate(item).model_copy(
+                update={"description": descriptions[item.id]}
+            )
+            if item.id in descriptions
+            else item
+        )
+        for item in items
+    ]
+
+
+def check_translation_locale(locale: str) -> str:
+    """Validate the locale of a translation write"""
+    if locale not in i18n.SUPPORTED_LOCALES or locale == i18n.DEFAULT_LOCALE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported translation locale, expected one of: "
+            + ", ".join(l for l in i18n.SUPPORTED_LOCALES if l != i18n.DEFAULT_LOCALE),
+        )
+    return locale
 
 
 # ==================== COMPANY ENDPOINTS ====================
 
 
-@app.get("/api/companies", response_model=List[schemas.CompanyPublic])
-def get_all_companies(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.get("/api/companies", response_model=List[schemas.CompanyListItem])
+def get_all_companies(
+    skip: int = 0,
+    limit: int = 100,
+    industry: Optional[str] = None,
+    country: Optional[str] = None,
+    verified: Optional[bool] = None,
+    min_rating: Optional[float] = None,
+    min_lat: Optional[float] = None,
+    max_lat: Optional[float] = None,
+    min_lng: Optional[float] = None,
+    max_lng: Optional[float] = None,
+    sort: str = "id",
+    locale: str = Depends(i18n.get_locale),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get all companies (public information only), from company_summaries
+
+    - **industry** / **country** / **verified**: exact-match filters
+    - **min_rating**: minimum overall rating
+    - **min_lat** / **max_lat** / **min_lng** / **max_lng**: map bounding box
+    - **sort**: one of id, rating, trust, reviews, name, newest, jobs (live
+      job count), recent (reviews in the last days), last_review
+    - **lang** / Accept-Language: description language
+    """
+    if sort not in crud.COMPANY_SORT_OPTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sort option, expected one of: "
+            + ", ".join(crud.COMPANY_SORT_OPTIONS),
+        )
+
+    companies = crud.get_companies(
+        db,
+        skip=skip,
+        limit=limit,
+        industry=industry,
+        country=country,
+        verified=verified,
+        min_rating=min_rating,
+        min_lat=min_lat,
+        max_lat=max_lat,
+        min_lng=min_lng,
+        max_lng=max_lng,
+        sort=sort,
+    )
+    return localize(db, "company", companies, schemas.CompanyListItem, locale)
+
+
+@router.get("/api/companies/search", response_model=List[schemas.CompanySuggestion])
+def search_companies(
+    q: str = Query(..., min_length=2, max_length=255),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_read_db),
+):
     """
-    Get all companies (public information only)
+    Fuzzy company search for autocomplete
+
+    Matches name and location while tolerating typos and missing accents
+    ("netoyage lyon"); results are ranked by **score** (0-1).
     """
-    companies = crud.get_companies(db, skip=skip, limit=limit)
-    return companies
+    import company_search  # numpy-backed, imported on first use
+
+    return [
+        schemas.CompanySuggestion(
+            id=company.id,
+            company_name=company.company_name,
+            industry=company.industry,
+            location=company.location,
+            overall_rating=company.overall_rating or 0.0,
+            total_reviews=company.total_reviews or 0,
+            score=score,
+        )
+        for company, score in company_search.search_companies(db, q, limit=limit)
+    ]
 
 
-@app.get("/api/companies/{company_id}", response_model=schemas.CompanyPublic)
-def get_company(company_id: int, db: Session = Depends(get_db)):
+@router.get("/api/companies/{company_id}", response_model=schemas.CompanyPublic)
+def get_company(
+    company_id: int,
+    locale: str = Depends(i18n.get_locale),
+    db: Session = Depends(get_read_db),
+):
     """
     Get specific company by ID (public information)
     """
+    company = crud.get_company_public(db, company_id=company_id)
+    if company is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Company not found"
+        )
+    return localize(db, "company", [company], schemas.CompanyPublic, locale)[0]
+
+
+@router.get("/api/companies/{company_id}/full", response_model=schemas.CompanyFull)
+def get_company_full(
+    company_id: int,
+    jobs_limit: int = Query(20, ge=0, le=100),
+    reviews_skip: int = Query(0, ge=0),
+    reviews_limit: int = Query(20, ge=0, le=100),
+    locale: str = Depends(i18n.get_locale),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get everything the company page needs in one request
+
+    - **company**: public company information
+    - **jobs**: live job listings, newest first (up to jobs_limit)
+    - **reviews**: one page of the latest reviews (reviews_skip / reviews_limit)
+    - **statistics**: same payload as /api/statistics/company/{id}
+    """
     company = crud.get_company(db, company_id=company_id)
     if company is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Company not found"
         )
-    return company
+
+    jobs = crud.get_jobs_by_company(db, company_id=company_id, limit=jobs_limit)
+    reviews = crud.get_reviews_by_company(
+        db, company_id=company_id, skip=reviews_skip, limit=reviews_limit
+    )
+    statistics = crud.get_company_statistics(db, company_id=company_id)
+
+    return {
+        "company": localize(db, "company", [company], schemas.CompanyPublic, locale)[0],
+        "jobs": localize(db, "job", jobs, schemas.JobResponse, locale),
+        "reviews": reviews,
+        "statistics": statistics,
+    }
 
 
-@app.put("/api/companies/me", response_model=schemas.CompanyResponse)
+@router.put("/api/companies/me", response_model=schemas.CompanyResponse)
 def update_company_profile(
     company_update: schemas.CompanyUpdate,
     current_company: models.Company = Depends(auth.get_current_company),
@@ -181,7 +601,7 @@ def update_company_profile(
     return updated_company
 
 
-@app.delete("/api/companies/me", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/api/companies/me", status_code=status.HTTP_204_NO_CONTENT)
 def delete_company_account(
     current_company: models.Company = Depends(auth.get_current_company),
     db: Session = Depends(get_db),
@@ -193,29 +613,99 @@ def delete_company_account(
     return None
 
 
+@router.get(
+    "/api/companies/{company_id}/translations",
+    response_model=List[schemas.TranslationResponse],
+)
+def get_company_translations(company_id: int, db: Session = Depends(get_read_db)):
+    """
+    Get the stored description translations of a company
+    """
+    return crud.get_translations(db, "company", company_id)
+
+
+@router.put(
+    "/api/companies/me/translations/{locale}",
+    response_model=schemas.TranslationResponse,
+)
+def set_company_translation(
+    locale: str,
+    translation: schemas.TranslationUpdate,
+    current_company: models.Company = Depends(auth.get_current_company),
+    db: Session = Depends(get_db),
+):
+    """
+    Set the current company's description in another language
+    """
+    check_translation_locale(locale)
+    return crud.set_translation(
+        db, "company", current_company.id, locale, translation.description
+    )
+
+
+@router.delete(
+    "/api/companies/me/translations/{locale}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def delete_company_translation(
+    locale: str,
+    current_company: models.Company = Depends(auth.get_current_company),
+    db: Session = Depends(get_db),
+):
+    """
+    Delete one of the current company's description translations
+    """
+    if not crud.delete_translation(db, "company", current_company.id, locale):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Translation not found"
+        )
+    return None
+
+
 # ==================== REVIEW ENDPOINTS ====================
 
 
-@app.get("/api/reviews", response_model=List[schemas.ReviewResponse])
+@router.get("/api/reviews", response_model=List[schemas.ReviewResponse])
 def get_all_reviews(
     skip: int = 0,
     limit: int = 100,
     company_id: int = None,
-    db: Session = Depends(get_db),
+    sentiment: Optional[str] = None,
+    is_abusive: Optional[bool] = None,
+    db: Session = Depends(get_read_db),
 ):
     """
     Get all reviews, optionally filtered by company
+
+    - **sentiment**: positive, neutral or negative (classified reviews only)
+    - **is_abusive**: false hides comments flagged as abusive or spam
     """
+    import classifier
+
+    if sentiment is not None and sentiment not in classifier.SENTIMENT_LABELS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sentiment, expected one of: "
+            + ", ".join(classifier.SENTIMENT_LABELS),
+        )
+
     if company_id:
         reviews = crud.get_reviews_by_company(
-            db, company_id=company_id, skip=skip, limit=limit
+            db,
+            company_id=company_id,
+            skip=skip,
+            limit=limit,
+            sentiment=sentiment,
+            is_abusive=is_abusive,
         )
     else:
-        reviews = crud.get_reviews(db, skip=skip, limit=limit)
+        reviews = crud.get_reviews(
+            db, skip=skip, limit=limit, sentiment=sentiment, is_abusive=is_abusive
+        )
     return reviews
 
 
-@app.post(
+@router.post(
     "/api/reviews",
     response_model=schemas.ReviewResponse,
     status_code=status.HTTP_201_CREATED,
@@ -224,7 +714,27 @@ def create_review(review: schemas.ReviewCreate, db: Session = Depends(get_db)):
     """
     Create a new review (anonymous or verified employee)
     """
+    return submit_review(db, review)
+
+
+def submit_review(db: Session, review: schemas.ReviewCreate) -> models.Review:
+    """Rate-limit, reject near-duplicates, store and rescore the company"""
+    import dedup
+
+    rate_limit.enforce(
+        f"review:company:{review.company_id}", rate_limit.REVIEW_COMPANY_BUDGET
+    )
+
+    # Reject near-duplicates of an existing review for the same company
+    duplicate = dedup.find_duplicate(db, review.company_id, review.comment)
+    if duplicate is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A very similar review has already been submitted for this company",
+        )
+
     new_review = crud.create_review(db=db, review=review)
+    dedup.review_index.add(new_review.id, new_review.company_id, new_review.comment)
 
     # Update company ratings
     crud.update_company_ratings(db=db, company_id=review.company_id)
@@ -232,8 +742,8 @@ def create_review(review: schemas.ReviewCreate, db: Session = Depends(get_db)):
     return new_review
 
 
-@app.get("/api/reviews/{review_id}", response_model=schemas.ReviewResponse)
-def get_review(review_id: int, db: Session = Depends(get_db)):
+@router.get("/api/reviews/{review_id}", response_model=schemas.ReviewResponse)
+def get_review(review_id: int, db: Session = Depends(get_read_db)):
     """
     Get specific review by ID
     """
@@ -248,15 +758,16 @@ def get_review(review_id: int, db: Session = Depends(get_db)):
 # ==================== JOB ENDPOINTS ====================
 
 
-@app.get("/api/jobs", response_model=List[schemas.JobResponse])
+@router.get("/api/jobs", response_model=List[schemas.JobResponse])
 def get_all_jobs(
     skip: int = 0,
     limit: int = 100,
     company_id: int = None,
-    db: Session = Depends(get_db),
+    locale: str = Depends(i18n.get_locale),
+    db: Session = Depends(get_read_db),
 ):
     """
-    Get all job listings, optionally filtered by company
+    Get all live job listings (active and not expired), optionally filtered by company
     """
     if company_id:
         jobs = crud.get_jobs_by_company(
@@ -264,10 +775,10 @@ def get_all_jobs(
         )
     else:
         jobs = crud.get_jobs(db, skip=skip, limit=limit)
-    return jobs
+    return localize(db, "job", jobs, schemas.JobResponse, locale)
 
 
-@app.post(
+@router.post(
     "/api/jobs", response_model=schemas.JobResponse, status_code=status.HTTP_201_CREATED
 )
 def create_job(
@@ -289,8 +800,12 @@ def create_job(
     return new_job
 
 
-@app.get("/api/jobs/{job_id}", response_model=schemas.JobResponse)
-def get_job(job_id: int, db: Session = Depends(get_db)):
+@router.get("/api/jobs/{job_id}", response_model=schemas.JobResponse)
+def get_job(
+    job_id: int,
+    locale: str = Depends(i18n.get_locale),
+    db: Session = Depends(get_read_db),
+):
     """
     Get specific job by ID
     """
@@ -299,10 +814,10 @@ def get_job(job_id: int, db: Session = Depends(get_db)):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
         )
-    return job
+    return localize(db, "job", [job], schemas.JobResponse, locale)[0]
 
 
-@app.put("/api/jobs/{job_id}", response_model=schemas.JobResponse)
+@router.put("/api/jobs/{job_id}", response_model=schemas.JobResponse)
 def update_job(
     job_id: int,
     job_update: schemas.JobUpdate,
@@ -328,7 +843,7 @@ def update_job(
     return updated_job
 
 
-@app.delete("/api/jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/api/jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_job(
     job_id: int,
     current_company: models.Company = Depends(auth.get_current_company),
@@ -353,28 +868,233 @@ def delete_job(
     return None
 
 
+@router.get(
+    "/api/jobs/{job_id}/translations",
+    response_model=List[schemas.TranslationResponse],
+)
+def get_job_translations(job_id: int, db: Session = Depends(get_read_db)):
+    """
+    Get the stored description translations of a job listing
+    """
+    return crud.get_translations(db, "job", job_id)
+
+
+@router.put(
+    "/api/jobs/{job_id}/translations/{locale}",
+    response_model=schemas.TranslationResponse,
+)
+def set_job_translation(
+    job_id: int,
+    locale: str,
+    translation: schemas.TranslationUpdate,
+    current_company: models.Company = Depends(auth.get_current_company),
+    db: Session = Depends(get_db),
+):
+    """
+    Set a job listing's description in another language (owner only)
+    """
+    check_translation_locale(locale)
+    job = crud.get_job(db, job_id=job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+
+    if job.company_id != current_company.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only translate your own job listings",
+        )
+
+    return crud.set_translation(db, "job", job_id, locale, translation.description)
+
+
+@router.delete(
+    "/api/jobs/{job_id}/translations/{locale}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def delete_job_translation(
+    job_id: int,
+    locale: str,
+    current_company: models.Company = Depends(auth.get_current_company),
+    db: Session = Depends(get_db),
+):
+    """
+    Delete one of a job listing's description translations (owner only)
+    """
+    job = crud.get_job(db, job_id=job_id)
+    if job is None or job.company_id != current_company.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+
+    if not crud.delete_translation(db, "job", job_id, locale):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Translation not found"
+        )
+    return None
+
+
 # ==================== SUPPORT ORGANIZATION ENDPOINTS ====================
 
 
-@app.get("/api/support-organizations", response_model=List[schemas.SupportOrgResponse])
+def search_support_organizations(
+    db: Session,
+    locale: str,
+    org_type: Optional[str] = None,
+    service: Optional[str] = None,
+    language: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> support_directory.DirectoryPage:
+    """Filter the in-memory directory and localize the page"""
+    page = support_directory.get_directory(db).search(
+        type=org_type, service=service, language=language, skip=skip, limit=limit
+    )
+    return page._replace(
+        items=localize(
+            db, "support_organization", page.items, schemas.SupportOrgResponse, locale
+        )
+    )
+
+
+@router.get(
+    "/api/support-organizations", response_model=List[schemas.SupportOrgResponse]
+)
 def get_all_support_organizations(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    org_type: Optional[str] = Query(None, alias="type"),
+    service: Optional[str] = None,
+    language: Optional[str] = None,
+    locale: str = Depends(i18n.get_locale),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get all support organizations
+
+    - **type**: organization type, e.g. Legal Aid (case-insensitive)
+    - **service**: words that must appear in the services, e.g. legal
+    - **language**: supported language, name or code (ar, arabic)
     """
-    support_orgs = crud.get_support_organizations(db, skip=skip, limit=limit)
-    return support_orgs
+    return search_support_organizations(
+        db, locale, org_type, service, language, skip, limit
+    ).items
 
 
-@app.get(
+@router.get(
+    "/api/support-organizations/directory",
+    response_model=schemas.SupportOrgDirectory,
+)
+def get_support_organization_directory(
+    skip: int = 0,
+    limit: int = 100,
+    org_type: Optional[str] = Query(None, alias="type"),
+    service: Optional[str] = None,
+    language: Optional[str] = None,
+    locale: str = Depends(i18n.get_locale),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Search support organizations with facet counts
+
+    Same filters as /api/support-organizations; also returns the total
+    number of matches and type/services/languages counts among them.
+    """
+    return search_support_organizations(
+        db, locale, org_type, service, language, skip, limit
+    )._asdict()
+
+
+@router.get(
     "/api/support-organizations/{org_id}", response_model=schemas.SupportOrgResponse
 )
-def get_support_organization(org_id: int, db: Session = Depends(get_db)):
+def get_support_organization(
+    org_id: int,
+    locale: str = Depends(i18n.get_locale),
+    db: Session = Depends(get_read_db),
+):
     """
     Get specific support organization by ID
     """
     org = crud.get_support_organization(db, org_id=org_id)
+    if org is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Support organization not found",
+        )
+    return localize(
+        db, "support_organization", [org], schemas.SupportOrgResponse, locale
+    )[0]
+
+
+@router.post(
+    "/api/support-organizations",
+    response_model=schemas.SupportOrgResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(auth.require_admin)],
+)
+def create_support_organization(
+    org: schemas.SupportOrgCreate, db: Session = Depends(get_db)
+):
+    """
+    Create a support organization (admin key required)
+    """
+    return crud.create_support_organization(db=db, org=org)
+
+
+@router.post(
+    "/api/support-organizations/import",
+    response_model=schemas.SupportOrgImportReport,
+    dependencies=[Depends(auth.require_admin)],
+)
+def import_support_organizations(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(
+        None, pattern="^(csv|ndjson)$", description="Default: from the file name"
+    ),
+    dry_run: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk import support organizations from CSV or NDJSON (admin key required)
+
+    Rows are validated one by one and rejected rows are reported with their
+    line number; missing coordinates are geocoded from the bundled gazetteer
+    and organizations with the same name and address are skipped.
+    """
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return support_import.import_organizations(
+            db,
+            support_import.read_rows(
+                stream, format or support_import.detect_format(file.filename)
+            ),
+            dry_run=dry_run,
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Import files must be UTF-8 encoded",
+        )
+    finally:
+        stream.detach()
+
+
+@router.put(
+    "/api/support-organizations/{org_id}",
+    response_model=schemas.SupportOrgResponse,
+    dependencies=[Depends(auth.require_admin)],
+)
+def update_support_organization(
+    org_id: int,
+    org_update: schemas.SupportOrgUpdate,
+    db: Session = Depends(get_db),
+):
+    """
+    Update a support organization (admin key required)
+    """
+    org = crud.update_support_organization(db, org_id=org_id, org_update=org_update)
     if org is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -383,32 +1103,378 @@ def get_support_organization(org_id: int, db: Session = Depends(get_db)):
     return org
 
 
+@router.delete(
+    "/api/support-organizations/{org_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(auth.require_admin)],
+)
+def delete_support_organization(org_id: int, db: Session = Depends(get_db)):
+    """
+    Deactivate a support organization (admin key required)
+
+    The row is kept and can be restored with PUT {"is_active": true}.
+    """
+    if not crud.deactivate_support_organization(db, org_id=org_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Support organization not found",
+        )
+    return None
+
+
+@router.get(
+    "/api/support-organizations/{org_id}/translations",
+    response_model=List[schemas.TranslationResponse],
+)
+def get_support_organization_translations(
+    org_id: int, db: Session = Depends(get_read_db)
+):
+    """
+    Get the stored description translations of a support organization
+    """
+    return crud.get_translations(db, "support_organization", org_id)
+
+
+@router.put(
+    "/api/support-organizations/{org_id}/translations/{locale}",
+    response_model=schemas.TranslationResponse,
+    dependencies=[Depends(auth.require_admin)],
+)
+def set_support_organization_translation(
+    org_id: int,
+    locale: str,
+    translation: schemas.TranslationUpdate,
+    db: Session = Depends(get_db),
+):
+    """
+    Set a support organization's description in another language (admin key
+    required)
+    """
+    check_translation_locale(locale)
+    if crud.get_support_organization(db, org_id=org_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Support organization not found",
+        )
+    return crud.set_translation(
+        db, "support_organization", org_id, locale, translation.description
+    )
+
+
+@router.delete(
+    "/api/support-organizations/{org_id}/translations/{locale}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(auth.require_admin)],
+)
+def delete_support_organization_translation(
+    org_id: int, locale: str, db: Session = Depends(get_db)
+):
+    """
+    Delete one of a support organization's description translations (admin
+    key required)
+    """
+    if not crud.delete_translation(db, "support_organization", org_id, locale):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Translation not found"
+        )
+    return None
+
+
+# ==================== BOT ENDPOINTS ====================
+
+
+@router.get(
+    "/api/bot/support-organizations/nearest",
+    response_model=schemas.BotNearbyResponse,
+)
+def bot_nearest_support_organizations(
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lng: Optional[float] = Query(None, ge=-180, le=180),
+    near: Optional[str] = Query(
+        None, max_length=255, description="City, postcode or free text naming one"
+    ),
+    org_type: Optional[str] = Query(None, alias="type"),
+    service: Optional[str] = None,
+    language: Optional[str] = None,
+    limit: int = Query(3, ge=1, le=bot.BOT_MAX_RESULTS),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Nearest support organizations for the chatbot
+
+    Takes coordinates (lat, lng) or a place (near), geocoded offline from
+    the bundled gazetteer. Served from the in-memory directory.
+    """
+    if lat is not None and lng is not None:
+        origin = f"{lat:.4f}, {lng:.4f}"
+    elif near:
+        place = gazetteer.geocode_text(near)
+        if place is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Unknown place"
+            )
+        lat, lng, origin = place.latitude, place.longitude, place.city
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide lat and lng, or near",
+        )
+
+    results = support_directory.get_directory(db).nearest(
+        lat, lng, limit=limit, type=org_type, service=service, language=language
+    )
+    return bot.render_nearby(origin, results)
+
+
+@router.get("/api/bot/companies/summary", response_model=schemas.BotCompanySummary)
+def bot_company_summary(
+    name: str = Query(..., min_length=2, max_length=255),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Rating summary of the company best matching name (exact, prefix, fuzzy)
+    """
+    summary = bot.get_company_summary(db, name)
+    if summary is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Company not found"
+        )
+    return summary
+
+
+@router.post("/api/bot/contracts/scan", response_model=schemas.BotContractScan)
+def bot_scan_contract(file: UploadFile = File(...)):
+    """
+    Flag risky clauses in an employment contract PDF
+
+    Text is extracted page by page and matched against a multilingual clause
+    dictionary; results are cached by document hash (**cached**), so a
+    forwarded contract is answered without parsing it again.
+    """
+    try:
+        result, cached = contract_scanner.scan_pdf(file.file)
+    except contract_scanner.ContractTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e)
+        )
+    except contract_scanner.ContractScanError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return bot.render_contract_scan(result, cached)
+
+
+@router.post(
+    "/api/bot/reviews",
+    response_model=schemas.BotReviewResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def bot_create_review(review: schemas.BotReviewCreate, db: Session = Depends(get_db)):
+    """
+    Submit a review through the chatbot, by company id or name
+
+    Goes through the same duplicate check and rescoring as POST /api/reviews.
+    """
+    if review.company_id is not None:
+        company = crud.get_company(db, company_id=review.company_id)
+    elif review.company_name:
+        company = bot.find_company(db, review.company_name.strip())
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide company_id or company_name",
+        )
+    if company is None or not company.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Company not found"
+        )
+
+    if review.user_ref:
+        rate_limit.enforce(
+            f"review:bot_user:{review.user_ref}", rate_limit.BOT_USER_REVIEW_BUDGET
+        )
+
+    new_review = submit_review(
+        db,
+        schemas.ReviewCreate(
+            company_id=company.id,
+            rating_work_conditions=review.rating_work_conditions,
+            rating_pay=review.rating_pay,
+            rating_treatment=review.rating_treatment,
+            rating_safety=review.rating_safety,
+            comment=review.comment,
+            employee_token=review.employee_token,
+        ),
+    )
+    bot.invalidate_company_summary(company.company_name)
+
+    text = f"Thank you, your review of {company.company_name} has been recorded."
+    if new_review.verified_employee:
+        text += " It is marked as a verified employee review."
+    return schemas.BotReviewResponse(
+        id=new_review.id,
+        company_id=company.id,
+        verified_employee=new_review.verified_employee,
+        text=text,
+    )
+
+
 # ==================== STATISTICS ENDPOINTS ====================
 
 
-@app.get("/api/statistics/platform")
-def get_platform_statistics(db: Session = Depends(get_db)):
+@router.get("/api/statistics/platform")
+def get_platform_statistics(db: Session = Depends(get_read_db)):
     """
     Get overall platform statistics
     """
     return crud.get_platform_statistics(db)
 
 
-@app.get("/api/statistics/company/{company_id}")
-def get_company_statistics(company_id: int, db: Session = Depends(get_db)):
+@router.get("/api/statistics/company/{company_id}")
+def get_company_statistics(company_id: int, db: Session = Depends(get_read_db)):
     """
     Get statistics for a specific company
     """
+    statistics = crud.get_company_statistics(db, company_id=company_id)
+    if statistics is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Company not found"
+        )
+    return statistics
+
+
+@router.get(
+    "/api/statistics/company/{company_id}/trends",
+    response_model=schemas.CompanyRatingTrends,
+)
+def get_company_rating_trends(
+    company_id: int,
+    granularity: str = "month",
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get a company's rating series over time
+
+    - **granularity**: day or month (defaults to the last 90 days / 12 months)
+    - **start** / **end**: optional period bounds (YYYY-MM-DD)
+    """
+    if granularity not in crud.RATING_ROLLUPS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid granularity, expected one of: "
+            + ", ".join(crud.RATING_ROLLUPS),
+        )
+
     company = crud.get_company(db, company_id=company_id)
     if company is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Company not found"
         )
 
-    return crud.get_company_statistics(db, company_id=company_id)
+    if start is None:
+        today = datetime.utcnow().date()
+        if granularity == "day":
+            start = today - timedelta(days=90)
+        else:
+            start = crud.month_start(today - timedelta(days=365))
+
+    series = crud.get_company_rating_trends(
+        db, company_id=company_id, granularity=granularity, start=start, end=end
+    )
+    return {"company_id": company_id, "granularity": granularity, "series": series}
+
+
+# ==================== CHANGE FEED ENDPOINTS ====================
+
+
+@router.get("/api/changes", response_model=schemas.ChangeFeed)
+def get_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    entities: Optional[str] = Query(None, max_length=200),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Changes to public companies, jobs, reviews and support organizations
+
+    - **since**: next_since of the previous page (0 for everything)
+    - **entities**: comma-separated subset of company, job, review,
+      support_organization
+
+    Each entity appears once per page with its current public state, or
+    op=delete when it was deleted or is no longer public. Keep the returned
+    next_since and poll with it; when has_more is true, fetch the next page
+    right away.
+    """
+    kinds = None
+    if entities:
+        kinds = [kind.strip() for kind in entities.split(",") if kind.strip()]
+        unknown = set(kinds) - set(crud.CHANGE_FEED_ENTITIES)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown entities: {', '.join(sorted(unknown))}",
+            )
+    return crud.get_changes(db, since=since, limit=limit, entities=kinds)
+
+
+# ==================== LIVE EVENT ENDPOINTS ====================
+
+
+@router.get("/api/live/events")
+async def stream_live_events(
+    request: Request,
+    company_id: Optional[List[int]] = Query(None, max_length=100),
+    types: str = Query("review,rating", max_length=50),
+):
+    """
+    Server-sent events: new reviews and company rating changes
+
+    - **company_id**: only these companies (repeat the parameter); all when
+      omitted
+    - **types**: comma-separated subset of review, rating
+
+    Events are review (anonymous reviews without job_id), rating and
+    resync. A resync means this client fell behind and events were dropped:
+    catch up with GET /api/changes?since=<data.since> and keep reading.
+    Comment lines are sent as heartbeats.
+    """
+    kinds = frozenset(kind.strip() for kind in types.split(",") if kind.strip())
+    if not kinds or not kinds <= set(live_events.EVENT_TYPES):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"types must be a subset of {', '.join(live_events.EVENT_TYPES)}",
+        )
+    try:
+        subscriber = live_events.hub.subscribe(
+            frozenset(company_id) if company_id else None, kinds
+        )
+    except live_events.TooManyClientsError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many live clients, retry later",
+        )
+    return StreamingResponse(
+        live_events.stream(subscriber, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+_app: Optional[FastAPI] = None
+
+
+def __getattr__(name: str):
+    """Build `main.app` on first access (keeps `uvicorn main:app` working)"""
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(create_app(), host="0.0.0.0", port=8000)
@@ -3,14 +3,16 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, synonym
 from sqlalchemy.sql import func
 
 
@@ -63,6 +65,14 @@ class Company(Base):
         "Review", back_populates="company", cascade="all, delete-orphan"
     )
 
+    # The listing is served by company_summaries and its indexes; these back
+    # name lookups, industry means (scoring) and the search index sync
+    __table_args__ = (
+        Index("idx_company_name", "company_name"),
+        Index("idx_industry", "industry"),
+        Index("idx_updated_at", "updated_at"),
+    )
+
 
 class Review(Base):
     """
@@ -92,6 +102,16 @@ class Review(Base):
     # Engagement
     helpful_count = Column(Integer, default=0)
 
+    # Automatic classification (filled in by classification_worker.py)
+    sentiment_score = Column(Float, nullable=True)  # -1 (negative) .. 1 (positive)
+    sentiment_label = Column(String(16), nullable=True)  # positive/neutral/negative
+    abuse_score = Column(Float, nullable=True)
+    is_abusive = Column(Boolean, default=False)
+    classified_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Set by the duplicate audit (dedup.py --flag); excluded from ratings
+    duplicate_of_id = Column(Integer, ForeignKey("reviews.id"), nullable=True)
+
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -100,6 +120,66 @@ class Review(Base):
     company = relationship("Company", back_populates="reviews")
     job = relationship("Job", back_populates="reviews")
 
+    __table_args__ = (
+        Index("idx_reviews_classified_at", "classified_at"),
+        Index("idx_reviews_company_sentiment", "company_id", "sentiment_label"),
+    )
+
+
+class CompanyRatingDaily(Base):
+    """
+    Per-company daily rollup of review ratings (counts and sums)
+    """
+
+    __tablename__ = "company_rating_daily"
+
+    company_id = Column(Integer, ForeignKey("companies.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+
+    review_count = Column(Integer, nullable=False, default=0)
+    verified_count = Column(Integer, nullable=False, default=0)
+    sum_work_conditions = Column(Float, nullable=False, default=0.0)
+    sum_pay = Column(Float, nullable=False, default=0.0)
+    sum_treatment = Column(Float, nullable=False, default=0.0)
+    sum_safety = Column(Float, nullable=False, default=0.0)
+
+
+class CompanyRatingMonthly(Base):
+    """
+    Per-company monthly rollup of review ratings (counts and sums)
+    """
+
+    __tablename__ = "company_rating_monthly"
+
+    company_id = Column(Integer, ForeignKey("companies.id"), primary_key=True)
+    month = Column(Date, primary_key=True)  # First day of the month
+
+    review_count = Column(Integer, nullable=False, default=0)
+    verified_count = Column(Integer, nullable=False, default=0)
+    sum_work_conditions = Column(Float, nullable=False, default=0.0)
+    sum_pay = Column(Float, nullable=False, default=0.0)
+    sum_treatment = Column(Float, nullable=False, default=0.0)
+    sum_safety = Column(Float, nullable=False, default=0.0)
+
+
+class CompanyScoreState(Base):
+    """
+    Per-company time-decayed rating sums used by the trust score engine
+    """
+
+    __tablename__ = "company_score_state"
+
+    company_id = Column(Integer, ForeignKey("companies.id"), primary_key=True)
+    config_key = Column(String(100), nullable=False)  # Engine config the sums use
+    reference_at = Column(DateTime, nullable=False)  # Time the sums are decayed to
+
+    weight_sum = Column(Float, nullable=False, default=0.0)
+    verified_weight_sum = Column(Float, nullable=False, default=0.0)
+    sum_work_conditions = Column(Float, nullable=False, default=0.0)
+    sum_pay = Column(Float, nullable=False, default=0.0)
+    sum_treatment = Column(Float, nullable=False, default=0.0)
+    sum_safety = Column(Float, nullable=False, default=0.0)
+
 
 class Job(Base):
     """
@@ -131,6 +211,14 @@ class Job(Base):
     company = relationship("Company", back_populates="jobs")
     reviews = relationship("Review", back_populates="job")
 
+    # Live-postings index: the listing filters on (is_active, expires_at)
+    # and orders by posted_at, the sweeper scans (is_active, expires_at);
+    # a company's newest postings come from (company_id, posted_at)
+    __table_args__ = (
+        Index("idx_active_expires_posted", "is_active", "expires_at", "posted_at"),
+        Index("idx_company_posted", "company_id", "posted_at"),
+    )
+
 
 class SupportOrganization(Base):
     """
@@ -169,6 +257,53 @@ class SupportOrganization(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
 
+class CompanyTranslation(Base):
+    """
+    Company description in a non-default locale
+    """
+
+    __tablename__ = "company_translations"
+
+    company_id = Column(Integer, ForeignKey("companies.id"), primary_key=True)
+    locale = Column(String(10), primary_key=True)
+    description = Column(Text, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class JobTranslation(Base):
+    """
+    Job description in a non-default locale
+    """
+
+    __tablename__ = "job_translations"
+
+    job_id = Column(Integer, ForeignKey("jobs.id"), primary_key=True)
+    locale = Column(String(10), primary_key=True)
+    description = Column(Text, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class SupportOrganizationTranslation(Base):
+    """
+    Support organization description in a non-default locale
+    """
+
+    __tablename__ = "support_organization_translations"
+
+    organization_id = Column(
+        Integer, ForeignKey("support_organizations.id"), primary_key=True
+    )
+    locale = Column(String(10), primary_key=True)
+    description = Column(Text, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
 class EmployeeToken(Base):
     """
     Employee verification token model
@@ -193,3 +328,118 @@ class EmployeeToken(Base):
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     used_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class CacheInvalidation(Base):
+    """
+    Cache tags invalidated by one API worker, replayed by the others
+
+    Append-only; rows older than INVALIDATION_RETENTION_SECONDS are pruned.
+    """
+
+    __tablename__ = "cache_invalidations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    origin = Column(String(100), nullable=False)  # hostname:pid of the writer
+    tags = Column(Text, nullable=False)  # newline-separated tags
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (Index("idx_cache_invalidations_created_at", "created_at"),)
+
+
+class ChangeLog(Base):
+    """
+    Append-only feed of public entity changes, read by GET /api/changes
+
+    Rows are written by crud in the transaction of the change itself and
+    only name the entity; the feed serves its current state.
+    """
+
+    __tablename__ = "change_log"
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(String(32), nullable=False)  # company, job, review, ...
+    entity_id = Column(Integer, nullable=False)
+    op = Column(String(10), nullable=False)  # insert, upsert or delete
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (Index("idx_change_log_entity_seq", "entity", "seq"),)
+
+
+class CompanySummary(Base):
+    """
+    Denormalized listing row per company, served by GET /api/companies
+
+    Copies the public company columns and adds counts that would otherwise
+    need joins. crud refreshes a company's row in the transaction of every
+    write that affects it; rebuild_company_summaries.py recomputes them all.
+    """
+
+    __tablename__ = "company_summaries"
+
+    company_id = Column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True
+    )
+    id = synonym("company_id")
+
+    # Copied from companies
+    company_name = Column(String(255), nullable=False)
+    industry = Column(String(100), nullable=False)
+    location = Column(String(255), nullable=False)
+    country = Column(String(100), nullable=False)
+    description = Column(Text, nullable=True)
+    website = Column(String(255), nullable=True)
+    overall_rating = Column(Float, nullable=False, default=0.0)
+    total_reviews = Column(Integer, nullable=False, default=0)
+    social_media_score = Column(Float, nullable=False, default=0.0)
+    trust_score = Column(Float, nullable=False, default=0.0)
+    external_platform_score = Column(Float, nullable=False, default=0.0)
+    verified = Column(Boolean, nullable=False, default=False)
+    rating_work_conditions = Column(Float, nullable=False, default=0.0)
+    rating_pay = Column(Float, nullable=False, default=0.0)
+    rating_treatment = Column(Float, nullable=False, default=0.0)
+    rating_safety = Column(Float, nullable=False, default=0.0)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Derived from jobs and reviews
+    active_jobs = Column(Integer, nullable=False, default=0)
+    recent_reviews = Column(Integer, nullable=False, default=0)  # last N days
+    last_review_at = Column(DateTime(timezone=True), nullable=True)
+    refreshed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Covering indexes for the listing: each ends with company_id (in the
+    # sort's tie-break order) so a page of ids is read from the index alone
+    __table_args__ = (
+        Index(
+            "idx_summary_industry_rating",
+            industry,
+            overall_rating.desc(),
+            company_id,
+        ),
+        Index("idx_summary_country_rating", country, overall_rating.desc(), company_id),
+        Index(
+            "idx_summary_country_industry_rating",
+            country,
+            industry,
+            overall_rating.desc(),
+            company_id,
+        ),
+        Index(
+            "idx_summary_verified_rating",
+            verified,
+            overall_rating.desc(),
+            company_id,
+        ),
+        Index("idx_summary_rating", overall_rating.desc(), company_id),
+        Index("idx_summary_trust", trust_score.desc(), company_id),
+        Index("idx_summary_reviews", total_reviews.desc(), company_id),
+        Index("idx_summary_active_jobs", active_jobs.desc(), company_id),
+        Index("idx_summary_recent_reviews", recent_reviews.desc(), company_id),
+        Index("idx_summary_last_review", last_review_at.desc(), company_id),
+        Index("idx_summary_name", company_name, company_id),
+        Index("idx_summary_created", created_at.desc(), company_id),
+        Index("idx_summary_geo", latitude, longitude),
+    )
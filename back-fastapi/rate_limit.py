@@ -0,0 +1,264 @@
+"""
+Rate limiting for Korus Worker Platform
+Token-bucket limits per client IP and per route, plus per-account keys
+
+The default backend keeps buckets in process memory (one set per uvicorn
+worker). Set RATE_LIMIT_REDIS_URL to share sliding-window counters across
+workers through Redis; memory:// uses cache.MemoryStore, a local stand-in
+with the same minimal interface for development and tests. While Redis is
+unreachable, requests are limited by the in-process buckets instead.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from cache import create_shared_store, store_errors
+from fastapi import HTTPException, status
+
+logger = logging.getLogger(__name__)
+
+# Rate limit configuration
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_TRUST_PROXY = os.getenv("RATE_LIMIT_TRUST_PROXY", "true").lower() == "true"
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL")
+# A failing shared store is reported at most once per this many seconds
+RATE_LIMIT_ERROR_LOG_SECONDS = 60
+
+
+class Budget(NamedTuple):
+    """Allow `requests` requests per `seconds`, with bursts up to `requests`"""
+
+    requests: int
+    seconds: float
+
+    @classmethod
+    def parse(cls, value: str) -> "Budget":
+        """Parse a budget written as "<requests>/<seconds>", e.g. "5/60" """
+        requests, seconds = value.split("/")
+        return cls(int(requests), float(seconds))
+
+
+# Per-route budgets, keyed by client IP
+ROUTE_BUDGETS: Dict[Tuple[str, str], Budget] = {
+    ("POST", "/api/reviews"): Budget.parse(os.getenv("RATE_LIMIT_REVIEWS", "5/60")),
+    ("POST", "/api/auth/login"): Budget.parse(os.getenv("RATE_LIMIT_LOGIN", "10/60")),
+    # The chatbot relays many users from one IP; users are limited by user_ref
+    ("POST", "/api/bot/reviews"): Budget.parse(
+        os.getenv("RATE_LIMIT_BOT_REVIEWS", "60/60")
+    ),
+    ("POST", "/api/bot/contracts/scan"): Budget.parse(
+        os.getenv("RATE_LIMIT_BOT_CONTRACT_SCANS", "30/60")
+    ),
+}
+
+# Per-account budgets, enforced inside the endpoints
+LOGIN_EMAIL_BUDGET = Budget.parse(os.getenv("RATE_LIMIT_LOGIN_EMAIL", "5/300"))
+REVIEW_COMPANY_BUDGET = Budget.parse(os.getenv("RATE_LIMIT_REVIEW_COMPANY", "30/60"))
+BOT_USER_REVIEW_BUDGET = Budget.parse(os.getenv("RATE_LIMIT_BOT_USER_REVIEWS", "5/60"))
+
+
+# ==================== BACKENDS ====================
+
+
+class LocalBackend:
+    """
+    In-process token buckets with LRU eviction
+
+    Every hit is O(1): one OrderedDict lookup, move_to_end and at most one
+    popitem. Memory is bounded by max_keys; evicting an idle bucket only
+    forgets a client that would have refilled anyway.
+    """
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, budget: Budget) -> Tuple[bool, float]:
+        """Consume one token; return (allowed, retry_after_seconds)"""
+        rate = budget.requests / budget.seconds
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (budget.requests, now))
+            tokens = min(budget.requests, tokens + (now - updated_at) * rate)
+
+            if tokens >= 1:
+                allowed, retry_after = True, 0.0
+                tokens -= 1
+            else:
+                allowed, retry_after = False, (1 - tokens) / rate
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        return allowed, retry_after
+
+
+class SharedBackend:
+    """
+    Sliding-window counters in a Redis-compatible store
+
+    Uses two fixed windows and weights the previous one by how much of it
+    still overlaps the sliding window, so each hit costs one INCR, one
+    EXPIRE and one GET and all workers see the same counts. When the store
+    raises one of errors, the hit goes to the fallback backend instead.
+    """
+
+    def __init__(
+        self,
+        store,
+        prefix: str = "korus:ratelimit:",
+        fallback: Optional[LocalBackend] = None,
+        errors: tuple = (),
+    ):
+        self.store = store
+        self.prefix = prefix
+        self.fallback = fallback or LocalBackend()
+        self.errors = errors
+        self._error_logged_at = -math.inf
+
+    def hit(self, key: str, budget: Budget) -> Tuple[bool, float]:
+        """Count one request; return (allowed, retry_after_seconds)"""
+        try:
+            return self._hit(key, budget)
+        except self.errors as e:
+            now = time.monotonic()
+            if now - self._error_logged_at >= RATE_LIMIT_ERROR_LOG_SECONDS:
+                self._error_logged_at = now
+                logger.warning(
+                    "Shared rate limit store failed (%s); " "using in-process buckets",
+                    e,
+                )
+            return self.fallback.hit(key, budget)
+
+    def _hit(self, key: str, budget: Budget) -> Tuple[bool, float]:
+        now = time.time()
+        window = int(now // budget.seconds)
+        elapsed = now - window * budget.seconds
+
+        current_key = f"{self.prefix}{key}:{window}"
+        previous_key = f"{self.prefix}{key}:{window - 1}"
+
+        current = self.store.incr(current_key)
+        if current == 1:
+            self.store.expire(current_key, int(math.ceil(budget.seconds * 2)))
+        previous = int(self.store.get(previous_key) or 0)
+
+        weight = 1 - elapsed / budget.seconds
+        estimated = previous * weight + current
+        if estimated <= budget.requests:
+            return True, 0.0
+        return False, budget.seconds - elapsed
+
+
+def create_backend():
+    """Build the shared backend when configured, else the local one"""
+    store = create_shared_store(RATE_LIMIT_REDIS_URL, "RATE_LIMIT_REDIS_URL")
+    if store is None:
+        return LocalBackend()
+    return SharedBackend(store, errors=store_errors())
+
+
+backend = create_backend()
+
+
+# ==================== HELPERS ====================
+
+
+def get_client_ip(scope: dict, headers: Dict[str, str]) -> str:
+    """Client IP, honouring nginx's X-Real-IP when behind the proxy"""
+    if RATE_LIMIT_TRUST_PROXY:
+        real_ip = headers.get("x-real-ip")
+        if real_ip:
+            return real_ip.strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def enforce(key: str, budget: Budget):
+    """
+    Raise 429 when key has used up its budget
+
+    Used by endpoints for keys only known after parsing the request
+    (login email, reviewed company, chatbot user).
+    """
+    if not RATE_LIMIT_ENABLED:
+        return
+    allowed, retry_after = backend.hit(key, budget)
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please try again later",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+# ==================== MIDDLEWARE ====================
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying ROUTE_BUDGETS per client IP
+
+    Pure ASGI (not BaseHTTPMiddleware) so allowed requests pass straight
+    through without buffering the body.
+    """
+
+    def __init__(
+        self,
+        app,
+        budgets: Dict[Tuple[str, str], Budget] = ROUTE_BUDGETS,
+        get_backend: Callable[[], object] = lambda: backend,
+    ):
+        self.app = app
+        self.budgets = budgets
+        self.get_backend = get_backend
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        route = (scope["method"], scope["path"].rstrip("/") or "/")
+        budget = self.budgets.get(route)
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        client_ip = get_client_ip(scope, headers)
+        allowed, retry_after = self.get_backend().hit(
+            f"{route[0]}:{route[1]}:ip:{client_ip}", budget
+        )
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+
+        body = json.dumps(
+            {"detail": "Too many requests, please try again later"}
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_429_TOO_MANY_REQUESTS,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
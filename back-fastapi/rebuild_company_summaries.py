@@ -0,0 +1,51 @@
+"""
+Company summary rebuild script for Korus Worker Platform
+Recomputes the company_summaries listing table from companies, jobs and reviews
+
+Write paths keep the table current; run this after loading data directly
+(e.g. seed_mock_data.py) and daily from cron so recent review counts and
+expired jobs age out.
+
+Usage:
+    python rebuild_company_summaries.py                 # all companies
+    python rebuild_company_summaries.py --company-id 3  # one company
+"""
+
+import argparse
+import sys
+
+import crud
+import invalidation_bus
+from database import SessionLocal
+
+
+def main():
+    """Main rebuild function"""
+    parser = argparse.ArgumentParser(description="Rebuild the company_summaries table")
+    parser.add_argument(
+        "--company-id", type=int, default=None, help="Only rebuild this company"
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🏢 Korus Collective Voice- Company Summary Rebuild")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        company_ids = None if args.company_id is None else [args.company_id]
+        written = crud.refresh_company_summaries(db, company_ids)
+        db.commit()
+        crud.invalidate_company(args.company_id)
+        invalidation_bus.flush()
+        print(f"✅ Rebuilt {written} company summaries")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Rebuild failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Nightly rating recomputation job for Korus Worker Platform
+Recomputes overall_rating, averages, total_reviews and trust_score for every
+company in one pass and writes the changes back in bulk
+
+Usage:
+    python recompute_ratings.py              # recompute and write changes
+    python recompute_ratings.py --dry-run    # only show what would change
+
+Schedule it nightly (e.g. cron: 0 3 * * * python recompute_ratings.py) and
+run it after changing SCORING_* settings or fixing review data.
+"""
+
+import argparse
+import sys
+import time
+
+import crud
+import invalidation_bus
+import models
+from database import SessionLocal
+
+# Differences below this are rounding noise
+TOLERANCE = 0.005
+
+
+def load_current_ratings(db) -> dict:
+    """{company_id: {column: value}} as currently stored"""
+    columns = [getattr(models.Company, name) for name in crud.COMPANY_RATING_COLUMNS]
+    return {
+        company_id: dict(zip(crud.COMPANY_RATING_COLUMNS, values))
+        for company_id, *values in db.query(models.Company.id, *columns)
+    }
+
+
+def diff_ratings(current: dict, recomputed: dict) -> dict:
+    """Companies whose recomputed ratings differ from the stored ones"""
+    changed = {}
+    for company_id, values in recomputed.items():
+        stored = current.get(company_id, {})
+        if any(
+            abs((stored.get(name) or 0) - value) > TOLERANCE
+            for name, value in values.items()
+        ):
+            changed[company_id] = values
+    return changed
+
+
+def main():
+    """Main recomputation function"""
+    parser = argparse.ArgumentParser(description="Recompute all company ratings")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show the changes without writing"
+    )
+    parser.add_argument(
+        "--show", type=int, default=20, help="Max changed companies to print"
+    )
+    parser.add_argument(
+        "--keep-score-state",
+        action="store_true",
+        help="Reuse the stored trust score sums instead of rebuilding them",
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🔄 Korus Collective Voice- Rating Recomputation")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        current = load_current_ratings(db)
+        recomputed = crud.compute_company_ratings(
+            db, rebuild_scores=not args.keep_score_state
+        )
+        changed = diff_ratings(current, recomputed)
+        elapsed = time.perf_counter() - started
+        print(
+            f"ℹ️  Recomputed {len(recomputed)} companies in {elapsed:.2f}s, "
+            f"{len(changed)} changed\n"
+        )
+
+        for company_id in list(changed)[: args.show]:
+            stored = current.get(company_id, {})
+            deltas = ", ".join(
+                f"{name} {stored.get(name) or 0} -> {value}"
+                for name, value in changed[company_id].items()
+                if abs((stored.get(name) or 0) - value) > TOLERANCE
+            )
+            print(f"   - company {company_id}: {deltas}")
+        if len(changed) > args.show:
+            print(f"   ... and {len(changed) - args.show} more")
+
+        if args.dry_run:
+            db.rollback()
+            print("\nℹ️  Dry run: nothing written")
+            return
+
+        written = crud.save_company_ratings(db, changed)
+        db.commit()
+        invalidation_bus.flush()
+        print(f"\n✅ Updated {written} companies")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Recomputation failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, EmailStr, Field, validator
 
@@ -101,6 +101,26 @@ class CompanyPublic(BaseModel):
         from_attributes = True
 
 
+class CompanyListItem(CompanyPublic):
+    """Company in the public listing, with counts from company_summaries"""
+
+    active_jobs: int
+    recent_reviews: int  # last COMPANY_SUMMARY_RECENT_DAYS days
+    last_review_at: Optional[datetime]
+
+
+class CompanySuggestion(BaseModel):
+    """Fuzzy company search match"""
+
+    id: int
+    company_name: str
+    industry: str
+    location: str
+    overall_rating: float
+    total_reviews: int
+    score: float
+
+
 # ==================== AUTHENTICATION SCHEMAS ====================
 
 
@@ -149,6 +169,10 @@ class ReviewResponse(ReviewBase):
     id: int
     verified_employee: bool
     helpful_count: int
+    sentiment_score: Optional[float] = None
+    sentiment_label: Optional[str] = None
+    abuse_score: Optional[float] = None
+    is_abusive: Optional[bool] = None
     created_at: datetime
     updated_at: Optional[datetime]
 
@@ -230,6 +254,52 @@ class SupportOrgCreate(SupportOrgBase):
     languages: Optional[List[str]] = None
 
 
+class SupportOrgUpdate(BaseModel):
+    """Schema for updating a support organization"""
+
+    name: Optional[str] = Field(None, min_length=2, max_length=255)
+    type: Optional[str] = Field(None, min_length=2, max_length=100)
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    address: Optional[str] = Field(None, min_length=5, max_length=500)
+    contact: Optional[str] = Field(None, min_length=5, max_length=100)
+    email: Optional[EmailStr] = None
+    services: Optional[List[str]] = None
+    open_hours: Optional[str] = Field(None, min_length=3, max_length=255)
+    website: Optional[str] = None
+    description: Optional[str] = None
+    languages: Optional[List[str]] = None
+    is_active: Optional[bool] = None
+
+
+class SupportOrgImportRow(SupportOrgCreate):
+    """One imported organization; coordinates may come from the gazetteer"""
+
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
+    city: Optional[str] = None
+    postcode: Optional[str] = None
+
+
+class SupportOrgImportError(BaseModel):
+    """Validation errors of one rejected import row"""
+
+    row: int
+    errors: List[str]
+
+
+class SupportOrgImportReport(BaseModel):
+    """Outcome of a support organization bulk import"""
+
+    received: int
+    created: int
+    geocoded: int
+    skipped: int
+    failed: int
+    dry_run: bool
+    errors: List[SupportOrgImportError]
+
+
 class SupportOrgResponse(SupportOrgBase):
     """Schema for support organization response"""
 
@@ -245,6 +315,140 @@ class SupportOrgResponse(SupportOrgBase):
         from_attributes = True
 
 
+class SupportOrgFacets(BaseModel):
+    """Counts of each value among matching support organizations"""
+
+    type: Dict[str, int]
+    services: Dict[str, int]
+    languages: Dict[str, int]
+
+
+class SupportOrgDirectory(BaseModel):
+    """One page of a support organization search with facet counts"""
+
+    items: List[SupportOrgResponse]
+    total: int
+    facets: SupportOrgFacets
+
+
+# ==================== TRANSLATION SCHEMAS ====================
+
+
+class TranslationUpdate(BaseModel):
+    """Schema for setting a description in another language"""
+
+    description: str = Field(..., min_length=1, max_length=5000)
+
+
+class TranslationResponse(BaseModel):
+    """Schema for a stored description translation"""
+
+    locale: str
+    description: str
+    updated_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+# ==================== CONTRACT SCAN SCHEMAS ====================
+
+
+class ContractFinding(BaseModel):
+    """One kind of risky clause found in a contract"""
+
+    rule: str
+    severity: str
+    description: str
+    phrase: str
+    language: str
+    pages: List[int]
+    occurrences: int
+    excerpt: str
+
+
+class ContractScanResult(BaseModel):
+    """Clause scan of one contract document"""
+
+    sha256: str
+    pages: int
+    scanned_pages: int
+    text_found: bool
+    risk: str
+    findings: List[ContractFinding]
+
+
+# ==================== BOT SCHEMAS ====================
+
+
+class BotSupportOrg(BaseModel):
+    """Support organization entry for the chatbot"""
+
+    id: int
+    name: str
+    type: str
+    distance_km: float
+    address: str
+    contact: str
+    open_hours: str
+    website: Optional[str]
+    text: str
+
+
+class BotNearbyResponse(BaseModel):
+    """Nearest support organizations with a pre-rendered message"""
+
+    origin: str
+    results: List[BotSupportOrg]
+    text: str
+
+
+class BotCompanySummary(BaseModel):
+    """Company rating summary with a pre-rendered message"""
+
+    id: int
+    name: str
+    industry: str
+    location: str
+    overall_rating: float
+    total_reviews: int
+    trust_score: float
+    ratings: Dict[str, float]
+    verified: bool
+    text: str
+
+
+class BotContractScan(ContractScanResult):
+    """Contract scan with a pre-rendered message"""
+
+    cached: bool
+    text: str
+
+
+class BotReviewCreate(BaseModel):
+    """Review submitted through the chatbot, by company id or name"""
+
+    company_id: Optional[int] = None
+    company_name: Optional[str] = Field(None, min_length=2, max_length=255)
+    rating_work_conditions: float = Field(..., ge=1, le=5)
+    rating_pay: float = Field(..., ge=1, le=5)
+    rating_treatment: float = Field(..., ge=1, le=5)
+    rating_safety: float = Field(..., ge=1, le=5)
+    comment: str = Field(..., min_length=20, max_length=5000)
+    employee_token: Optional[str] = None
+    # Opaque per-user reference (e.g. a hashed chat id) for rate limiting
+    user_ref: Optional[str] = Field(None, max_length=128)
+
+
+class BotReviewResponse(BaseModel):
+    """Submitted review id with a pre-rendered confirmation"""
+
+    id: int
+    company_id: int
+    verified_employee: bool
+    text: str
+
+
 # ==================== STATISTICS SCHEMAS ====================
 
 
@@ -273,3 +477,105 @@ class CompanyStatistics(BaseModel):
     rating_breakdown: dict
     recent_reviews: int
     active_jobs: int
+
+
+class RatingTrendPoint(BaseModel):
+    """One period of a company's rating series"""
+
+    period: date
+    review_count: int
+    verified_count: int
+    overall_rating: float
+    rating_work_conditions: float
+    rating_pay: float
+    rating_treatment: float
+    rating_safety: float
+
+
+class CompanyRatingTrends(BaseModel):
+    """Company rating series over time"""
+
+    company_id: int
+    granularity: str
+    series: List[RatingTrendPoint]
+
+
+# ==================== COMPANY DETAIL SCHEMAS ====================
+
+
+class CompanyFull(BaseModel):
+    """Company page payload: profile, live jobs, latest reviews and statistics"""
+
+    company: CompanyPublic
+    jobs: List[JobResponse]
+    reviews: List[ReviewResponse]
+    statistics: CompanyStatistics
+
+
+# ==================== DASHBOARD SCHEMAS ====================
+
+
+class DashboardData(BaseModel):
+    """Main dashboard payload"""
+
+    companies: List[CompanyPublic]
+    jobs: List[JobResponse]
+    reviews: List[ReviewResponse]
+    support_organizations: List[SupportOrgResponse]
+    statistics: PlatformStatistics
+
+
+# ==================== CHANGE FEED SCHEMAS ====================
+
+
+class ChangeEntry(BaseModel):
+    """Latest change of one entity: its public state, or a deletion"""
+
+    seq: int
+    entity: str
+    id: int
+    op: str  # upsert or delete
+    created: bool = False  # the entity was created within this page
+    data: Optional[dict] = None  # CompanyPublic, JobResponse, ... on upsert
+
+
+class ChangeFeed(BaseModel):
+    """One page of the change feed; pass next_since as since for the next"""
+
+    since: int
+    next_since: int
+    has_more: bool
+    changes: List[ChangeEntry]
+
+
+# ==================== LIVE EVENT SCHEMAS ====================
+
+
+class LiveReview(BaseModel):
+    """New review pushed by GET /api/live/events (job_id hidden if anonymous)"""
+
+    id: int
+    company_id: int
+    job_id: Optional[int] = None
+    rating_work_conditions: float
+    rating_pay: float
+    rating_treatment: float
+    rating_safety: float
+    comment: str
+    is_anonymous: bool
+    verified_employee: bool
+    created_at: datetime
+
+
+class LiveRating(BaseModel):
+    """Company ratings pushed by GET /api/live/events when they change"""
+
+    company_id: int
+    company_name: str
+    overall_rating: float
+    total_reviews: int
+    trust_score: float
+    rating_work_conditions: float
+    rating_pay: float
+    rating_treatment: float
+    rating_safety: float
@@ -0,0 +1,490 @@
+"""
+Trust score engine for Korus Worker Platform
+Time-decayed, verification-weighted ratings with Bayesian shrinkage
+
+Every company keeps decayed running sums in company_score_state:
+
+    S_d(t) = sum_i w_i * exp(-lambda * (t - t_i)) * rating_i,d
+    W(t)   = sum_i w_i * exp(-lambda * (t - t_i))
+
+where w_i is the review weight (higher for verified employees) and lambda
+comes from the half-life. A new review updates the sums in O(1) by decaying
+them to its timestamp and adding its weighted ratings. Scores are then
+
+    score_d = (C * industry_mean_d + S_d) / (C + W)
+
+with C the prior strength (pseudo-reviews at the industry mean). After a
+config change, rebuild_state() recomputes every company's sums in one
+vectorized pass over the reviews table.
+
+Engines are registered by name in ENGINES; SCORING_ENGINE picks one.
+"""
+
+import math
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import models
+import numpy as np
+from cache import TTLCache
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+SECONDS_PER_DAY = 86400.0
+RATING_FIELDS = (
+    "rating_work_conditions",
+    "rating_pay",
+    "rating_treatment",
+    "rating_safety",
+)
+SUM_FIELDS = ("sum_work_conditions", "sum_pay", "sum_treatment", "sum_safety")
+
+# Rating used for an industry with no reviewed companies yet
+NEUTRAL_RATING = 3.0
+
+_industry_means_cache = TTLCache(
+    ttl_seconds=float(os.getenv("SCORING_INDUSTRY_CACHE_TTL", "300")),
+    name="industry_means",
+)
+
+
+class ScoringConfig(NamedTuple):
+    """Parameters of a trust scoring engine"""
+
+    half_life_days: Optional[float]  # None disables time decay
+    verified_weight: float  # weight of a verified-employee review (others = 1)
+    prior_strength: float  # pseudo-reviews at the industry mean (0 disables)
+    verification_bonus: float  # added to trust for a fully verified company
+
+    @property
+    def key(self) -> str:
+        """Identifies the config the stored running sums were built with"""
+        return (
+            f"hl={self.half_life_days}|vw={self.verified_weight}|"
+            f"ps={self.prior_strength}|vb={self.verification_bonus}"
+        )
+
+    @property
+    def decay_rate(self) -> float:
+        """lambda, per second"""
+        if not self.half_life_days:
+            return 0.0
+        return math.log(2) / (self.half_life_days * SECONDS_PER_DAY)
+
+
+class ScoreArrays(NamedTuple):
+    """Running sums for n companies, decayed to a common reference time"""
+
+    weight: np.ndarray  # (n,)
+    verified_weight: np.ndarray  # (n,)
+    sums: np.ndarray  # (n, 4) in RATING_FIELDS order
+    industry: np.ndarray  # (n,) integer industry codes
+
+
+# ==================== ENGINES ====================
+
+
+class ScoringEngine:
+    """
+    Default engine: per-review weights, decay and vectorized scoring
+
+    Subclasses can override review_weight(), dimension_scores() or score()
+    to change how reviews become a trust score; the running-sum maintenance
+    is shared.
+    """
+
+    def __init__(self, name: str, config: ScoringConfig):
+        self.name = name
+        self.config = config
+
+    def review_weight(self, verified: bool) -> float:
+        """Weight of one review before decay"""
+        return self.config.verified_weight if verified else 1.0
+
+    def decay(self, seconds) -> np.ndarray:
+        """Decay factor for an age in seconds (scalar or array)"""
+        return np.exp(-self.config.decay_rate * np.maximum(seconds, 0.0))
+
+    def industry_means(self, arrays: ScoreArrays) -> np.ndarray:
+        """(industries, 4) weighted mean rating per industry code"""
+        n_industries = int(arrays.industry.max()) + 1 if len(arrays.industry) else 0
+
+        industry_weight = np.bincount(
+            arrays.industry, weights=arrays.weight, minlength=n_industries
+        )
+        industry_means = np.full((n_industries, 4), NEUTRAL_RATING)
+        for d in range(4):
+            industry_sum = np.bincount(
+                arrays.industry, weights=arrays.sums[:, d], minlength=n_industries
+            )
+            np.divide(
+                industry_sum,
+                industry_weight,
+                out=industry_means[:, d],
+                where=industry_weight > 0,
+            )
+        return industry_means
+
+    def dimension_scores(
+        self, arrays: ScoreArrays, industry_means: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """(n, 4) per-dimension ratings, shrunk toward the industry mean"""
+        prior = self.config.prior_strength
+        if industry_means is None:
+            industry_means = self.industry_means(arrays)
+
+        means = industry_means[arrays.industry]
+        denominator = (prior + arrays.weight)[:, None]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scores = (prior * means + arrays.sums) / denominator
+        return np.where(denominator > 0, scores, 0.0)
+
+    def score(
+        self, arrays: ScoreArrays, industry_means: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """(n,) trust scores on the 0-5 scale"""
+        overall = self.dimension_scores(arrays, industry_means).mean(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            verified_share = np.where(
+                arrays.weight > 0, arrays.verified_weight / arrays.weight, 0.0
+            )
+        trust = overall + self.config.verification_bonus * verified_share
+        return np.clip(trust, 0.0, 5.0)
+
+
+# name -> (engine class, config)
+ENGINES = {
+    # Legacy behaviour: plain mean plus a flat verification bonus
+    "mean": (
+        ScoringEngine,
+        ScoringConfig(
+            half_life_days=None,
+            verified_weight=1.0,
+            prior_strength=0.0,
+            verification_bonus=0.5,
+        ),
+    ),
+    # Exponential time decay, verified weighting and industry shrinkage
+    "decayed": (
+        ScoringEngine,
+        ScoringConfig(
+            half_life_days=float(os.getenv("SCORING_HALF_LIFE_DAYS", "365")),
+            verified_weight=float(os.getenv("SCORING_VERIFIED_WEIGHT", "2.0")),
+            prior_strength=float(os.getenv("SCORING_PRIOR_STRENGTH", "5.0")),
+            verification_bonus=float(os.getenv("SCORING_VERIFICATION_BONUS", "0.5")),
+        ),
+    ),
+}
+
+_engine: Optional[ScoringEngine] = None
+
+
+def register_engine(name: str, engine_class, config: ScoringConfig):
+    """Make an engine selectable through SCORING_ENGINE"""
+    ENGINES[name] = (engine_class, config)
+
+
+def get_engine() -> ScoringEngine:
+    """Engine selected by SCORING_ENGINE (default: decayed)"""
+    global _engine
+    if _engine is None:
+        name = os.getenv("SCORING_ENGINE", "decayed")
+        engine_class, config = ENGINES[name]
+        _engine = engine_class(name, config)
+    return _engine
+
+
+# ==================== RUNNING SUMS ====================
+
+
+def _seconds_between(later: datetime, earlier: Optional[datetime]) -> float:
+    if earlier is None:
+        return 0.0
+    return (later.replace(tzinfo=None) - earlier.replace(tzinfo=None)).total_seconds()
+
+
+def apply_review(
+    db: Session, review: models.Review, now: Optional[datetime] = None
+) -> bool:
+    """
+    Add one review to its company's running sums (caller commits)
+
+    The state row is locked (SELECT ... FOR UPDATE) so concurrent workers
+    don't lose updates. Returns False when the company has no state yet or
+    its sums were built with a different config; rebuild_state() it instead.
+    """
+    engine = get_engine()
+    now = now or datetime.utcnow()
+
+    state = (
+        db.query(models.CompanyScoreState)
+        .filter(models.CompanyScoreState.company_id == review.company_id)
+        .with_for_update()
+        .first()
+    )
+    if state is None or state.config_key != engine.config.key:
+        return False
+
+    factor = float(engine.decay(_seconds_between(now, state.reference_at)))
+    weight = engine.review_weight(bool(review.verified_employee))
+
+    state.weight_sum = state.weight_sum * factor + weight
+    if review.verified_employee:
+        state.verified_weight_sum = state.verified_weight_sum * factor + weight
+    else:
+        state.verified_weight_sum = state.verified_weight_sum * factor
+    for sum_field, rating_field in zip(SUM_FIELDS, RATING_FIELDS):
+        setattr(
+            state,
+            sum_field,
+            getattr(state, sum_field) * factor + weight * getattr(review, rating_field),
+        )
+    state.reference_at = now
+    return True
+
+
+def rebuild_state(
+    db: Session,
+    company_ids: Optional[Iterable[int]] = None,
+    now: Optional[datetime] = None,
+    chunk_size: int = 50000,
+) -> int:
+    """
+    Recompute running sums from the reviews table in one vectorized pass
+
+    Reviews are streamed in chunks; each chunk's decayed weights are
+    accumulated per company with np.bincount. Returns the number of
+    companies written.
+    """
+    engine = get_engine()
+    now = now or datetime.utcnow()
+    company_ids = list(company_ids) if company_ids is not None else None
+
+    query = db.query(
+        models.Review.company_id,
+        models.Review.created_at,
+        models.Review.verified_employee,
+        *(getattr(models.Review, field) for field in RATING_FIELDS),
+    ).filter(models.Review.duplicate_of_id.is_(None))
+    if company_ids is not None:
+        query = query.filter(models.Review.company_id.in_(company_ids))
+
+    totals: Dict[str, np.ndarray] = {}
+    size = 0
+
+    def accumulate(rows: List[tuple]):
+        nonlocal size
+        ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        ages = np.fromiter(
+            (_seconds_between(now, row[1] or now) for row in rows),
+            dtype=np.float64,
+            count=len(rows),
+        )
+        verified = np.fromiter(
+            (bool(row[2]) for row in rows), dtype=bool, count=len(rows)
+        )
+        ratings = np.array([row[3:] for row in rows], dtype=np.float64)
+
+        weights = np.where(verified, engine.config.verified_weight, 1.0)
+        weights = weights * engine.decay(ages)
+
+        new_size = max(size, int(ids.max()) + 1)
+        columns = {
+            "weight_sum": weights,
+            "verified_weight_sum": np.where(verified, weights, 0.0),
+        }
+        for d, sum_field in enumerate(SUM_FIELDS):
+            columns[sum_field] = weights * ratings[:, d]
+        for name, values in columns.items():
+            counted = np.bincount(ids, weights=values, minlength=new_size)
+            previous = totals.get(name)
+            if previous is not None:
+                counted[: len(previous)] += previous
+            totals[name] = counted
+        size = new_size
+
+    chunk = []
+    for row in query.yield_per(chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            accumulate(chunk)
+            chunk = []
+    if chunk:
+        accumulate(chunk)
+
+    # Replace the state rows in bulk
+    state_query = db.query(models.CompanyScoreState)
+    if company_ids is not None:
+        state_query = state_query.filter(
+            models.CompanyScoreState.company_id.in_(company_ids)
+        )
+    state_query.delete(synchronize_session=False)
+
+    rows = []
+    if size:
+        for company_id in np.nonzero(totals["weight_sum"])[0]:
+            rows.append(
+                {
+                    "company_id": int(company_id),
+                    "config_key": engine.config.key,
+                    "reference_at": now,
+                    **{
+                        name: float(values[company_id])
+                        for name, values in totals.items()
+                    },
+                }
+            )
+    if rows:
+        db.execute(insert(models.CompanyScoreState), rows)
+    return len(rows)
+
+
+def load_arrays(
+    db: Session, now: Optional[datetime] = None, industry: Optional[str] = None
+):
+    """
+    Load running sums decayed to now, with industry codes
+
+    Returns (company_ids, ScoreArrays); with industry, only that industry's
+    companies are loaded (enough for its mean and their scores).
+    """
+    engine = get_engine()
+    now = now or datetime.utcnow()
+
+    query = db.query(
+        models.CompanyScoreState.company_id,
+        models.Company.industry,
+        models.CompanyScoreState.reference_at,
+        models.CompanyScoreState.weight_sum,
+        models.CompanyScoreState.verified_weight_sum,
+        *(getattr(models.CompanyScoreState, field) for field in SUM_FIELDS),
+    ).join(models.Company, models.Company.id == models.CompanyScoreState.company_id)
+    if industry is not None:
+        query = query.filter(models.Company.industry == industry)
+    rows = query.all()
+
+    industry_codes: Dict[str, int] = {}
+    company_ids = np.array([row[0] for row in rows], dtype=np.int64)
+    industries = np.array(
+        [industry_codes.setdefault(row[1], len(industry_codes)) for row in rows],
+        dtype=np.int64,
+    )
+    factors = engine.decay(
+        np.array([_seconds_between(now, row[2]) for row in rows], dtype=np.float64)
+    )
+    values = np.array([row[3:] for row in rows], dtype=np.float64).reshape(-1, 6)
+
+    arrays = ScoreArrays(
+        weight=values[:, 0] * factors,
+        verified_weight=values[:, 1] * factors,
+        sums=values[:, 2:] * factors[:, None],
+        industry=industries,
+    )
+    return company_ids, arrays
+
+
+def industry_means(db: Session, industry: str) -> np.ndarray:
+    """
+    (1, 4) current weighted mean rating of an industry
+
+    Industry means move slowly, so they are cached for
+    SCORING_INDUSTRY_CACHE_TTL seconds instead of being recomputed on
+    every review.
+    """
+    means = _industry_means_cache.get(industry)
+    if means is None:
+        _, arrays = load_arrays(db, industry=industry)
+        means = get_engine().industry_means(arrays)
+        if not len(means):
+            means = np.full((1, 4), NEUTRAL_RATING)
+        _industry_means_cache.set(industry, means)
+    return means
+
+
+def company_trust_score(db: Session, company: models.Company) -> Optional[float]:
+    """Trust score of one company, shrunk toward its industry's mean"""
+    engine = get_engine()
+    state = db.get(models.CompanyScoreState, company.id)
+    if state is None or state.config_key != engine.config.key:
+        return None
+
+    factor = float(
+        engine.decay(_seconds_between(datetime.utcnow(), state.reference_at))
+    )
+    arrays = ScoreArrays(
+        weight=np.array([state.weight_sum * factor]),
+        verified_weight=np.array([state.verified_weight_sum * factor]),
+        sums=np.array([[getattr(state, field) * factor for field in SUM_FIELDS]]),
+        industry=np.zeros(1, dtype=np.int64),
+    )
+    return round(
+        float(engine.score(arrays, industry_means(db, company.industry))[0]), 2
+    )
+
+
+def compute_trust_scores(db: Session, rebuild: bool = False) -> Dict[int, float]:
+    """
+    Trust score of every company with reviews, in one vectorized pass
+
+    With rebuild (or when stored sums came from another config), the
+    running sums are first rebuilt from the reviews table.
+    """
+    engine = get_engine()
+    stale = (
+        db.query(models.CompanyScoreState.company_id)
+        .filter(models.CompanyScoreState.config_key != engine.config.key)
+        .first()
+    )
+    if rebuild or stale is not None:
+        rebuild_state(db)
+
+    company_ids, arrays = load_arrays(db)
+    _industry_means_cache.clear()
+    if not len(company_ids):
+        return {}
+    scores = engine.score(arrays)
+    return {
+        int(company_id): round(float(score), 2)
+        for company_id, score in zip(company_ids, scores)
+    }
+
+
+def rescore_all(db: Session, rebuild: bool = False) -> int:
+    """
+    Recompute every company's trust score (see compute_trust_scores)
+
+    Scores are written back with one executemany UPDATE; the caller commits.
+    """
+    scores = compute_trust_scores(db, rebuild=rebuild)
+    if scores:
+        db.execute(
+            update(models.Company),
+            [
+                {"id": company_id, "trust_score": score}
+                for company_id, score in scores.items()
+            ],
+        )
+    return len(scores)
+
+
+def main():
+    """Rebuild running sums and rescore every company"""
+    import crud
+    import invalidation_bus
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        scored = rescore_all(db, rebuild=True)
+        crud.refresh_company_summaries(db)
+        db.commit()
+        crud.invalidate_company()
+        invalidation_bus.flush()
+        print(f"✅ Rescored {scored} companies with the '{get_engine().name}' engine")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
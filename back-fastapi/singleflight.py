@@ -0,0 +1,154 @@
+"""
+Request coalescing for Korus Worker Platform
+Concurrent identical reads within a worker share one in-flight DB query
+
+When many requests ask for the same company page at once, the first caller
+(the leader) runs the query and every caller arriving while it is in
+flight waits for and reuses its result instead of querying again. Nothing
+is kept once the call returns; caching stays the job of cache.py.
+
+Only sessions marked as shared reads by main.get_read_db are
+coalesced, so objects from another request's session never reach a write
+path. Shared results must be treated as read-only.
+"""
+
+import functools
+import inspect
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from database import SHARED_READS
+
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+# A follower gives up waiting and runs the query itself after this long
+SINGLE_FLIGHT_WAIT_SECONDS = float(os.getenv("SINGLE_FLIGHT_WAIT_SECONDS", "10"))
+
+
+class _Call:
+    """One in-flight call and its outcome"""
+
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Thread-safe registry of in-flight calls by key, with counters
+
+    - calls: every call made through the group
+    - executions: calls that ran the function (leaders and timed-out followers)
+    - coalesced: calls answered with another caller's result
+    - errors: executions that raised (shared with their followers)
+    - timeouts: followers that stopped waiting and ran the function
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(
+            ("calls", "executions", "coalesced", "errors", "timeouts"), 0
+        )
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counts[name] += 1
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for the identical call already in flight"""
+        with self._lock:
+            self._counts["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+
+        if not leader:
+            if call.done.wait(SINGLE_FLIGHT_WAIT_SECONDS):
+                self._count("coalesced")
+                if call.error is not None:
+                    raise call.error
+                return call.result
+            self._count("timeouts")
+            self._count("executions")
+            return fn()
+
+        self._count("executions")
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            self._count("errors")
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict:
+        """Counters plus the number of calls currently in flight"""
+        with self._lock:
+            return {**self._counts, "in_flight": len(self._calls)}
+
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def group(name: str) -> SingleFlight:
+    """The process-wide group called name"""
+    with _groups_lock:
+        if name not in _groups:
+            _groups[name] = SingleFlight(name)
+        return _groups[name]
+
+
+def stats() -> Dict[str, dict]:
+    """Counters of every group, by name"""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {flight.name: flight.stats() for flight in groups}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of an argument value (dicts, lists and sets flattened)"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(item) for item in value))
+    return value
+
+
+def coalesce(fn: Callable) -> Callable:
+    """
+    Decorator for crud read functions taking the session first
+
+    Calls are keyed by their bound arguments (defaults applied, session
+    excluded, **kwargs sorted by name), so get_company(db, 1) and
+    get_company(db, company_id=1) share a flight. Sessions not marked as
+    shared reads call through.
+    """
+    signature = inspect.signature(fn)
+    flight = group(fn.__name__)
+
+    @functools.wraps(fn)
+    def wrapper(db, *args, **kwargs):
+        if not SINGLE_FLIGHT_ENABLED or not db.info.get(SHARED_READS):
+            return fn(db, *args, **kwargs)
+        bound = signature.bind(db, *args, **kwargs)
+        bound.apply_defaults()
+        key = _freeze(tuple(bound.arguments.items())[1:])
+        return flight.do(key, lambda: fn(db, *args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,298 @@
+"""
+Support organization directory for Korus Worker Platform
+In-process snapshot of active organizations with inverted indexes
+
+services and languages are JSON columns that SQL can't filter efficiently,
+so each worker keeps the (small) active directory in memory with prebuilt
+indexes on type, service words and languages. Filtering is a set
+intersection and facet counts come from the matching organizations.
+
+The snapshot is rebuilt after SUPPORT_DIRECTORY_TAG is invalidated (by
+crud on writes in any worker, see invalidation_bus) or when a cheap
+signature query (count, max id, max timestamps) shows that the table
+changed some other way. Organization lists are kept
+in a TieredCache by signature, so with a shared cache tier only the first
+worker to see a new signature loads it from the database.
+"""
+
+import heapq
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import invalidation_bus
+import models
+import schemas
+from cache import TieredCache
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+# How often a worker checks whether other processes changed the table
+SUPPORT_DIRECTORY_CHECK_SECONDS = float(
+    os.getenv("SUPPORT_DIRECTORY_CHECK_SECONDS", "30")
+)
+
+EARTH_RADIUS_KM = 6371.0
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Language names and ISO 639-1 codes treated as the same language
+LANGUAGE_ALIASES = {
+    "ar": "arabic",
+    "bn": "bengali",
+    "de": "german",
+    "en": "english",
+    "es": "spanish",
+    "fa": "persian",
+    "fr": "french",
+    "hi": "hindi",
+    "it": "italian",
+    "pl": "polish",
+    "pt": "portuguese",
+    "ro": "romanian",
+    "ru": "russian",
+    "tr": "turkish",
+    "uk": "ukrainian",
+    "ur": "urdu",
+    "zh": "chinese",
+}
+_LANGUAGE_CODES = {name: code for code, name in LANGUAGE_ALIASES.items()}
+
+
+def normalize(text: str) -> str:
+    """Case- and accent-insensitive form of a value ("Révision" -> "revision")"""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokens(text: str) -> Set[str]:
+    """Normalised words of a value"""
+    return set(_TOKEN_RE.findall(normalize(text)))
+
+
+def language_keys(language: str) -> Set[str]:
+    """Index keys of a language: its normalised name/code plus its alias"""
+    key = normalize(language).strip()
+    aliases = {key}
+    if key in LANGUAGE_ALIASES:
+        aliases.add(LANGUAGE_ALIASES[key])
+    if key in _LANGUAGE_CODES:
+        aliases.add(_LANGUAGE_CODES[key])
+    return aliases
+
+
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle (haversine) distance in kilometres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lng2 - lng1)
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class DirectoryPage(NamedTuple):
+    """One page of a directory search"""
+
+    items: List[schemas.SupportOrgResponse]
+    total: int
+    facets: Dict[str, Dict[str, int]]
+
+
+class SupportDirectory:
+    """Immutable snapshot of the active support organizations"""
+
+    def __init__(
+        self, organizations: List[schemas.SupportOrgResponse], signature: Tuple
+    ):
+        self.organizations = organizations
+        self.signature = signature
+        self.by_type: Dict[str, Set[int]] = defaultdict(set)
+        self.by_service_token: Dict[str, Set[int]] = defaultdict(set)
+        self.by_language: Dict[str, Set[int]] = defaultdict(set)
+
+        for position, org in enumerate(organizations):
+            self.by_type[normalize(org.type).strip()].add(position)
+            for service in org.services:
+                for token in tokens(service):
+                    self.by_service_token[token].add(position)
+            for language in org.languages or ():
+                for key in language_keys(language):
+                    self.by_language[key].add(position)
+
+    def __len__(self) -> int:
+        return len(self.organizations)
+
+    def _match(
+        self,
+        type: Optional[str] = None,
+        service: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[int]:
+        candidates: List[Set[int]] = []
+        if type:
+            candidates.append(self.by_type.get(normalize(type).strip(), set()))
+        if service:
+            # Every word of the query must appear in the organization's services
+            candidates.extend(
+                self.by_service_token.get(token, set()) for token in tokens(service)
+            )
+        if language:
+            candidates.append(
+                set().union(
+                    *(
+                        self.by_language.get(key, set())
+                        for key in language_keys(language)
+                    )
+                )
+            )
+
+        if not candidates:
+            return list(range(len(self.organizations)))
+        candidates.sort(key=len)
+        return sorted(candidates[0].intersection(*candidates[1:]))
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int = 5,
+        type: Optional[str] = None,
+        service: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[Tuple[schemas.SupportOrgResponse, float]]:
+        """Closest matching organizations as (organization, distance km)"""
+        distances = []
+        for position in self._match(type=type, service=service, language=language):
+            org = self.organizations[position]
+            distances.append(
+                (
+                    distance_km(latitude, longitude, org.latitude, org.longitude),
+                    position,
+                )
+            )
+        return [
+            (self.organizations[position], km)
+            for km, position in heapq.nsmallest(limit, distances)
+        ]
+
+    def facets(self, positions: Iterable[int]) -> Dict[str, Dict[str, int]]:
+        """Counts of each type, service and language among positions"""
+        type_counts, service_counts, language_counts = Counter(), Counter(), Counter()
+        for position in positions:
+            org = self.organizations[position]
+            type_counts[org.type] += 1
+            service_counts.update(set(org.services))
+            language_counts.update(set(org.languages or ()))
+        return {
+            "type": dict(type_counts.most_common()),
+            "services": dict(service_counts.most_common()),
+            "languages": dict(language_counts.most_common()),
+        }
+
+    def search(
+        self,
+        type: Optional[str] = None,
+        service: Optional[str] = None,
+        language: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> DirectoryPage:
+        """Filter by type, service words and language, with facet counts"""
+        positions = self._match(type=type, service=service, language=language)
+        return DirectoryPage(
+            items=[
+                self.organizations[position]
+                for position in positions[skip : skip + limit]
+            ],
+            total=len(positions),
+            facets=self.facets(positions),
+        )
+
+
+# ==================== PER-PROCESS SNAPSHOT ====================
+
+_snapshot: Optional[SupportDirectory] = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+# Invalidated by crud on support organization writes
+SUPPORT_DIRECTORY_TAG = "support_organizations"
+
+# signature -> active organizations; a new signature is a new key
+_organizations_cache = TieredCache("support_directory", ttl_seconds=3600, maxsize=4)
+
+
+def _signature(db: Session) -> Tuple:
+    """Changes whenever an organization is added, updated or deleted"""
+    org = models.SupportOrganization
+    return tuple(
+        db.query(
+            func.count(org.id),
+            func.max(org.id),
+            func.max(org.created_at),
+            func.max(org.updated_at),
+        ).one()
+    )
+
+
+def _load_organizations(db: Session) -> List[schemas.SupportOrgResponse]:
+    organizations = (
+        db.query(models.SupportOrganization)
+        .filter(models.SupportOrganization.is_active == True)
+        .order_by(models.SupportOrganization.id.asc())
+        .all()
+    )
+    return [schemas.SupportOrgResponse.model_validate(org) for org in organizations]
+
+
+def _build(db: Session, signature: Tuple) -> SupportDirectory:
+    organizations = _organizations_cache.get_or_load(
+        "|".join(map(str, signature)), lambda: _load_organizations(db)
+    )
+    return SupportDirectory(organizations, signature)
+
+
+def get_directory(db: Session) -> SupportDirectory:
+    """
+    Current snapshot, rebuilt when invalidated or changed elsewhere
+
+    Between checks (SUPPORT_DIRECTORY_CHECK_SECONDS) no query is run.
+    """
+    global _snapshot, _checked_at
+    snapshot = _snapshot
+    if (
+        snapshot is not None
+        and time.monotonic() - _checked_at < SUPPORT_DIRECTORY_CHECK_SECONDS
+    ):
+        return snapshot
+
+    with _lock:
+        if (
+            _snapshot is not None
+            and time.monotonic() - _checked_at < SUPPORT_DIRECTORY_CHECK_SECONDS
+        ):
+            return _snapshot
+        signature = _signature(db)
+        if _snapshot is None or _snapshot.signature != signature:
+            _snapshot = _build(db, signature)
+        _checked_at = time.monotonic()
+        return _snapshot
+
+
+def invalidate():
+    """Drop this worker's snapshot; the next access rebuilds it"""
+    global _snapshot, _checked_at
+    with _lock:
+        _snapshot = None
+        _checked_at = 0.0
+
+
+invalidation_bus.subscribe(invalidate, SUPPORT_DIRECTORY_TAG)
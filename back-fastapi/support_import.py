@@ -0,0 +1,250 @@
+"""
+Support organization bulk import for Korus Worker Platform
+Loads thousands of organizations from CSV or NDJSON in validated chunks
+
+Every row is validated on its own (errors are reported per row instead of
+aborting the file), rows without latitude/longitude are geocoded from the
+bundled gazetteer, and organizations already present (same name and
+address) are skipped, so re-running an import is safe. Valid rows are
+inserted IMPORT_CHUNK_SIZE at a time with one executemany INSERT and a
+commit per chunk; the worker's directory snapshot is rebuilt at the end.
+
+CSV files use the SupportOrgCreate field names as headers plus optional
+city/postcode; list columns (services, languages) are separated by ";".
+
+Usage:
+    python support_import.py organizations.csv
+    python support_import.py organizations.ndjson --dry-run
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+
+import crud
+import gazetteer
+import invalidation_bus
+import models
+import schemas
+import support_directory
+from database import SessionLocal
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+IMPORT_CHUNK_SIZE = int(os.getenv("SUPPORT_IMPORT_CHUNK_SIZE", "500"))
+# Rejected rows listed in the report (all of them are counted)
+IMPORT_MAX_ERRORS = int(os.getenv("SUPPORT_IMPORT_MAX_ERRORS", "100"))
+
+IMPORT_FORMATS = ("csv", "ndjson")
+LIST_FIELDS = ("services", "languages")
+
+
+def detect_format(filename: Optional[str]) -> str:
+    """ndjson for .ndjson/.jsonl files, csv otherwise"""
+    extension = os.path.splitext(filename or "")[1].lower()
+    return "ndjson" if extension in (".ndjson", ".jsonl") else "csv"
+
+
+def read_csv(stream: IO[str]) -> Iterator[Tuple[int, dict]]:
+    """(line number, row) pairs; empty cells dropped, lists split on ';'"""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        record = {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key and value is not None and value.strip()
+        }
+        for field in LIST_FIELDS:
+            if field in record:
+                record[field] = [
+                    item.strip() for item in record[field].split(";") if item.strip()
+                ]
+        yield reader.line_num, record
+
+
+def read_ndjson(stream: IO[str]) -> Iterator[Tuple[int, object]]:
+    """(line number, object) pairs; blank lines skipped"""
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, e
+
+
+def read_rows(stream: IO[str], format: str) -> Iterator[Tuple[int, object]]:
+    if format not in IMPORT_FORMATS:
+        raise ValueError(f"Unsupported import format {format!r}")
+    return read_csv(stream) if format == "csv" else read_ndjson(stream)
+
+
+def _dedup_key(name: str, address: str) -> Tuple[str, str]:
+    return (
+        support_directory.normalize(name).strip(),
+        support_directory.normalize(address).strip(),
+    )
+
+
+def _validation_messages(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    ]
+
+
+def prepare_row(record: object) -> Tuple[Optional[dict], bool, List[str]]:
+    """
+    Validate and geocode one record
+
+    Returns (insert values or None, geocoded, error messages).
+    """
+    if isinstance(record, Exception):
+        return None, False, [f"invalid JSON: {record}"]
+    if not isinstance(record, dict):
+        return None, False, ["row: expected an object"]
+    try:
+        row = schemas.SupportOrgImportRow.model_validate(record)
+    except ValidationError as e:
+        return None, False, _validation_messages(e)
+
+    geocoded = False
+    if row.latitude is None or row.longitude is None:
+        place = gazetteer.geocode(
+            address=row.address, city=row.city, postcode=row.postcode
+        )
+        if place is None:
+            return (
+                None,
+                False,
+                ["latitude/longitude: missing and address not found in gazetteer"],
+            )
+        row.latitude, row.longitude = place.latitude, place.longitude
+        geocoded = True
+
+    return row.model_dump(exclude={"city", "postcode"}), geocoded, []
+
+
+def import_organizations(
+    db: Session,
+    records: Iterable[Tuple[int, object]],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    dry_run: bool = False,
+) -> schemas.SupportOrgImportReport:
+    """Validate, geocode and insert (line number, record) pairs in chunks"""
+    existing = {
+        _dedup_key(name, address)
+        for name, address in db.query(
+            models.SupportOrganization.name, models.SupportOrganization.address
+        )
+    }
+    received = created = geocoded = skipped = failed = 0
+    errors: List[schemas.SupportOrgImportError] = []
+    chunk: List[dict] = []
+
+    def flush():
+        nonlocal created, chunk
+        if chunk and not dry_run:
+            created += crud.bulk_insert_support_organizations(db, chunk)
+            db.commit()
+        chunk = []
+
+    for line_number, record in records:
+        received += 1
+        values, was_geocoded, messages = prepare_row(record)
+        if messages:
+            failed += 1
+            if len(errors) < IMPORT_MAX_ERRORS:
+                errors.append(
+                    schemas.SupportOrgImportError(row=line_number, errors=messages)
+                )
+            continue
+
+        key = _dedup_key(values["name"], values["address"])
+        if key in existing:
+            skipped += 1
+            continue
+        existing.add(key)
+
+        geocoded += was_geocoded
+        chunk.append(values)
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+
+    if created:
+        # Refresh this worker's directory indexes now rather than on next read
+        crud.invalidate_support_organizations()
+        invalidation_bus.flush()
+        support_directory.get_directory(db)
+
+    return schemas.SupportOrgImportReport(
+        received=received,
+        created=created,
+        geocoded=geocoded,
+        skipped=skipped,
+        failed=failed,
+        dry_run=dry_run,
+        errors=errors,
+    )
+
+
+def main():
+    """Main import function"""
+    parser = argparse.ArgumentParser(
+        description="Import support organizations from CSV or NDJSON"
+    )
+    parser.add_argument("path", help="CSV or NDJSON file")
+    parser.add_argument(
+        "--format", choices=IMPORT_FORMATS, help="Default: from the file extension"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Validate and geocode without writing"
+    )
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📥 Korus Collective Voice- Support Organization Import")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        with open(args.path, newline="", encoding="utf-8-sig") as f:
+            report = import_organizations(
+                db,
+                read_rows(f, args.format or detect_format(args.path)),
+                chunk_size=args.chunk_size,
+                dry_run=args.dry_run,
+            )
+        elapsed = time.perf_counter() - started
+
+        print(f"ℹ️  Read {report.received} rows in {elapsed:.2f}s")
+        print(f"   - created: {report.created}")
+        print(f"   - geocoded from gazetteer: {report.geocoded}")
+        print(f"   - skipped (already present): {report.skipped}")
+        print(f"   - rejected: {report.failed}")
+        for error in report.errors[:20]:
+            print(f"   ❌ line {error.row}: {'; '.join(error.errors)}")
+        if report.failed > 20:
+            print(f"   ... and {report.failed - 20} more")
+
+        if args.dry_run:
+            print("\nℹ️  Dry run: nothing written")
+        else:
+            print(f"\n✅ Imported {report.created} support organizations")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Import failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
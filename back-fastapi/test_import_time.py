@@ -0,0 +1,179 @@
+"""
+Startup Time Testing Script for Korus Worker Platform
+Measures `import main` with python -X importtime and fails when it goes over
+budget or pulls in modules that are meant to load lazily
+
+Usage:
+    python test_import_time.py
+    IMPORT_TIME_BUDGET_MS=1500 python test_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+# Cumulative `import main` budget (best of IMPORT_TIME_RUNS runs)
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "2500"))
+CREATE_APP_BUDGET_MS = float(os.getenv("CREATE_APP_BUDGET_MS", "500"))
+IMPORT_TIME_RUNS = int(os.getenv("IMPORT_TIME_RUNS", "3"))
+
+# Modules that must only load on first use (engine, hashing, JWT, numpy)
+LAZY_MODULES = [
+    "numpy",
+    "pymysql",
+    "passlib.context",
+    "jose.jwt",
+    "classifier",
+    "company_search",
+    "dedup",
+    "pypdf",
+    "scoring",
+]
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_python(code: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter from the backend directory"""
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    return subprocess.run(
+        command + ["-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(stderr: str) -> dict:
+    """{module: (self_us, cumulative_us)} from -X importtime output"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header line
+        timings[module.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+class ImportTimeTester:
+    def __init__(self):
+        self.test_results = []
+
+    def log_test(self, test_name: str, success: bool, message: str = ""):
+        """Log test result"""
+        status = "✅ PASS" if success else "❌ FAIL"
+        self.test_results.append(
+            {"test": test_name, "success": success, "message": message}
+        )
+        print(f"{status} - {test_name}")
+        if message:
+            print(f"   {message}")
+
+    def test_import_budget(self):
+        """`import main` stays within IMPORT_TIME_BUDGET_MS"""
+        try:
+            best = None
+            for _ in range(IMPORT_TIME_RUNS):
+                timings = parse_importtime(
+                    run_python("import main", importtime=True).stderr
+                )
+                if best is None or timings["main"][1] < best["main"][1]:
+                    best = timings
+
+            total_ms = best["main"][1] / 1000
+            slowest = sorted(best.items(), key=lambda item: -item[1][0])[:5]
+            self.log_test(
+                "Import main within budget",
+                total_ms <= IMPORT_TIME_BUDGET_MS,
+                f"{total_ms:.0f} ms (budget {IMPORT_TIME_BUDGET_MS:.0f} ms); "
+                "slowest self times: "
+                + ", ".join(f"{name} {us / 1000:.0f} ms" for name, (us, _) in slowest),
+            )
+        except Exception as e:
+            self.log_test("Import main within budget", False, str(e))
+
+    def test_lazy_modules(self):
+        """Heavy modules are not imported by `import main`"""
+        try:
+            output = run_python(
+                "import sys, main; "
+                f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+            ).stdout.strip()
+            loaded = [name for name in output.split(",") if name]
+            self.log_test(
+                "Heavy modules load lazily",
+                not loaded,
+                f"imported eagerly: {', '.join(loaded)}" if loaded else "",
+            )
+        except Exception as e:
+            self.log_test("Heavy modules load lazily", False, str(e))
+
+    def test_create_app(self):
+        """Building the app after import stays within CREATE_APP_BUDGET_MS"""
+        try:
+            output = run_python(
+                "import time, main; started = time.perf_counter(); "
+                "main.create_app(); print(time.perf_counter() - started)"
+            ).stdout.strip()
+            elapsed_ms = float(output) * 1000
+            self.log_test(
+                "create_app within budget",
+                elapsed_ms <= CREATE_APP_BUDGET_MS,
+                f"{elapsed_ms:.0f} ms (budget {CREATE_APP_BUDGET_MS:.0f} ms)",
+            )
+        except Exception as e:
+            self.log_test("create_app within budget", False, str(e))
+
+    def run_all_tests(self):
+        """Run all tests"""
+        print("=" * 60)
+        print("🧪 Korus Collective Voice- Startup Time Testing")
+        print("=" * 60)
+
+        print("Running tests...\n")
+        started = time.perf_counter()
+        self.test_lazy_modules()
+        print()
+        self.test_import_budget()
+        print()
+        self.test_create_app()
+        print()
+
+        # Summary
+        print("=" * 60)
+        print("📊 Test Summary")
+        print("=" * 60)
+
+        passed = sum(1 for result in self.test_results if result["success"])
+        total = len(self.test_results)
+
+        print(f"\nTotal Tests: {total}")
+        print(f"Passed: {passed}")
+        print(f"Failed: {total - passed}")
+        print(f"Took: {time.perf_counter() - started:.1f}s")
+
+        if passed == total:
+            print("✅ Startup is within budget!")
+        else:
+            print("❌ Startup regressed. Keep heavy imports inside the functions")
+            print("   that need them and build expensive objects on first use.")
+
+        print("\n" + "=" * 60)
+        return passed == total
+
+
+def main():
+    """Main test function"""
+    tester = ImportTimeTester()
+    if not tester.run_all_tests():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Query Plan Testing Script for Korus Worker Platform
+Runs EXPLAIN against MySQL for the filtered company listing and checks
+that every filter/sort combination is served by a covering index on
+company_summaries (no table rows read to pick a page)
+"""
+
+import sys
+
+import crud
+from database import SessionLocal
+from sqlalchemy import text
+from sqlalchemy.dialects import mysql
+
+# Filter/sort combinations exposed by GET /api/companies
+COMPANY_LISTING_CASES = [
+    ("Filter by industry", {"industry": "Construction"}),
+    ("Filter by country", {"country": "France"}),
+    (
+        "Filter by country and industry",
+        {"country": "France", "industry": "Construction"},
+    ),
+    ("Filter by verified", {"verified": True}),
+    ("Filter by minimum rating", {"min_rating": 3.5}),
+    (
+        "Filter by industry and minimum rating",
+        {"industry": "Construction", "min_rating": 3.5},
+    ),
+    (
+        "Filter by bounding box",
+        {"min_lat": 43.0, "max_lat": 49.0, "min_lng": 2.0, "max_lng": 5.0},
+    ),
+    ("Sort by rating", {"sort": "rating"}),
+    ("Sort by trust score", {"sort": "trust"}),
+    ("Sort by review count", {"sort": "reviews"}),
+    ("Sort by name", {"sort": "name"}),
+    ("Sort by newest", {"sort": "newest"}),
+    ("Sort by live jobs", {"sort": "jobs"}),
+    ("Sort by recent reviews", {"sort": "recent"}),
+    ("Sort by last review", {"sort": "last_review"}),
+    ("Filter by country, sort by rating", {"country": "France", "sort": "rating"}),
+]
+
+
+class QueryPlanTester:
+    def __init__(self):
+        self.db = SessionLocal()
+        self.test_results = []
+
+    def log_test(self, test_name: str, success: bool, message: str = ""):
+        """Log test result"""
+        status = "✅ PASS" if success else "❌ FAIL"
+        self.test_results.append(
+            {"test": test_name, "success": success, "message": message}
+        )
+        print(f"{status} - {test_name}")
+        if message:
+            print(f"   {message}")
+
+    def explain(self, query) -> list:
+        """Run EXPLAIN for an ORM query and return the plan rows as dicts"""
+        sql = str(
+            query.statement.compile(
+                dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        result = self.db.execute(text(f"EXPLAIN {sql}"))
+        return [dict(row._mapping) for row in result]
+
+    def test_company_listing_case(self, test_name: str, filters: dict):
+        """Check that one company listing combination uses a covering index"""
+        try:
+            query = crud.build_companies_query(self.db, **filters).limit(100)
+            plan = self.explain(query)[0]
+
+            # A full scan without an index shows up as type=ALL with no key;
+            # an ORDER BY served by an index shows type=index. "Using index"
+            # means the ids come from the index alone
+            uses_index = (
+                plan["key"] is not None
+                and plan["type"] != "ALL"
+                and "Using index" in (plan["Extra"] or "")
+            )
+            self.log_test(
+                test_name,
+                uses_index,
+                f"type={plan['type']}, key={plan['key']}, "
+                f"possible_keys={plan['possible_keys']}, Extra={plan['Extra']}",
+            )
+            return uses_index
+        except Exception as e:
+            self.log_test(test_name, False, str(e))
+            return False
+
+    def run_all_tests(self):
+        """Run all tests"""
+        print("=" * 60)
+        print("🧪 Korus Collective Voice- Query Plan Testing")
+        print("=" * 60)
+
+        print("Running tests...\n")
+        for test_name, filters in COMPANY_LISTING_CASES:
+            self.test_company_listing_case(test_name, filters)
+            print()
+
+        # Summary
+        print("=" * 60)
+        print("📊 Test Summary")
+        print("=" * 60)
+
+        passed = sum(1 for result in self.test_results if result["success"])
+        total = len(self.test_results)
+
+        print(f"\nTotal Tests: {total}")
+        print(f"Passed: {passed}")
+        print(f"Failed: {total - passed}")
+
+        if passed == total:
+            print("✅ All query plans use a covering index!")
+        else:
+            print("❌ Some queries fall back to a table scan or row lookups.")
+            print("   Make sure the schema matches db-mysql/init.sql, run")
+            print("   python rebuild_company_summaries.py and")
+            print("   ANALYZE TABLE company_summaries on a seeded database.")
+
+        print("\n" + "=" * 60)
+        self.db.close()
+        return passed == total
+
+
+def main():
+    """Main test function"""
+    tester = QueryPlanTester()
+    if not tester.run_all_tests():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
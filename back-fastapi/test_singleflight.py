@@ -0,0 +1,161 @@
+"""
+Request Coalescing Testing Script for Korus Worker Platform
+Checks that @coalesce keys calls correctly, including **filters keywords,
+and that only identical concurrent calls share a query
+
+Usage:
+    python test_singleflight.py
+"""
+
+import sys
+import threading
+import time
+
+from database import SHARED_READS
+from singleflight import coalesce
+
+
+class FakeSession:
+    """Stands in for a read session; only Session.info is used"""
+
+    def __init__(self, shared: bool = True):
+        self.info = {SHARED_READS: shared}
+
+
+class SingleFlightTester:
+    def __init__(self):
+        self.test_results = []
+
+    def log_test(self, test_name: str, success: bool, message: str = ""):
+        """Log test result"""
+        status = "✅ PASS" if success else "❌ FAIL"
+        self.test_results.append(
+            {"test": test_name, "success": success, "message": message}
+        )
+        print(f"{status} - {test_name}")
+        if message:
+            print(f"   {message}")
+
+    def run_concurrently(self, calls, delay: float = 0.2) -> int:
+        """Run calls (kwargs dicts) at once; number of times the body ran"""
+        executions = []
+
+        @coalesce
+        def list_companies(db, skip: int = 0, limit: int = 100, **filters):
+            executions.append(filters)
+            time.sleep(delay)
+            return sorted(filters.items())
+
+        errors = []
+
+        def call(kwargs):
+            try:
+                result = list_companies(FakeSession(), **kwargs)
+                expected = sorted(
+                    (k, v) for k, v in kwargs.items() if k not in ("skip", "limit")
+                )
+                if result != expected:
+                    errors.append(f"{kwargs} returned {result}")
+            except Exception as e:
+                errors.append(f"{kwargs} raised {e!r}")
+
+        threads = [threading.Thread(target=call, args=(kwargs,)) for kwargs in calls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise AssertionError("; ".join(errors))
+        return len(executions)
+
+    def test_keyword_filters(self):
+        """Calls with **filters keywords are keyed without errors"""
+        try:
+            executions = self.run_concurrently(
+                [{"industry": "construction", "sort": "rating", "verified": True}],
+                delay=0,
+            )
+            self.log_test("Keyword filters are hashable", executions == 1)
+        except Exception as e:
+            self.log_test("Keyword filters are hashable", False, str(e))
+
+    def test_identical_calls_coalesce(self):
+        """Identical filters (in any keyword order) share one execution"""
+        try:
+            executions = self.run_concurrently(
+                [
+                    {"industry": "construction", "sort": "rating"},
+                    {"sort": "rating", "industry": "construction"},
+                    {"industry": "construction", "sort": "rating", "skip": 0},
+                ]
+            )
+            self.log_test(
+                "Identical filtered calls coalesce",
+                executions == 1,
+                f"{executions} executions for 3 identical calls",
+            )
+        except Exception as e:
+            self.log_test("Identical filtered calls coalesce", False, str(e))
+
+    def test_different_calls_run(self):
+        """Different filters never share a result"""
+        try:
+            executions = self.run_concurrently(
+                [
+                    {"industry": "construction"},
+                    {"industry": "cleaning"},
+                    {"industry": "construction", "country": "FR"},
+                ]
+            )
+            self.log_test(
+                "Different filtered calls run separately",
+                executions == 3,
+                f"{executions} executions for 3 different calls",
+            )
+        except Exception as e:
+            self.log_test("Different filtered calls run separately", False, str(e))
+
+    def run_all_tests(self):
+        """Run all tests"""
+        print("=" * 60)
+        print("🧪 Korus Collective Voice- Request Coalescing Testing")
+        print("=" * 60)
+
+        print("Running tests...\n")
+        self.test_keyword_filters()
+        print()
+        self.test_identical_calls_coalesce()
+        print()
+        self.test_different_calls_run()
+        print()
+
+        # Summary
+        print("=" * 60)
+        print("📊 Test Summary")
+        print("=" * 60)
+
+        passed = sum(1 for result in self.test_results if result["success"])
+        total = len(self.test_results)
+
+        print(f"\nTotal Tests: {total}")
+        print(f"Passed: {passed}")
+        print(f"Failed: {total - passed}")
+
+        if passed == total:
+            print("✅ Request coalescing works!")
+        else:
+            print("❌ Some tests failed. Check the coalescing keys in singleflight.py.")
+
+        print("\n" + "=" * 60)
+        return passed == total
+
+
+def main():
+    """Main test function"""
+    tester = SingleFlightTester()
+    if not tester.run_all_tests():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
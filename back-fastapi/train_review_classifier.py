@@ -0,0 +1,96 @@
+"""
+Training script for the review comment classifier
+Fits the sentiment/abuse model and writes data/review_classifier.npz
+
+Training data:
+- data/review_seed_labels.csv: hand-labelled comments (sentiment and abuse)
+- with --from-db: existing reviews, weakly labelled for sentiment from their
+  average star rating (>= 4 positive, <= 2 negative)
+
+Usage:
+    python train_review_classifier.py
+    python train_review_classifier.py --from-db --reclassify
+"""
+
+import argparse
+import time
+
+import classifier
+import models
+from database import SessionLocal
+
+
+def load_database_examples(limit: int):
+    """Yield (comment, sentiment, None) from reviews with a clear star rating"""
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(
+                models.Review.comment,
+                models.Review.rating_work_conditions,
+                models.Review.rating_pay,
+                models.Review.rating_treatment,
+                models.Review.rating_safety,
+            )
+            .order_by(models.Review.id.desc())
+            .limit(limit)
+            .yield_per(1000)
+        )
+        for comment, *ratings in rows:
+            label = classifier.rating_sentiment_label(sum(ratings) / len(ratings))
+            if label is not None:
+                yield comment, label, None
+    finally:
+        db.close()
+
+
+def reset_classifications():
+    """Mark every review as unclassified so the worker rescores it"""
+    db = SessionLocal()
+    try:
+        db.query(models.Review).update(
+            {models.Review.classified_at: None}, synchronize_session=False
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def main():
+    """Main training function"""
+    parser = argparse.ArgumentParser(description="Train the review classifier")
+    parser.add_argument(
+        "--from-db",
+        action="store_true",
+        help="Add star-rating sentiment labels from existing reviews",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=100000, help="Max reviews to read with --from-db"
+    )
+    parser.add_argument(
+        "--reclassify",
+        action="store_true",
+        help="Clear stored classifications so the worker rescores all reviews",
+    )
+    parser.add_argument("--out", default=classifier.MODEL_PATH, help="Model path")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧠 Korus Collective Voice- Review Classifier Training")
+    print("=" * 60)
+
+    extra = list(load_database_examples(args.limit)) if args.from_db else []
+    print(f"ℹ️  Using seed labels plus {len(extra)} database reviews")
+
+    started = time.perf_counter()
+    model = classifier.train(extra)
+    model.save(args.out)
+    print(f"✅ Trained in {time.perf_counter() - started:.2f}s, saved to {args.out}")
+
+    if args.reclassify:
+        reset_classifications()
+        print("✅ Cleared stored classifications; the worker will rescore reviews")
+
+
+if __name__ == "__main__":
+    main()
@@ -48,8 +48,10 @@ CREATE TABLE IF NOT EXISTS companies (
     
     INDEX idx_email (email),
     INDEX idx_company_name (company_name),
+
+    -- The listing is served by company_summaries and its indexes
     INDEX idx_industry (industry),
-    INDEX idx_country (country)
+    INDEX idx_updated_at (updated_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Jobs Table
@@ -74,9 +76,9 @@ CREATE TABLE IF NOT EXISTS jobs (
     expires_at TIMESTAMP NULL,
     
     FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE,
-    INDEX idx_company_id (company_id),
-    INDEX idx_is_active (is_active),
-    INDEX idx_posted_at (posted_at)
+    INDEX idx_company_posted (company_id, posted_at),
+    INDEX idx_posted_at (posted_at),
+    INDEX idx_active_expires_posted (is_active, expires_at, posted_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Reviews Table
@@ -102,16 +104,76 @@ CREATE TABLE IF NOT EXISTS reviews (
     -- Engagement
     helpful_count INT DEFAULT 0,
     
+    -- Automatic classification (filled in by classification_worker.py)
+    sentiment_score FLOAT NULL,
+    sentiment_label VARCHAR(16) NULL,
+    abuse_score FLOAT NULL,
+    is_abusive BOOLEAN DEFAULT FALSE,
+    classified_at TIMESTAMP NULL,
+    
+    -- Set by the duplicate audit (dedup.py --flag); excluded from ratings
+    duplicate_of_id INT NULL,
+    
     -- Metadata
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
     FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE,
     FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE SET NULL,
+    FOREIGN KEY (duplicate_of_id) REFERENCES reviews(id) ON DELETE SET NULL,
     INDEX idx_company_id (company_id),
     INDEX idx_job_id (job_id),
     INDEX idx_created_at (created_at),
-    INDEX idx_verified_employee (verified_employee)
+    INDEX idx_verified_employee (verified_employee),
+    INDEX idx_reviews_classified_at (classified_at),
+    INDEX idx_reviews_company_sentiment (company_id, sentiment_label)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Company Rating Rollup Tables (maintained on review insert)
+CREATE TABLE IF NOT EXISTS company_rating_daily (
+    company_id INT NOT NULL,
+    day DATE NOT NULL,
+    
+    review_count INT NOT NULL DEFAULT 0,
+    verified_count INT NOT NULL DEFAULT 0,
+    sum_work_conditions FLOAT NOT NULL DEFAULT 0.0,
+    sum_pay FLOAT NOT NULL DEFAULT 0.0,
+    sum_treatment FLOAT NOT NULL DEFAULT 0.0,
+    sum_safety FLOAT NOT NULL DEFAULT 0.0,
+    
+    PRIMARY KEY (company_id, day),
+    FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS company_rating_monthly (
+    company_id INT NOT NULL,
+    month DATE NOT NULL,
+    
+    review_count INT NOT NULL DEFAULT 0,
+    verified_count INT NOT NULL DEFAULT 0,
+    sum_work_conditions FLOAT NOT NULL DEFAULT 0.0,
+    sum_pay FLOAT NOT NULL DEFAULT 0.0,
+    sum_treatment FLOAT NOT NULL DEFAULT 0.0,
+    sum_safety FLOAT NOT NULL DEFAULT 0.0,
+    
+    PRIMARY KEY (company_id, month),
+    FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Company Score State Table (time-decayed trust score sums)
+CREATE TABLE IF NOT EXISTS company_score_state (
+    company_id INT PRIMARY KEY,
+    config_key VARCHAR(100) NOT NULL,
+    reference_at DATETIME NOT NULL,
+    
+    weight_sum DOUBLE NOT NULL DEFAULT 0.0,
+    verified_weight_sum DOUBLE NOT NULL DEFAULT 0.0,
+    sum_work_conditions DOUBLE NOT NULL DEFAULT 0.0,
+    sum_pay DOUBLE NOT NULL DEFAULT 0.0,
+    sum_treatment DOUBLE NOT NULL DEFAULT 0.0,
+    sum_safety DOUBLE NOT NULL DEFAULT 0.0,
+    
+    FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Support Organizations Table
@@ -148,6 +210,37 @@ CREATE TABLE IF NOT EXISTS support_organizations (
     INDEX idx_location (latitude, longitude)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- Description Translation Tables (non-default locales)
+CREATE TABLE IF NOT EXISTS company_translations (
+    company_id INT NOT NULL,
+    locale VARCHAR(10) NOT NULL,
+    description TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (company_id, locale),
+    FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS job_translations (
+    job_id INT NOT NULL,
+    locale VARCHAR(10) NOT NULL,
+    description TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (job_id, locale),
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS support_organization_translations (
+    organization_id INT NOT NULL,
+    locale VARCHAR(10) NOT NULL,
+    description TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (organization_id, locale),
+    FOREIGN KEY (organization_id) REFERENCES support_organizations(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- Employee Tokens Table
 CREATE TABLE IF NOT EXISTS employee_tokens (
     id INT AUTO_INCREMENT PRIMARY KEY,
@@ -173,3 +266,73 @@ CREATE TABLE IF NOT EXISTS employee_tokens (
     INDEX idx_company_id (company_id),
     INDEX idx_is_active (is_active)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Cache Invalidations Table (cross-worker invalidation bus, pruned)
+CREATE TABLE IF NOT EXISTS cache_invalidations (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    origin VARCHAR(100) NOT NULL,
+    tags TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    INDEX idx_cache_invalidations_created_at (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Change Log Table (append-only feed behind GET /api/changes)
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INT AUTO_INCREMENT PRIMARY KEY,
+    entity VARCHAR(32) NOT NULL,
+    entity_id INT NOT NULL,
+    op VARCHAR(10) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    INDEX idx_change_log_entity_seq (entity, seq)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Company Summaries Table (denormalized company listing, maintained by crud)
+CREATE TABLE IF NOT EXISTS company_summaries (
+    company_id INT PRIMARY KEY,
+    
+    -- Copied from companies
+    company_name VARCHAR(255) NOT NULL,
+    industry VARCHAR(100) NOT NULL,
+    location VARCHAR(255) NOT NULL,
+    country VARCHAR(100) NOT NULL,
+    description TEXT,
+    website VARCHAR(255),
+    overall_rating FLOAT NOT NULL DEFAULT 0.0,
+    total_reviews INT NOT NULL DEFAULT 0,
+    social_media_score FLOAT NOT NULL DEFAULT 0.0,
+    trust_score FLOAT NOT NULL DEFAULT 0.0,
+    external_platform_score FLOAT NOT NULL DEFAULT 0.0,
+    verified BOOLEAN NOT NULL DEFAULT FALSE,
+    rating_work_conditions FLOAT NOT NULL DEFAULT 0.0,
+    rating_pay FLOAT NOT NULL DEFAULT 0.0,
+    rating_treatment FLOAT NOT NULL DEFAULT 0.0,
+    rating_safety FLOAT NOT NULL DEFAULT 0.0,
+    latitude FLOAT,
+    longitude FLOAT,
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP NULL,
+    
+    -- Derived from jobs and reviews
+    active_jobs INT NOT NULL DEFAULT 0,
+    recent_reviews INT NOT NULL DEFAULT 0,
+    last_review_at TIMESTAMP NULL,
+    refreshed_at TIMESTAMP NULL,
+    
+    FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE,
+    -- Covering indexes for the listing (sort key, then company_id)
+    INDEX idx_summary_industry_rating (industry, overall_rating DESC, company_id),
+    INDEX idx_summary_country_rating (country, overall_rating DESC, company_id),
+    INDEX idx_summary_country_industry_rating (country, industry, overall_rating DESC, company_id),
+    INDEX idx_summary_verified_rating (verified, overall_rating DESC, company_id),
+    INDEX idx_summary_rating (overall_rating DESC, company_id),
+    INDEX idx_summary_trust (trust_score DESC, company_id),
+    INDEX idx_summary_reviews (total_reviews DESC, company_id),
+    INDEX idx_summary_active_jobs (active_jobs DESC, company_id),
+    INDEX idx_summary_recent_reviews (recent_reviews DESC, company_id),
+    INDEX idx_summary_last_review (last_review_at DESC, company_id),
+    INDEX idx_summary_name (company_name, company_id),
+    INDEX idx_summary_created (created_at DESC, company_id),
+    INDEX idx_summary_geo (latitude, longitude)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -292,3 +292,41 @@ export async function fetchCompanyStatistics(companyId: number) {
     throw error;
   }
 }
+
+/**
+ * Fetch a company page in one request: company, live jobs,
+ * latest reviews and statistics
+ */
+export async function fetchCompanyFull(
+  companyId: number,
+  options: { jobsLimit?: number; reviewsLimit?: number; reviewsSkip?: number } = {}
+) {
+  try {
+    const params = new URLSearchParams();
+    if (options.jobsLimit !== undefined)
+      params.set("jobs_limit", options.jobsLimit.toString());
+    if (options.reviewsLimit !== undefined)
+      params.set("reviews_limit", options.reviewsLimit.toString());
+    if (options.reviewsSkip !== undefined)
+      params.set("reviews_skip", options.reviewsSkip.toString());
+
+    const query = params.toString();
+    const response = await fetch(
+      `${API_BASE_URL}/api/companies/${companyId}/full${query ? `?${query}` : ""}`
+    );
+    if (!response.ok) {
+      throw new Error("Failed to fetch company details");
+    }
+    const data = await response.json();
+
+    return {
+      company: data.company as Company,
+      jobs: data.jobs as Job[],
+      reviews: data.reviews as Review[],
+      statistics: data.statistics,
+    };
+  } catch (error) {
+    console.error("Error fetching company details:", error);
+    throw error;
+  }
+}